@@ -2,15 +2,88 @@
 Database management system for elytPOS.
 """
 
+import collections
+import concurrent.futures
 import configparser
+import datetime
 import os
+import threading
 import crypto_utils
 
 import psycopg2
+import psycopg2.extras
 import psycopg2.pool
+import psycopg2.sql
 
 from styles import get_app_path
 
+# NOTIFY channels raised by triggers when products or schemes are written,
+# so every terminal can drop its stale caches.
+CHANGE_CHANNELS = ("products_changed", "schemes_changed")
+
+# Threads on DatabaseManager's background executor.
+DB_WORKERS = 4
+
+# Hot read queries kept as server-side prepared statements, so Postgres
+# parses and plans them once per pooled connection instead of per call.
+PREPARED_STATEMENTS = {
+    "sale_items": """
+        (integer) AS
+        SELECT p.name, si.quantity, si.price_at_sale, si.uom, si.product_id,
+               p.barcode, si.mrp
+        FROM sale_items si
+        JOIN products p ON si.product_id = p.id
+        WHERE si.sale_id = $1
+    """,
+    "product_translations": """
+        (integer[], integer) AS
+        SELECT product_id, translated_name FROM product_translations
+        WHERE product_id = ANY($1) AND language_id = $2
+    """,
+    "customer_by_mobile": """
+        (text) AS
+        SELECT id, name, mobile, address, email FROM customers WHERE mobile = $1
+    """,
+    # The aliases predicates match the trigram index expressions.
+    "product_by_barcode": """
+        (text) AS
+        SELECT id, name, barcode, mrp, price, category, base_uom, load_qty
+        FROM products
+        WHERE (barcode = $1 OR COALESCE(aliases, '') ILIKE '%' || $1 || '%')
+          AND is_deleted = FALSE
+        LIMIT 1
+    """,
+    "alias_by_barcode": """
+        (text) AS
+        SELECT p.id, p.name, a.barcode, a.mrp, a.price, p.category, a.uom,
+               a.factor, a.qty, p.price, p.mrp
+        FROM product_aliases a
+        JOIN products p ON a.product_id = p.id
+        WHERE (a.barcode = $1 OR COALESCE(a.aliases, '') ILIKE '%' || $1 || '%')
+          AND p.is_deleted = FALSE
+        LIMIT 1
+    """,
+    "product_by_name": """
+        (text) AS
+        SELECT id, name, barcode, mrp, price, category, base_uom, load_qty
+        FROM products
+        WHERE name ILIKE $1 AND is_deleted = FALSE
+        ORDER BY name
+        LIMIT 1
+    """,
+}
+
+
+class PreparingConnection(psycopg2.extensions.connection):
+    """
+    Pool connection that records which PREPARED_STATEMENTS it has prepared,
+    so the record is discarded together with the connection.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
 
 class PooledConnection:
     """
@@ -46,8 +119,28 @@ class DatabaseManager:
         if dbname:
             self.conn_params["dbname"] = dbname
         self.pool = None
+        self._suppliers_cache = None
+        self._uoms_cache = None
+        self._uom_map = None
+        self._languages_cache = None
+        self._schemes_cache = None
+        self._schemes_gen = 0
+        self._all_products_cache = None
+        self._product_index = None
+        self._completer_cache = collections.OrderedDict()
+        # Completer searches fill the cache from executor threads.
+        self._completer_lock = threading.Lock()
+        self.inventory_version = 0
+        self._translated_cache = collections.OrderedDict()
+        self._active_scheme_cache = collections.OrderedDict()
+        self._unit_cache = {}
+        self._listen_conn = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=DB_WORKERS, thread_name_prefix="elytpos-db"
+        )
         self.init_pool()
         self.init_db()
+        self.load_product_index()
 
     @staticmethod
     def list_databases(config_params):
@@ -95,7 +188,15 @@ class DatabaseManager:
 
     def init_pool(self):
         try:
-            self.pool = psycopg2.pool.ThreadedConnectionPool(1, 20, **self.conn_params)
+            # psycopg2 closes a returned connection once `minconn` are already
+            # idle, so keep one warm per executor worker plus the GUI thread;
+            # otherwise every concurrent query pays a fresh connect and auth.
+            self.pool = psycopg2.pool.ThreadedConnectionPool(
+                DB_WORKERS + 1,
+                20,
+                connection_factory=PreparingConnection,
+                **self.conn_params,
+            )
         except Exception as e:
             print(f"Error creating connection pool: {e}")
             raise e
@@ -133,10 +234,79 @@ class DatabaseManager:
     def get_connection(self):
         return PooledConnection(self.pool, self.pool.getconn())
 
+    def execute_prepared(self, conn, cur, name, params):
+        """
+        Run one of PREPARED_STATEMENTS on `cur`, preparing it first if this
+        pooled connection has not seen it yet.
+        """
+        prepared = conn.conn.prepared
+        if name not in prepared:
+            cur.execute(f"PREPARE {name} {PREPARED_STATEMENTS[name]}")
+            prepared.add(name)
+        placeholders = ", ".join(["%s"] * len(params))
+        cur.execute(f"EXECUTE {name} ({placeholders})", params)
+
+    def run_async(self, fn, *args, **kwargs):
+        """
+        Run a database call on the background executor and return its Future.
+        Every call checks out its own pooled connection, so reads are safe to
+        run concurrently with the GUI thread.
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
     def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.close_listener()
         if self.pool:
             self.pool.closeall()
 
+    def listen_changes(self):
+        """
+        Open a dedicated connection that LISTENs for product, alias and
+        scheme writes from any session, and return its socket descriptor for
+        the GUI to watch. Returns None if the listener can't be set up.
+        """
+        self.close_listener()
+        try:
+            conn = psycopg2.connect(**self.conn_params)
+            conn.autocommit = True
+            cur = conn.cursor()
+            for channel in CHANGE_CHANNELS:
+                cur.execute(f"LISTEN {channel}")
+            cur.close()
+        except Exception as e:
+            print(f"Error listening for data changes: {e}")
+            return None
+        self._listen_conn = conn
+        return conn.fileno()
+
+    def close_listener(self):
+        if self._listen_conn is not None:
+            try:
+                self._listen_conn.close()
+            except Exception:
+                pass
+            self._listen_conn = None
+
+    def poll_changes(self):
+        """
+        Drain pending notifications and return the set of channels notified
+        since the last poll. Returns None, after closing it, if the listen
+        connection was lost and listen_changes() must be called again.
+        """
+        conn = self._listen_conn
+        if conn is None:
+            return None
+        try:
+            conn.poll()
+        except Exception as e:
+            print(f"Error polling data changes: {e}")
+            self.close_listener()
+            return None
+        changed = {n.channel for n in conn.notifies}
+        conn.notifies.clear()
+        return changed
+
     def init_db(self):
         commands = [
             "CREATE EXTENSION IF NOT EXISTS pg_trgm;",
@@ -306,6 +476,63 @@ class DatabaseManager:
             )
             """,
             "INSERT INTO settings (key, value) VALUES ('theme', 'mocha') ON CONFLICT (key) DO NOTHING;",
+            # Trigram indexes backing search_products(); the expressions must
+            # match the ones used in its WHERE clauses.
+            "CREATE INDEX IF NOT EXISTS idx_products_name_trgm ON products USING gin (name gin_trgm_ops);",
+            "CREATE INDEX IF NOT EXISTS idx_products_barcode_trgm ON products USING gin ((COALESCE(barcode, '')) gin_trgm_ops);",
+            "CREATE INDEX IF NOT EXISTS idx_products_aliases_trgm ON products USING gin ((COALESCE(aliases, '')) gin_trgm_ops);",
+            "CREATE INDEX IF NOT EXISTS idx_product_aliases_barcode_trgm ON product_aliases USING gin ((COALESCE(barcode, '')) gin_trgm_ops);",
+            "CREATE INDEX IF NOT EXISTS idx_product_aliases_aliases_trgm ON product_aliases USING gin ((COALESCE(aliases, '')) gin_trgm_ops);",
+            # Let other terminals know when their in-memory product caches
+            # are stale (see listen_changes).
+            """
+            CREATE OR REPLACE FUNCTION notify_products_changed() RETURNS trigger AS $$
+            BEGIN
+                PERFORM pg_notify('products_changed', '');
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """,
+            """
+            DO $$
+            BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'products_changed_notify') THEN
+                    CREATE TRIGGER products_changed_notify
+                    AFTER INSERT OR UPDATE OR DELETE ON products
+                    FOR EACH STATEMENT EXECUTE PROCEDURE notify_products_changed();
+                END IF;
+                IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'product_aliases_changed_notify') THEN
+                    CREATE TRIGGER product_aliases_changed_notify
+                    AFTER INSERT OR UPDATE OR DELETE ON product_aliases
+                    FOR EACH STATEMENT EXECUTE PROCEDURE notify_products_changed();
+                END IF;
+            END
+            $$
+            """,
+            """
+            CREATE OR REPLACE FUNCTION notify_schemes_changed() RETURNS trigger AS $$
+            BEGIN
+                PERFORM pg_notify('schemes_changed', '');
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """,
+            """
+            DO $$
+            BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'schemes_changed_notify') THEN
+                    CREATE TRIGGER schemes_changed_notify
+                    AFTER INSERT OR UPDATE OR DELETE ON schemes
+                    FOR EACH STATEMENT EXECUTE PROCEDURE notify_schemes_changed();
+                END IF;
+                IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'scheme_products_changed_notify') THEN
+                    CREATE TRIGGER scheme_products_changed_notify
+                    AFTER INSERT OR UPDATE OR DELETE ON scheme_products
+                    FOR EACH STATEMENT EXECUTE PROCEDURE notify_schemes_changed();
+                END IF;
+            END
+            $$
+            """,
         ]
         conn = None
         try:
@@ -344,6 +571,7 @@ class DatabaseManager:
                 (name, alias),
             )
             conn.commit()
+            self.invalidate_uoms()
             return True
         except Exception as e:
             print(f"Error adding UOM: {e}")
@@ -361,13 +589,30 @@ class DatabaseManager:
         conn.close()
         return uoms
 
+    def get_uoms_cached(self):
+        """
+        UOM rows, memoized until the next UOM add or delete.
+        """
+        if self._uoms_cache is None:
+            self._uoms_cache = self.get_uoms()
+        return list(self._uoms_cache)
+
+    def invalidate_uoms(self):
+        self._uoms_cache = None
+        self._uom_map = None
+
     def get_uom_map(self):
-        uoms = self.get_uoms()
-        mapping = {}
-        for _, name, alias in uoms:
-            if alias:
-                mapping[alias.lower()] = name
-        return mapping
+        """
+        Lower-cased alias -> UOM name, built once per UOM change. The dict is
+        shared between callers, so treat it as read-only.
+        """
+        if self._uom_map is None:
+            self._uom_map = {
+                alias.lower(): name
+                for _, name, alias in self.get_uoms_cached()
+                if alias
+            }
+        return self._uom_map
 
     def delete_uom(self, name):
         conn = self.get_connection()
@@ -378,6 +623,7 @@ class DatabaseManager:
                 return False
             cur.execute("DELETE FROM uoms WHERE name = %s", (name,))
             conn.commit()
+            self.invalidate_uoms()
             return True
         except Exception:
             return False
@@ -395,6 +641,7 @@ class DatabaseManager:
                 (name, code),
             )
             conn.commit()
+            self.invalidate_languages()
             return True
         except Exception as e:
             print(f"Error adding language: {e}")
@@ -412,12 +659,25 @@ class DatabaseManager:
         conn.close()
         return langs
 
+    def get_languages_cached(self):
+        """
+        Language rows, memoized until the next language add or delete.
+        """
+        if self._languages_cache is None:
+            self._languages_cache = self.get_languages()
+        return list(self._languages_cache)
+
+    def invalidate_languages(self):
+        self._languages_cache = None
+
     def delete_language(self, lang_id):
         conn = self.get_connection()
         cur = conn.cursor()
         try:
             cur.execute("DELETE FROM languages WHERE id = %s", (lang_id,))
             conn.commit()
+            self.invalidate_languages()
+            self.invalidate_translated_items()
             return True
         except Exception:
             return False
@@ -436,6 +696,7 @@ class DatabaseManager:
                 (product_id, language_id, translated_name),
             )
             conn.commit()
+            self.invalidate_translated_items()
             return True
         except Exception as e:
             print(f"Error adding translation: {e}")
@@ -461,26 +722,71 @@ class DatabaseManager:
         conn.close()
         return trans
 
+    def get_translations_for_language(self, language_id):
+        """
+        Return {product_id: translated_name} for every product translated
+        into the given language.
+        """
+        conn = self.get_connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(
+                "SELECT product_id, translated_name FROM product_translations WHERE language_id = %s",
+                (language_id,),
+            )
+            return dict(cur.fetchall())
+        except Exception as e:
+            print(f"Error fetching translations for language: {e}")
+            return {}
+        finally:
+            cur.close()
+            conn.close()
+
     def get_translated_items(self, items, language_id):
         if not language_id:
             return items
         conn = self.get_connection()
         cur = conn.cursor()
+        try:
+            self.execute_prepared(
+                conn,
+                cur,
+                "product_translations",
+                (list({item["id"] for item in items}), language_id),
+            )
+            names = dict(cur.fetchall())
+        finally:
+            cur.close()
+            conn.close()
         translated_items = []
         for item in items:
-            cur.execute(
-                "SELECT translated_name FROM product_translations WHERE product_id = %s AND language_id = %s",
-                (item["id"], language_id),
-            )
-            res = cur.fetchone()
             new_item = item.copy()
-            if res:
-                new_item["name"] = res[0]
+            if item["id"] in names:
+                new_item["name"] = names[item["id"]]
             translated_items.append(new_item)
-        cur.close()
-        conn.close()
         return translated_items
 
+    def get_translated_sale_items(self, sale_id, items, language_id):
+        """
+        Translated receipt lines for a saved bill, kept in a small LRU keyed
+        by (sale_id, language_id) so reprints skip the translation lookups.
+        """
+        if not language_id:
+            return items
+        key = (sale_id, language_id)
+        cached = self._translated_cache.get(key)
+        if cached is not None:
+            self._translated_cache.move_to_end(key)
+            return [dict(item) for item in cached]
+        translated = self.get_translated_items(items, language_id)
+        self._translated_cache[key] = [dict(item) for item in translated]
+        if len(self._translated_cache) > 256:
+            self._translated_cache.popitem(last=False)
+        return translated
+
+    def invalidate_translated_items(self):
+        self._translated_cache.clear()
+
     def add_user(self, username, password, full_name, role="cashier", permissions=None):
         import hashlib
         import json
@@ -515,14 +821,15 @@ class DatabaseManager:
         conn.close()
         return users
 
-    def delete_user(self, user_id):
+    def delete_users(self, user_ids):
         conn = self.get_connection()
         cur = conn.cursor()
         try:
-            cur.execute("DELETE FROM users WHERE id = %s", (user_id,))
+            cur.execute("DELETE FROM users WHERE id = ANY(%s)", (list(user_ids),))
             conn.commit()
             return True
-        except Exception:
+        except Exception as e:
+            print(f"Error deleting users: {e}")
             return False
         finally:
             cur.close()
@@ -563,23 +870,24 @@ class DatabaseManager:
             cur.close()
             conn.close()
 
-    def get_customers(self):
+    def get_customers(self, limit=None, offset=0):
         conn = self.get_connection()
         cur = conn.cursor()
         cur.execute(
-            "SELECT id, name, mobile, address, email FROM customers ORDER BY name"
+            "SELECT id, name, mobile, address, email FROM customers ORDER BY name LIMIT %s OFFSET %s",
+            (limit, offset),
         )
         customers = cur.fetchall()
         cur.close()
         conn.close()
         return customers
 
-    def search_customers(self, query):
+    def search_customers(self, query, limit=None, offset=0):
         conn = self.get_connection()
         cur = conn.cursor()
         cur.execute(
-            "SELECT id, name, mobile, address, email FROM customers WHERE name ILIKE %s OR mobile ILIKE %s",
-            (f"%{query}%", f"%{query}%"),
+            "SELECT id, name, mobile, address, email FROM customers WHERE name ILIKE %s OR mobile ILIKE %s ORDER BY name LIMIT %s OFFSET %s",
+            (f"%{query}%", f"%{query}%", limit, offset),
         )
         customers = cur.fetchall()
         cur.close()
@@ -589,10 +897,7 @@ class DatabaseManager:
     def get_customer_by_mobile(self, mobile):
         conn = self.get_connection()
         cur = conn.cursor()
-        cur.execute(
-            "SELECT id, name, mobile, address, email FROM customers WHERE mobile = %s",
-            (mobile,),
-        )
+        self.execute_prepared(conn, cur, "customer_by_mobile", (mobile,))
         customer = cur.fetchone()
         cur.close()
         conn.close()
@@ -628,9 +933,10 @@ class DatabaseManager:
                     (supplier_name, invoice_no, total_amount),
                 )
             purchase_id = cur.fetchone()[0]
-            for item in items:
-                cur.execute(
-                    "INSERT INTO purchase_items (purchase_id, product_id, quantity, purchase_rate, uom, mrp) VALUES (%s, %s, %s, %s, %s, %s)",
+            psycopg2.extras.execute_values(
+                cur,
+                "INSERT INTO purchase_items (purchase_id, product_id, quantity, purchase_rate, uom, mrp) VALUES %s",
+                [
                     (
                         purchase_id,
                         item["pid"],
@@ -638,9 +944,12 @@ class DatabaseManager:
                         item["rate"],
                         item["uom"],
                         item.get("mrp"),
-                    ),
-                )
+                    )
+                    for item in items
+                ],
+            )
             conn.commit()
+            self.invalidate_suppliers()
             return purchase_id
         except Exception as e:
             conn.rollback()
@@ -709,6 +1018,17 @@ class DatabaseManager:
         conn.close()
         return suppliers
 
+    def get_suppliers_cached(self):
+        """
+        Supplier names, memoized until the next recorded purchase.
+        """
+        if self._suppliers_cache is None:
+            self._suppliers_cache = self.get_suppliers()
+        return list(self._suppliers_cache)
+
+    def invalidate_suppliers(self):
+        self._suppliers_cache = None
+
     def hold_sale(self, items, total_amount, user_id):
         conn = self.get_connection()
         cur = conn.cursor()
@@ -796,19 +1116,84 @@ class DatabaseManager:
             conn.close()
 
     def reindex_database(self):
+        """
+        Rebuild every user index with REINDEX INDEX CONCURRENTLY, which only
+        takes a SHARE UPDATE EXCLUSIVE lock, so billing keeps working while
+        it runs. Servers older than PostgreSQL 12 fall back to a plain
+        REINDEX DATABASE.
+        """
         conn = self.get_connection()
         conn.autocommit = True
         cur = conn.cursor()
         try:
-            cur.execute("REINDEX DATABASE " + self.conn_params["dbname"])
-            return True
+            if conn.server_version < 120000:
+                cur.execute(
+                    psycopg2.sql.SQL("REINDEX DATABASE {}").format(
+                        psycopg2.sql.Identifier(self.conn_params["dbname"])
+                    )
+                )
+                return True
+            cur.execute(
+                """
+                SELECT n.nspname, c.relname
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')
+                  AND n.nspname NOT LIKE 'pg_toast%%'
+                  AND i.indisvalid
+                """
+            )
+            ok = True
+            for schema, name in cur.fetchall():
+                try:
+                    cur.execute(
+                        psycopg2.sql.SQL("REINDEX INDEX CONCURRENTLY {}").format(
+                            psycopg2.sql.Identifier(schema, name)
+                        )
+                    )
+                except Exception as e:
+                    print(f"Reindex error on {schema}.{name}: {e}")
+                    ok = False
+                    self._drop_reindex_leftovers(cur, schema, name)
+            return ok
         except Exception as e:
             print(f"Reindex error: {e}")
             return False
         finally:
             cur.close()
+            conn.autocommit = False
             conn.close()
 
+    @staticmethod
+    def _drop_reindex_leftovers(cur, schema, name):
+        """
+        Drop the invalid <name>_ccnew index a failed REINDEX CONCURRENTLY
+        leaves behind, so it neither lingers nor slows down writes.
+        """
+        prefix = f"{name}_ccnew"
+        try:
+            cur.execute(
+                """
+                SELECT c.relname
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE NOT i.indisvalid AND n.nspname = %s
+                  AND left(c.relname, length(%s)) = %s
+                """,
+                (schema, prefix, prefix),
+            )
+            for (leftover,) in cur.fetchall():
+                if leftover[len(prefix) :].isdigit() or leftover == prefix:
+                    cur.execute(
+                        psycopg2.sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(
+                            psycopg2.sql.Identifier(schema, leftover)
+                        )
+                    )
+        except Exception as e:
+            print(f"Error dropping leftover index for {schema}.{name}: {e}")
+
     def check_alias_exists(self, barcode, exclude_product_id=None):
         if not barcode:
             return None
@@ -885,6 +1270,7 @@ class DatabaseManager:
             )
             pid = cur.fetchone()[0]
             conn.commit()
+            self.invalidate_product_index()
             return pid
         except Exception as e:
             print(f"Error adding product: {e}")
@@ -925,6 +1311,7 @@ class DatabaseManager:
                 ),
             )
             conn.commit()
+            self.invalidate_product_index()
             return True
         except Exception as e:
             print(f"Error updating product: {e}")
@@ -965,6 +1352,7 @@ class DatabaseManager:
                 ),
             )
             conn.commit()
+            self.invalidate_product_index()
             return True
         except Exception as e:
             print(f"Error adding alias: {e}")
@@ -991,6 +1379,7 @@ class DatabaseManager:
         try:
             cur.execute("DELETE FROM product_aliases WHERE id = %s", (alias_id,))
             conn.commit()
+            self.invalidate_product_index()
             return True
         except Exception:
             return False
@@ -998,17 +1387,59 @@ class DatabaseManager:
             cur.close()
             conn.close()
 
-    def get_all_products(self):
+    def replace_aliases(self, product_id, variants):
+        """
+        Swap a product's whole alias set in one transaction. Each variant is
+        (barcode, uom, mrp, price, factor, qty, aliases, purchase_price,
+        stock_qty).
+        """
+        conn = self.get_connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(
+                "DELETE FROM product_aliases WHERE product_id = %s", (product_id,)
+            )
+            if variants:
+                psycopg2.extras.execute_values(
+                    cur,
+                    "INSERT INTO product_aliases (product_id, barcode, uom, mrp, price, factor, qty, aliases, purchase_price, stock_qty) VALUES %s",
+                    [(product_id, *v) for v in variants],
+                )
+            conn.commit()
+            self.invalidate_product_index()
+            return True
+        except Exception as e:
+            conn.rollback()
+            print(f"Error saving aliases: {e}")
+            return False
+        finally:
+            cur.close()
+            conn.close()
+
+    def get_all_products(self, limit=None, offset=0):
         conn = self.get_connection()
         cur = conn.cursor()
         cur.execute(
-            "SELECT id, name, barcode, mrp, price, category, base_uom, aliases, purchase_price, load_qty FROM products WHERE is_deleted = FALSE ORDER BY name"
+            "SELECT id, name, barcode, mrp, price, category, base_uom, aliases, purchase_price, load_qty FROM products WHERE is_deleted = FALSE ORDER BY name, id LIMIT %s OFFSET %s",
+            (limit, offset),
         )
         products = cur.fetchall()
         cur.close()
         conn.close()
         return products
 
+    def get_all_products_cached(self):
+        """
+        The full product list, memoized for the current inventory version so
+        reopening product search does not re-read the catalog.
+        """
+        cached = self._all_products_cache
+        if cached is None or cached[0] != self.inventory_version:
+            version = self.inventory_version
+            cached = (version, self.get_all_products())
+            self._all_products_cache = cached
+        return list(cached[1])
+
     def delete_product(self, product_id):
         conn = self.get_connection()
         cur = conn.cursor()
@@ -1018,6 +1449,7 @@ class DatabaseManager:
                 (product_id,),
             )
             conn.commit()
+            self.invalidate_product_index()
             return True
         except Exception as e:
             print(f"Error deleting product: {e}")
@@ -1035,6 +1467,7 @@ class DatabaseManager:
                 (product_id,),
             )
             conn.commit()
+            self.invalidate_product_index()
             return True
         except Exception as e:
             print(f"Error restoring product: {e}")
@@ -1067,6 +1500,7 @@ class DatabaseManager:
                 AND id NOT IN (SELECT DISTINCT product_id FROM held_sale_items WHERE product_id IS NOT NULL)
                 """)
             conn.commit()
+            self.invalidate_product_index()
         except Exception as e:
             print(f"Error purging products: {e}")
         finally:
@@ -1074,41 +1508,44 @@ class DatabaseManager:
             conn.close()
 
     def search_products(self, query):
+        """
+        Fuzzy product and alias search. Each branch filters with the pg_trgm
+        % operator and ILIKE on the trigram-indexed expressions before the
+        UNION, so the GIN indexes are used instead of scoring every row.
+        """
         conn = self.get_connection()
         cur = conn.cursor()
         try:
+            # Keep the historical 0.1 cut-off; reset when the transaction ends.
+            cur.execute("SET LOCAL pg_trgm.similarity_threshold = 0.1")
             cur.execute(
                 """
                 SELECT id, name, barcode, mrp, price, category, uom, load_qty FROM (
-                    SELECT p.id, p.name, p.barcode as barcode, p.mrp, p.price, p.category, 
-                           p.base_uom as uom, p.load_qty, p.aliases, similarity(p.name, %s) as sim_n, 
-                           similarity(COALESCE(p.barcode, ''), %s) as sim_b, 
-                           similarity(COALESCE(p.aliases, ''), %s) as sim_a, p.is_deleted
+                    SELECT p.id, p.name, p.barcode, p.mrp, p.price, p.category,
+                           p.base_uom as uom, p.load_qty,
+                           GREATEST(similarity(p.name, %(q)s), similarity(COALESCE(p.barcode, ''), %(q)s),
+                                    similarity(COALESCE(p.aliases, ''), %(q)s)) as score
                     FROM products p
+                    WHERE p.is_deleted = FALSE
+                    AND (p.name %% %(q)s OR COALESCE(p.barcode, '') %% %(q)s OR COALESCE(p.aliases, '') %% %(q)s
+                         OR p.name ILIKE %(pattern)s OR COALESCE(p.barcode, '') ILIKE %(pattern)s
+                         OR COALESCE(p.aliases, '') ILIKE %(pattern)s)
                     UNION ALL
-                    SELECT p.id, p.name, pa.barcode as barcode, pa.mrp, pa.price, p.category, 
-                           pa.uom as uom, 1.0 as load_qty, pa.aliases, similarity(p.name, %s) as sim_n, 
-                           similarity(COALESCE(pa.barcode, ''), %s) as sim_b, 
-                           similarity(COALESCE(pa.aliases, ''), %s) as sim_a, p.is_deleted
+                    SELECT p.id, p.name, pa.barcode, pa.mrp, pa.price, p.category,
+                           pa.uom as uom, 1.0 as load_qty,
+                           GREATEST(similarity(p.name, %(q)s), similarity(COALESCE(pa.barcode, ''), %(q)s),
+                                    similarity(COALESCE(pa.aliases, ''), %(q)s)) as score
                     FROM product_aliases pa
                     JOIN products p ON pa.product_id = p.id
+                    WHERE p.is_deleted = FALSE
+                    AND (p.name %% %(q)s OR COALESCE(pa.barcode, '') %% %(q)s OR COALESCE(pa.aliases, '') %% %(q)s
+                         OR p.name ILIKE %(pattern)s OR COALESCE(pa.barcode, '') ILIKE %(pattern)s
+                         OR COALESCE(pa.aliases, '') ILIKE %(pattern)s)
                 ) as combined
-                WHERE (sim_n > 0.1 OR sim_b > 0.1 OR sim_a > 0.1 OR name ILIKE %s OR barcode ILIKE %s OR aliases ILIKE %s) 
-                AND is_deleted = FALSE
-                ORDER BY GREATEST(sim_n, sim_b, sim_a) DESC, name
+                ORDER BY score DESC, name
                 LIMIT 15
                 """,
-                (
-                    query,
-                    query,
-                    query,
-                    query,
-                    query,
-                    query,
-                    f"%{query}%",
-                    f"%{query}%",
-                    f"%{query}%",
-                ),
+                {"q": query, "pattern": f"%{query}%"},
             )
             products = cur.fetchall()
             return products
@@ -1119,6 +1556,35 @@ class DatabaseManager:
             cur.close()
             conn.close()
 
+    def peek_search_cache(self, query):
+        """
+        Cached search_products_cached() result for query, or None on a miss.
+        """
+        key = (self.inventory_version, query.lower().strip())
+        with self._completer_lock:
+            products = self._completer_cache.get(key)
+            if products is not None:
+                self._completer_cache.move_to_end(key)
+        return products
+
+    def search_products_cached(self, query):
+        """
+        search_products() shared by all fuzzy completers, keyed by the
+        normalized text and the inventory version. Only the 10 rows the
+        popup shows are kept, for the 256 most recent queries.
+        """
+        products = self.peek_search_cache(query)
+        if products is None:
+            # Key on the version seen before querying, so rows read across a
+            # concurrent product write are filed under the old version.
+            key = (self.inventory_version, query.lower().strip())
+            products = self.search_products(key[1])[:10]
+            with self._completer_lock:
+                self._completer_cache[key] = products
+                if len(self._completer_cache) > 256:
+                    self._completer_cache.popitem(last=False)
+        return products
+
     def search_items(self, query):
         conn = self.get_connection()
         cur = conn.cursor()
@@ -1143,19 +1609,46 @@ class DatabaseManager:
         conn.close()
         return product
 
-    def find_product_by_barcode(self, barcode):
+    def get_product_bundle(self, pid):
+        """
+        Product row plus its alias rows in one round trip, shaped like
+        (get_product_by_id(pid), get_aliases(pid)).
+        """
         conn = self.get_connection()
         cur = conn.cursor()
         cur.execute(
             """
-            SELECT id, name, barcode, mrp, price, category, base_uom, load_qty FROM products 
-            WHERE (barcode = %s OR aliases ILIKE %s) AND is_deleted = FALSE
+            SELECT p.id, p.name, p.barcode, p.mrp, p.price, p.category, p.base_uom, p.aliases, p.purchase_price, p.load_qty,
+                   a.id, a.barcode, a.uom, a.mrp, a.price, a.factor, a.qty, a.aliases, a.purchase_price, a.stock_qty
+            FROM products p
+            LEFT JOIN product_aliases a ON a.product_id = p.id
+            WHERE p.id = %s
+            ORDER BY a.id
             """,
-            (barcode, f"%{barcode}%"),
+            (pid,),
         )
-        product = cur.fetchone()
+        rows = cur.fetchall()
+        cur.close()
+        conn.close()
+        if not rows:
+            return None, []
+        return rows[0][:10], [r[10:] for r in rows if r[10] is not None]
+
+    def find_product_by_barcode(self, barcode):
+        conn = self.get_connection()
+        cur = conn.cursor()
+        alias = None
+        try:
+            self.execute_prepared(conn, cur, "product_by_barcode", (barcode,))
+            product = cur.fetchone()
+            if not product:
+                self.execute_prepared(conn, cur, "alias_by_barcode", (barcode,))
+                alias = cur.fetchone()
+        finally:
+            cur.close()
+            conn.close()
         if product:
-            res = (
+            return (
                 product[0],
                 product[1],
                 product[2],
@@ -1169,21 +1662,6 @@ class DatabaseManager:
                 product[4],
                 product[3],
             )
-            cur.close()
-            conn.close()
-            return res
-        cur.execute(
-            """
-            SELECT p.id, p.name, a.barcode, a.mrp, a.price, p.category, a.uom, a.factor, a.qty, p.price as base_price, p.mrp as base_mrp
-            FROM product_aliases a
-            JOIN products p ON a.product_id = p.id
-            WHERE (a.barcode = %s OR a.aliases ILIKE %s) AND p.is_deleted = FALSE
-            """,
-            (barcode, f"%{barcode}%"),
-        )
-        alias = cur.fetchone()
-        cur.close()
-        conn.close()
         if alias:
             return (
                 alias[0],
@@ -1201,16 +1679,97 @@ class DatabaseManager:
             )
         return None
 
+    def load_product_index(self):
+        """
+        Load an in-memory {barcode: product tuple} index of active products
+        and their alias barcodes, in the same shape find_product_by_barcode
+        returns. Product barcodes take precedence over alias barcodes.
+        """
+        index = {}
+        conn = self.get_connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(
+                """
+                SELECT p.id, p.name, a.barcode, a.mrp, a.price, p.category, a.uom, a.factor, a.qty, p.price, p.mrp
+                FROM product_aliases a
+                JOIN products p ON a.product_id = p.id
+                WHERE p.is_deleted = FALSE AND a.barcode IS NOT NULL AND a.barcode <> ''
+                """
+            )
+            for a in cur.fetchall():
+                index[a[2]] = (
+                    a[0],
+                    a[1],
+                    a[2],
+                    a[3],
+                    a[4],
+                    a[5],
+                    a[6],
+                    a[7],
+                    True,
+                    a[8],  # qty from aliases
+                    a[9],
+                    a[10],
+                )
+            cur.execute(
+                """
+                SELECT id, name, barcode, mrp, price, category, base_uom, load_qty FROM products
+                WHERE is_deleted = FALSE AND barcode IS NOT NULL AND barcode <> ''
+                """
+            )
+            for p in cur.fetchall():
+                index[p[2]] = (
+                    p[0],
+                    p[1],
+                    p[2],
+                    p[3],
+                    p[4],
+                    p[5],
+                    p[6],
+                    1.0,
+                    False,
+                    p[7],  # load_qty
+                    p[4],
+                    p[3],
+                )
+        except Exception as e:
+            print(f"Error loading product index: {e}")
+            index = None
+        finally:
+            cur.close()
+            conn.close()
+        self._product_index = index
+        return index
+
+    def invalidate_product_index(self):
+        """
+        Drop every in-memory product cache after a product or alias write.
+        """
+        self._product_index = None
+        self.inventory_version += 1
+        with self._completer_lock:
+            self._completer_cache.clear()
+        self._unit_cache.clear()
+        self._all_products_cache = None
+        # Scheme listings embed product names.
+        self._schemes_gen += 1
+        self._schemes_cache = None
+        self.invalidate_translated_items()
+
     def find_product_smart(self, query):
+        index = self._product_index
+        if index is None:
+            index = self.load_product_index() or {}
+        res = index.get(query)
+        if res:
+            return res
         res = self.find_product_by_barcode(query)
         if res:
             return res
         conn = self.get_connection()
         cur = conn.cursor()
-        cur.execute(
-            "SELECT id, name, barcode, mrp, price, category, base_uom, load_qty FROM products WHERE name ILIKE %s AND is_deleted = FALSE",
-            (query,),
-        )
+        self.execute_prepared(conn, cur, "product_by_name", (query,))
         p = cur.fetchone()
         if p:
             res = (
@@ -1230,10 +1789,7 @@ class DatabaseManager:
             cur.close()
             conn.close()
             return res
-        cur.execute(
-            "SELECT id, name, barcode, mrp, price, category, base_uom, load_qty FROM products WHERE name ILIKE %s AND is_deleted = FALSE ORDER BY name LIMIT 1",
-            (f"%{query}%",),
-        )
+        self.execute_prepared(conn, cur, "product_by_name", (f"%{query}%",))
         p = cur.fetchone()
         if p:
             res = (
@@ -1340,6 +1896,35 @@ class DatabaseManager:
             )
         return None
 
+    def _cached_units(self, key, fetch, *args):
+        """
+        Memoize a per-product unit lookup until the next product or alias
+        write. Results are copied so callers can't mutate the cached rows.
+        """
+        if key not in self._unit_cache:
+            if len(self._unit_cache) >= 2048:
+                self._unit_cache.clear()
+            self._unit_cache[key] = fetch(*args)
+        res = self._unit_cache[key]
+        if isinstance(res, list):
+            return [dict(row) for row in res]
+        return dict(res) if res else res
+
+    def get_product_units_cached(self, product_id):
+        return self._cached_units(
+            ("units", product_id), self.get_product_units, product_id
+        )
+
+    def get_product_uom_data_cached(self, product_id, uom):
+        return self._cached_units(
+            ("uom_data", product_id, uom), self.get_product_uom_data, product_id, uom
+        )
+
+    def get_available_mrps_cached(self, product_id, uom):
+        return self._cached_units(
+            ("mrps", product_id, uom), self.get_available_mrps, product_id, uom
+        )
+
     def get_product_units(self, product_id):
         conn = self.get_connection()
         cur = conn.cursor()
@@ -1382,6 +1967,140 @@ class DatabaseManager:
             cur.close()
             conn.close()
 
+    def find_products_by_barcodes(self, barcodes):
+        """
+        Bulk find_product_by_barcode(): {barcode: product tuple} for the given
+        codes. Served from the product index where possible, with one query
+        for exact barcode matches on the rest; only codes that still miss fall
+        back to the per-code alias search.
+        """
+        index = self._product_index
+        if index is None:
+            index = self.load_product_index() or {}
+        found = {}
+        missing = []
+        for code in dict.fromkeys(barcodes):
+            if code in index:
+                found[code] = index[code]
+            elif code:
+                missing.append(code)
+        if missing:
+            conn = self.get_connection()
+            cur = conn.cursor()
+            try:
+                cur.execute(
+                    """
+                    SELECT p.id, p.name, a.barcode, a.mrp, a.price, p.category, a.uom, a.factor, a.qty, p.price, p.mrp
+                    FROM product_aliases a
+                    JOIN products p ON a.product_id = p.id
+                    WHERE a.barcode = ANY(%s) AND p.is_deleted = FALSE
+                    """,
+                    (missing,),
+                )
+                for a in cur.fetchall():
+                    found[a[2]] = (
+                        a[0],
+                        a[1],
+                        a[2],
+                        a[3],
+                        a[4],
+                        a[5],
+                        a[6],
+                        a[7],
+                        True,
+                        a[8],  # qty from aliases
+                        a[9],
+                        a[10],
+                    )
+                cur.execute(
+                    """
+                    SELECT id, name, barcode, mrp, price, category, base_uom, load_qty FROM products
+                    WHERE barcode = ANY(%s) AND is_deleted = FALSE
+                    """,
+                    (missing,),
+                )
+                for p in cur.fetchall():
+                    found[p[2]] = (
+                        p[0],
+                        p[1],
+                        p[2],
+                        p[3],
+                        p[4],
+                        p[5],
+                        p[6],
+                        1.0,
+                        False,
+                        p[7],  # load_qty
+                        p[4],
+                        p[3],
+                    )
+            except Exception as e:
+                print(f"Error fetching products by barcode: {e}")
+            finally:
+                cur.close()
+                conn.close()
+        for code in missing:
+            if code not in found:
+                prod = self.find_product_by_barcode(code)
+                if prod:
+                    found[code] = prod
+        return found
+
+    def get_product_uom_data_bulk(self, pairs):
+        """
+        Bulk get_product_uom_data(): {(product_id, uom): data} for the given
+        pairs, in two queries. Pairs with no matching unit are left out.
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return {}
+        pids = list({pid for pid, _ in pairs})
+        conn = self.get_connection()
+        cur = conn.cursor()
+        try:
+            cur.execute(
+                "SELECT id, base_uom, price, mrp FROM products WHERE id = ANY(%s)",
+                (pids,),
+            )
+            base = {row[0]: row for row in cur.fetchall()}
+            cur.execute(
+                "SELECT product_id, price, factor, uom, mrp FROM product_aliases WHERE product_id = ANY(%s)",
+                (pids,),
+            )
+            aliases = {}
+            for a in cur.fetchall():
+                aliases.setdefault((a[0], a[3]), a)
+        except Exception as e:
+            print(f"Error fetching UOM data: {e}")
+            return {}
+        finally:
+            cur.close()
+            conn.close()
+        res = {}
+        for pid, uom in pairs:
+            p = base.get(pid)
+            if p and p[1] == uom:
+                res[(pid, uom)] = {
+                    "price": float(p[2]),
+                    "mrp": float(p[3]),
+                    "factor": 1.0,
+                    "uom": p[1],
+                    "base_price": float(p[2]),
+                    "base_mrp": float(p[3]),
+                }
+                continue
+            a = aliases.get((pid, uom))
+            if a:
+                res[(pid, uom)] = {
+                    "price": float(a[1]),
+                    "mrp": float(a[4]),
+                    "factor": float(a[2]),
+                    "uom": a[3],
+                    "base_price": float(p[2]) if p else 0.0,
+                    "base_mrp": float(p[3]) if p else 0.0,
+                }
+        return res
+
     def get_product_uom_data(self, product_id, uom):
         conn = self.get_connection()
         cur = conn.cursor()
@@ -1474,6 +2193,7 @@ class DatabaseManager:
                     ),
                 )
             conn.commit()
+            self.invalidate_schemes()
             return True
         except Exception as e:
             conn.rollback()
@@ -1511,6 +2231,7 @@ class DatabaseManager:
                     ),
                 )
             conn.commit()
+            self.invalidate_schemes()
             return True
         except Exception as e:
             conn.rollback()
@@ -1555,6 +2276,20 @@ class DatabaseManager:
         conn.close()
         return schemes
 
+    def get_schemes_cached(self):
+        """
+        Scheme rows, memoized until the next scheme or product write.
+        """
+        schemes = self._schemes_cache
+        if schemes is None:
+            # Runs on the executor; if an invalidation lands mid-query the
+            # rows may predate it, so return them without caching.
+            gen = self._schemes_gen
+            schemes = self.get_schemes()
+            if gen == self._schemes_gen:
+                self._schemes_cache = schemes
+        return list(schemes)
+
     def get_active_scheme_for_product(self, product_id, qty, uom=None, mrp=None):
         try:
             with self.get_connection() as conn:
@@ -1591,12 +2326,34 @@ class DatabaseManager:
             print(f"Error fetching scheme: {e}")
             return None
 
+    def get_active_scheme_cached(self, product_id, qty, uom=None, mrp=None):
+        """
+        get_active_scheme_for_product() memoized per product, quantity, UOM,
+        MRP and day, so repeated grid edits don't hit the DB. Cleared by any
+        scheme write, including other terminals' via schemes_changed.
+        """
+        key = (product_id, round(float(qty), 3), uom, mrp, datetime.date.today())
+        if key in self._active_scheme_cache:
+            self._active_scheme_cache.move_to_end(key)
+            return self._active_scheme_cache[key]
+        scheme = self.get_active_scheme_for_product(product_id, qty, uom, mrp)
+        self._active_scheme_cache[key] = scheme
+        if len(self._active_scheme_cache) > 512:
+            self._active_scheme_cache.popitem(last=False)
+        return scheme
+
+    def invalidate_schemes(self):
+        self._active_scheme_cache.clear()
+        self._schemes_gen += 1
+        self._schemes_cache = None
+
     def delete_scheme(self, scheme_id):
         conn = self.get_connection()
         cur = conn.cursor()
         try:
             cur.execute("DELETE FROM schemes WHERE id = %s", (scheme_id,))
             conn.commit()
+            self.invalidate_schemes()
             return True
         except Exception:
             return False
@@ -1604,30 +2361,63 @@ class DatabaseManager:
             cur.close()
             conn.close()
 
-    def get_sales_history(self, date=None, query=None):
+    def iter_sales_history(self, date=None, query=None, after=None, itersize=100):
+        """
+        Yield sales-history rows from a named (server-side) cursor, so only
+        `itersize` rows are transferred at a time. `after` is a (timestamp,
+        id) pair to resume after a previously yielded row. The pooled
+        connection is held until the generator is exhausted or closed.
+        """
+        conn = self.get_connection()
+        cur = conn.cursor(name="sales_history_cur")
+        cur.itersize = itersize
+        try:
+            cur.execute(
+                """
+                SELECT s.id, s.timestamp, s.total_amount, s.payment_method, c.name, c.mobile
+                FROM sales s
+                LEFT JOIN customers c ON s.customer_id = c.id
+                WHERE (%(date)s::date IS NULL OR DATE(s.timestamp) = %(date)s)
+                  AND (%(pattern)s::text IS NULL OR c.name ILIKE %(pattern)s
+                       OR c.mobile ILIKE %(pattern)s OR s.id::text ILIKE %(pattern)s)
+                  AND (%(after_ts)s::timestamp IS NULL
+                       OR (s.timestamp, s.id) < (%(after_ts)s::timestamp, %(after_id)s))
+                ORDER BY s.timestamp DESC, s.id DESC
+                """,
+                {
+                    "date": date or None,
+                    "pattern": f"%{query}%" if query else None,
+                    "after_ts": after[0] if after else None,
+                    "after_id": after[1] if after else None,
+                },
+            )
+            yield from cur
+        finally:
+            cur.close()
+            # End the transaction the named cursor lives in before the
+            # connection goes back to the pool.
+            conn.commit()
+            conn.close()
+
+    def get_sale_header(self, sale_id):
+        """
+        Fetch one sale in the same shape as an iter_sales_history row, by id.
+        """
         conn = self.get_connection()
         cur = conn.cursor()
-        sql_query = """
-            SELECT s.id, s.timestamp, s.total_amount, s.payment_method, c.name as customer_name, c.mobile as customer_mobile
+        cur.execute(
+            """
+            SELECT s.id, s.timestamp, s.total_amount, s.payment_method, c.name, c.mobile
             FROM sales s
             LEFT JOIN customers c ON s.customer_id = c.id
-            WHERE 1=1
-            """
-        params = []
-        if date:
-            sql_query += " AND DATE(s.timestamp) = %s"
-            params.append(date)
-        if query:
-            sql_query += (
-                " AND (c.name ILIKE %s OR c.mobile ILIKE %s OR s.id::text ILIKE %s)"
-            )
-            params.extend([f"%{query}%", f"%{query}%", f"%{query}%"])
-        sql_query += " ORDER BY s.timestamp DESC"
-        cur.execute(sql_query, tuple(params))
-        sales = cur.fetchall()
+            WHERE s.id = %s
+            """,
+            (sale_id,),
+        )
+        sale = cur.fetchone()
         cur.close()
         conn.close()
-        return sales
+        return sale
 
     def get_sale_items(self, sale_id):
         """
@@ -1635,15 +2425,7 @@ class DatabaseManager:
         """
         conn = self.get_connection()
         cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT p.name, si.quantity, si.price_at_sale, si.uom, si.product_id, p.barcode, si.mrp
-            FROM sale_items si
-            JOIN products p ON si.product_id = p.id
-            WHERE si.sale_id = %s
-            """,
-            (sale_id,),
-        )
+        self.execute_prepared(conn, cur, "sale_items", (sale_id,))
         items = cur.fetchall()
         cur.close()
         conn.close()
@@ -1734,6 +2516,7 @@ class DatabaseManager:
                     ),
                 )
             conn.commit()
+            self.invalidate_translated_items()
             return True
         except Exception as e:
             conn.rollback()
@@ -2,11 +2,32 @@
 Main entry point and GUI logic for elytPOS.
 """
 
+import itertools
+import math
 import os
+import re
 import sys
 import subprocess
-
-from PySide6.QtCore import Qt, QDate, QEvent, QTimer
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+
+from PySide6.QtCore import (
+    Qt,
+    QDate,
+    QEvent,
+    QTimer,
+    QObject,
+    Signal,
+    Slot,
+    QAbstractTableModel,
+    QModelIndex,
+    QEventLoop,
+    QProcess,
+    QProcessEnvironment,
+    QSignalBlocker,
+    QSocketNotifier,
+)
 from PySide6.QtGui import QFont, QAction, QKeyEvent, QPixmap, QIcon
 from PySide6.QtWidgets import (
     QDateEdit,
@@ -18,6 +39,9 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
+    QStyle,
+    QStyleOptionButton,
     QHeaderView,
     QListWidget,
     QListWidgetItem,
@@ -40,30 +64,595 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QAbstractItemView,
     QCheckBox,
+    QProgressDialog,
 )
 
 from database import DatabaseManager
-from printer import ReceiptPrinter
-from calculator_gui import CalculatorDialog
-from help_system import HelpDialog, LicenseDialog
 import styles
 from styles import get_style, get_theme_colors, get_app_path
-from printer_config_dialog import PrinterConfigDialog
 from version import __version__
 
 
+_FMT2 = "{:.2f}".format
+_FMT3 = "{:.3f}".format
+_DATE = "%d-%m-%Y"
+_GRAM_UOMS = frozenset(("g", "gram", "grams"))
+# Reconnect delay bounds for the change-notification LISTEN connection.
+_LISTEN_RETRY_MIN_MS = 1000
+_LISTEN_RETRY_MAX_MS = 60000
+_RO_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+# Billing grid columns the cashier never types into (name, amount).
+_RO_COLS = frozenset((1, 7))
+
+
+def _ro_item(text):
+    """
+    A selectable but non-editable table item.
+    """
+    it = QTableWidgetItem(text)
+    it.setFlags(_RO_FLAGS)
+    return it
+
+
+@lru_cache(maxsize=64)
+def _is_gram(uom):
+    """
+    True for UOMs priced per kilogram but sold in grams. A shop has only a
+    handful of UOM spellings, so each is lowercased once and then answered
+    from the cache.
+    """
+    return bool(uom) and uom.lower() in _GRAM_UOMS
+
+
+def _cell_float(it, default=0.0):
+    """
+    Numeric value of a grid item, or `default` for a missing, blank or
+    unparsable cell. Blank cells are the common case and never raise.
+    """
+    text = it.text() if it is not None else ""
+    if not text:
+        return default
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+def _price_row(qty, rate, is_gram, s_type=None, s_val=0.0):
+    """
+    Pure pricing for one billing row. Returns (scheme_rate, disc_pct, net):
+    scheme_rate is set only for absolute-rate schemes, disc_pct is None when
+    the row carries no discount.
+    """
+    if is_gram:
+        rate /= 1000.0
+    gross = qty * rate
+    if s_type == "absolute_rate":
+        abs_rate = s_val / 1000.0 if is_gram else s_val
+        return abs_rate, None, qty * abs_rate
+    if s_type == "percent":
+        return None, s_val, gross - (gross * s_val) / 100
+    if s_type == "amount":
+        disc_amt = qty * (s_val / 1000.0 if is_gram else s_val)
+        return None, (disc_amt / gross) * 100 if gross > 0 else 0, gross - disc_amt
+    return None, None, gross
+
+
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or get_app_path()
+
+
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Get absolute path to resource, works for dev and for PyInstaller.
     """
+    return os.path.join(_BASE_PATH, relative_path)
+
+
+@lru_cache(maxsize=8)
+def _cached_logo(theme, size):
+    """
+    Rasterize and smooth-scale the themed SVG logo once per (theme, size).
+    Returns a null pixmap if the logo is missing.
+    """
+    pixmap = QPixmap(resource_path(f"svg/logo_{theme}.svg"))
+    if pixmap.isNull():
+        return pixmap
+    return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+@lru_cache(maxsize=None)
+def _theme_icon(theme):
+    """
+    Window icon for a theme, built once per theme for the process lifetime.
+    """
+    return QIcon(resource_path(f"svg/logo_{theme}.svg"))
+
+
+_pg_dump_compression = None
+
+
+def pg_dump_compression():
+    """
+    Compression spec for custom-format dumps: zstd on pg_dump 16+, which
+    compresses faster and smaller than the default gzip, otherwise gzip -6.
+    """
+    global _pg_dump_compression
+    if _pg_dump_compression is None:
+        try:
+            out = subprocess.run(
+                ["pg_dump", "--version"], capture_output=True, text=True, check=False
+            ).stdout
+            major = int(re.search(r"\)\s+(\d+)", out).group(1))
+        except (OSError, AttributeError, ValueError):
+            major = 0
+        _pg_dump_compression = "zstd:3" if major >= 16 else "6"
+    return _pg_dump_compression
+
+
+def pg_dump_zstd_unsupported():
+    """
+    Record that this pg_dump was built without zstd, so later dumps go
+    straight to gzip instead of failing first.
+    """
+    global _pg_dump_compression
+    _pg_dump_compression = "6"
+
+
+class _AsyncRelay(QObject):
+    """
+    Hands results of background database calls back to the GUI thread.
+    """
+
+    finished = Signal(object, object)
+
+    def __init__(self):
+        super().__init__()
+        self.finished.connect(self._dispatch)
+
+    @Slot(object, object)
+    def _dispatch(self, callback, result):
+        try:
+            callback(result)
+        except RuntimeError:
+            # The receiving widget was closed before the result arrived.
+            pass
+
+
+_relay = None
+
+
+def run_db_async(db, callback, fn, *args, on_error=None):
+    """
+    Run fn(*args) on the DatabaseManager executor and deliver its result to
+    callback on the GUI thread. If fn raises, on_error (when given) is
+    called with the exception instead.
+    """
+    global _relay
+    if _relay is None:
+        _relay = _AsyncRelay()
+    relay = _relay
+
+    def _done(future):
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            print(f"Error in background query: {exc}")
+            if on_error is not None:
+                relay.finished.emit(on_error, exc)
+            return
+        relay.finished.emit(callback, future.result())
+
+    future = db.run_async(fn, *args)
+    future.add_done_callback(_done)
+    return future
+
+
+class _FSDialogMixin:
+    """
+    Shared full-screen presentation for frameless dialogs and the main window.
+    """
+
+    def _ensure_fullscreen(self):
+        """
+        Re-enter full screen only when a child dialog actually dropped us out,
+        sparing the window-manager round-trip and relayout otherwise.
+        """
+        if not self.isFullScreen():
+            self.showFullScreen()
+
+    def _show_fs(self):
+        self._ensure_fullscreen()
+        QTimer.singleShot(0, self._raise_and_activate)
+
+    def _raise_and_activate(self):
+        self.raise_()
+        self.activateWindow()
+
+
+class Debouncer(QObject):
+    """
+    Coalesces bursts of calls (e.g. keystrokes) into a single trailing call.
+    """
+
+    def __init__(self, callback, delay=250, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._fire)
+
+    def trigger(self, *_args):
+        """
+        Restart the countdown; the callback runs once input goes quiet.
+        """
+        self._timer.start()
+
+    def cancel(self):
+        """
+        Drop a pending callback without running it.
+        """
+        self._timer.stop()
+
+    def is_pending(self):
+        """
+        True while a callback is waiting for input to go quiet.
+        """
+        return self._timer.isActive()
+
+    def flush(self):
+        """
+        Run a pending callback immediately.
+        """
+        if self._timer.isActive():
+            self._timer.stop()
+            self._fire()
+
+    def _fire(self):
+        self._callback()
+
+
+class ListTableModel(QAbstractTableModel):
+    """
+    Read-mostly table model over a list of database row tuples.
+
+    Each entry in `columns` maps a row tuple to its display text; a None
+    entry marks a column painted by a delegate (e.g. an action button).
+    With columns=None the rows are already formatted and shown as-is.
+    `editable` maps a column to the tuple index its edits are written to.
+    """
+
+    def __init__(self, headers, columns=None, editable=None, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        if columns is None:
+            columns = [(lambda r, i=i: r[i]) for i in range(len(self._headers))]
+        self._columns = list(columns)
+        self._editable = editable or {}
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            fmt = self._columns[index.column()]
+            return fmt(self._rows[index.row()]) if fmt else None
+        if role == Qt.UserRole:
+            return self._rows[index.row()]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        field = self._editable.get(index.column())
+        if role != Qt.EditRole or field is None:
+            return False
+        row = list(self._rows[index.row()])
+        row[field] = value
+        self._rows[index.row()] = tuple(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() in self._editable:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows):
+        """
+        Replace the model contents in a single reset.
+        """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """
+        Add rows at the end without resetting the view.
+        """
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def row_data(self, row):
+        return self._rows[row]
+
+    @property
+    def rows(self):
+        return self._rows
+
+
+class FetchMoreTableModel(ListTableModel):
+    """
+    ListTableModel fed from the iterator returned by `fetch(after)`, pulling
+    the next batch only when the view scrolls near the end. `after` is the
+    last loaded row, or None for the first batch.
+
+    A generator source is closed once exhausted, on reload, on close() and
+    after `idle_ms` without a fetch, so a database cursor is not held while
+    nobody scrolls. The next fetchMore() then resumes with a fresh source.
+    """
+
+    def __init__(
+        self, headers, fetch, columns=None, batch_size=100, idle_ms=5000, parent=None
+    ):
+        super().__init__(headers, columns, parent=parent)
+        self._fetch = fetch
+        self._batch_size = batch_size
+        self._source = None
+        self._has_more = False
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(idle_ms)
+        self._idle_timer.timeout.connect(self.close)
+
+    def reload(self):
+        """
+        Drop loaded rows, restart the source and fetch its first batch.
+        """
+        self.close()
+        self.set_rows([])
+        self._has_more = True
+        self.fetchMore()
+
+    def close(self):
+        """
+        Release the current source (e.g. its database cursor).
+        """
+        self._idle_timer.stop()
+        source, self._source = self._source, None
+        if source is not None and hasattr(source, "close"):
+            source.close()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+        if self._source is None:
+            self._source = iter(self._fetch(self._rows[-1] if self._rows else None))
+        rows = list(itertools.islice(self._source, self._batch_size))
+        if len(rows) < self._batch_size:
+            self._has_more = False
+            self.close()
+        else:
+            self._idle_timer.start()
+        self.append_rows(rows)
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    Paints a push button in a table column and reports clicks by row,
+    avoiding a real QPushButton cell widget and signal connection per row.
+    Space on the focused cell activates it like a click.
+    """
+
+    clicked = Signal(int)
+
+    def __init__(self, text, parent=None, object_name=None):
+        super().__init__(parent)
+        self._text = text
+        # Hidden prototype so the application stylesheet (including
+        # #btnDelete-style object names) is applied to the painted button.
+        self._proto = QPushButton(text, parent)
+        if object_name:
+            self._proto.setObjectName(object_name)
+        self._proto.hide()
+        self._pressed = None
+        if isinstance(parent, QAbstractItemView):
+            # A release outside our cells (or off the view) never reaches
+            # editorEvent, so watch the view and its viewport to un-sink
+            # the button.
+            self._viewport = parent.viewport()
+            self._viewport.installEventFilter(self)
+            parent.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        etype = event.type()
+        if self._pressed is not None and etype in (
+            QEvent.MouseButtonRelease,
+            QEvent.Leave,
+            QEvent.FocusOut,
+        ):
+            # Deferred so a release over the pressed cell is still seen by
+            # editorEvent as a click first.
+            QTimer.singleShot(0, self._clear_pressed)
+        return False
+
+    def _clear_pressed(self):
+        if self._pressed is not None:
+            self._pressed = None
+            self._viewport.update()
+
+    def paint(self, painter, option, index):
+        self._proto.ensurePolished()
+        opt = QStyleOptionButton()
+        opt.initFrom(self._proto)
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.text = self._text
+        opt.state = QStyle.State_Enabled
+        if self._pressed == (index.row(), index.column()):
+            opt.state |= QStyle.State_Sunken
+        else:
+            opt.state |= QStyle.State_Raised
+        if option.state & QStyle.State_MouseOver:
+            opt.state |= QStyle.State_MouseOver
+        self._proto.style().drawControl(
+            QStyle.CE_PushButton, opt, painter, self._proto
+        )
+
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            if event.button() != Qt.LeftButton:
+                return False
+            inside = option.rect.contains(event.position().toPoint())
+            cell = (index.row(), index.column())
+            if etype == QEvent.MouseButtonPress:
+                self._pressed = cell if inside else None
+                return inside
+            was_pressed, self._pressed = self._pressed == cell, None
+            if inside and was_pressed:
+                self.clicked.emit(index.row())
+            return inside
+        if etype == QEvent.KeyPress and event.key() == Qt.Key_Space:
+            self.clicked.emit(index.row())
+            return True
+        return False
+
+    def createEditor(self, parent, option, index):
+        return None
+
+
+class PageBar(QWidget):
+    """
+    Prev/Next navigation for lists fetched from the database one page at a
+    time. Callers request `limit` rows (one more than a page, to detect
+    whether a next page exists) and pass the result through `take()`.
+    """
+
+    page_changed = Signal()
+
+    def __init__(self, page_size=200, parent=None):
+        super().__init__(parent)
+        self.page_size = page_size
+        self.page = 0
+        self._prev_btn = QPushButton("< &Prev")
+        self._next_btn = QPushButton("&Next >")
+        self._label = QLabel()
+        self._prev_btn.clicked.connect(lambda: self._go(-1))
+        self._next_btn.clicked.connect(lambda: self._go(1))
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addStretch()
+        layout.addWidget(self._prev_btn)
+        layout.addWidget(self._label)
+        layout.addWidget(self._next_btn)
+
+    @property
+    def limit(self):
+        return self.page_size + 1
+
+    @property
+    def offset(self):
+        return self.page * self.page_size
+
+    def reset(self, *_args):
+        self.page = 0
+
+    def take(self, rows):
+        """
+        Update the navigation state from a fetched page and return the rows
+        to display.
+        """
+        has_more = len(rows) > self.page_size
+        self._prev_btn.setEnabled(self.page > 0)
+        self._next_btn.setEnabled(has_more)
+        self._label.setText(f"Page {self.page + 1}")
+        return rows[: self.page_size]
+
+    def _go(self, delta):
+        self.page = max(0, self.page + delta)
+        self.page_changed.emit()
+
+
+@contextmanager
+def suspended_table(table):
+    """
+    Suspend repaints, signals and sorting on a QTableWidget while the caller
+    adds or rewrites many rows.
+    """
+    sorting = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    blocked = table.blockSignals(True)
     try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = get_app_path()
-    return os.path.join(base_path, relative_path)
+        yield table
+    finally:
+        table.blockSignals(blocked)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting)
+
+
+@contextmanager
+def batch_table_fill(table, row_count):
+    """
+    Pre-size a QTableWidget for a full reload and suspend repaints, signals
+    and sorting while the caller fills it with setItem().
+    """
+    with suspended_table(table):
+        table.clearContents()
+        table.setRowCount(row_count)
+        yield table
+
+
+def set_fixed_columns(table, widths, stretch_col):
+    """
+    Give every column a fixed pixel width except `stretch_col`, so the
+    header never has to measure cell contents.
+    """
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    for col, width in widths.items():
+        table.setColumnWidth(col, width)
+    header.setSectionResizeMode(stretch_col, QHeaderView.Stretch)
 
 
-class ProductSearchDialog(QDialog):
+def make_list_view(model, action_col=None, action_text="", action_name=None):
+    """
+    Build a QTableView over `model`, optionally with a delegate-painted
+    action button column. Returns (view, delegate).
+    """
+    view = QTableView()
+    view.setModel(model)
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setMouseTracking(True)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    delegate = None
+    if action_col is not None:
+        delegate = ActionButtonDelegate(action_text, view, action_name)
+        view.setItemDelegateForColumn(action_col, delegate)
+    return view, delegate
+
+
+class ProductSearchDialog(_FSDialogMixin, QDialog):
     """
     Enhanced full-screen product search and selection interface.
     """
@@ -74,9 +663,9 @@ class ProductSearchDialog(QDialog):
         self.setWindowTitle("Product Selection")
         self.db = db_manager
         self.selected_product = None
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+        self._load_seq = 0
+        self._results = {}
+        self._select_first_on_load = False
 
         layout = QVBoxLayout(self)
 
@@ -91,19 +680,25 @@ class ProductSearchDialog(QDialog):
         )
         self.search_input.setFixedHeight(50)
         self.search_input.setStyleSheet("font-size: 18pt; padding: 5px;")
-        self.search_input.textChanged.connect(self.load_products)
+        self._search_debounce = Debouncer(self.load_products, 150, self)
+        self.search_input.textChanged.connect(self._search_debounce.trigger)
         search_box.addWidget(self.search_input)
 
         layout.addLayout(search_box)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(
-            ["Name", "Barcode", "MRP", "Rate", "UOM", "Category"]
+        self.model = ListTableModel(
+            ["Name", "Barcode", "MRP", "Rate", "UOM", "Category"],
+            [
+                lambda p: str(p[1]),
+                lambda p: str(p[2]),
+                lambda p: _FMT2(float(p[3])),
+                lambda p: _FMT2(float(p[4])),
+                lambda p: str(p[6]),
+                lambda p: str(p[5]),
+            ],
+            parent=self,
         )
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table, _ = make_list_view(self.model)
         self.table.verticalHeader().setDefaultSectionSize(45)
         self.table.doubleClicked.connect(self.select_product)
         layout.addWidget(self.table)
@@ -116,16 +711,23 @@ class ProductSearchDialog(QDialog):
         self.load_products()
         self.search_input.setFocus()
         self.search_input.installEventFilter(self)
+        self._show_fs()
 
     def eventFilter(self, source, event):
         if event.type() == QEvent.KeyPress and source is self.search_input:
             if event.key() == Qt.Key_Down:
                 self.table.setFocus()
-                if self.table.rowCount() > 0:
+                if self.model.rowCount() > 0:
                     self.table.selectRow(0)
                 return True
             if event.key() in (Qt.Key_Return, Qt.Key_Enter):
-                if self.table.rowCount() > 0:
+                if self._search_debounce.is_pending():
+                    # Pick the first match for what was typed, not the
+                    # results still showing for an earlier prefix.
+                    self._select_first_on_load = True
+                    self._search_debounce.flush()
+                    return True
+                if self.model.rowCount() > 0:
                     self.table.selectRow(0)
                     self.select_product()
                     return True
@@ -141,29 +743,42 @@ class ProductSearchDialog(QDialog):
 
     def load_products(self):
         query = self.search_input.text().strip()
-        products = (
-            self.db.search_products(query) if query else self.db.get_all_products()
+        self._load_seq += 1
+        seq = self._load_seq
+        cached = self._results.get(query)
+        if cached is not None:
+            self._on_products(seq, query, cached)
+            return
+        fetch = (
+            (self.db.search_products, query)
+            if query
+            else (self.db.get_all_products_cached,)
+        )
+        run_db_async(
+            self.db, lambda rows: self._on_products(seq, query, rows), *fetch
         )
 
-        self.table.setRowCount(0)
-        for row, prod in enumerate(products):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(str(prod[1])))
-            self.table.setItem(row, 1, QTableWidgetItem(str(prod[2])))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{float(prod[3]):.2f}"))
-            self.table.setItem(row, 3, QTableWidgetItem(f"{float(prod[4]):.2f}"))
-            self.table.setItem(row, 4, QTableWidgetItem(str(prod[6])))
-            self.table.setItem(row, 5, QTableWidgetItem(str(prod[5])))
-            self.table.item(row, 0).setData(Qt.UserRole, prod)
+    def _on_products(self, seq, query, products):
+        # Kept for this dialog's lifetime, so backspacing to an earlier
+        # prefix redraws without another query.
+        self._results[query] = products
+        if seq != self._load_seq:
+            return
+        self.model.set_rows(products)
+        if self._select_first_on_load:
+            self._select_first_on_load = False
+            if products:
+                self.table.selectRow(0)
+                self.select_product()
 
     def select_product(self):
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row >= 0:
-            self.selected_product = self.table.item(row, 0).data(Qt.UserRole)
+            self.selected_product = self.model.row_data(row)
             self.accept()
 
 
-class RecycleBinDialog(QDialog):
+class RecycleBinDialog(_FSDialogMixin, QDialog):
     """
     View and restore deleted items.
     """
@@ -173,42 +788,40 @@ class RecycleBinDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle("Recycle Bin - Items deleted in last 30 days")
         self.db = db_manager
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
         self.label = QLabel("Items in Recycle Bin (Auto-purged after 30 days)")
         self.label.setObjectName("danger")
         layout.addWidget(self.label)
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(
-            ["Name", "Barcode", "Deleted At", "Restore"]
+        self.model = ListTableModel(
+            ["Name", "Barcode", "Deleted At", "Restore"],
+            [
+                lambda p: str(p[1]),
+                lambda p: str(p[2]),
+                lambda p: p[7].strftime("%d-%m-%Y %H:%M"),
+                None,
+            ],
+            parent=self,
         )
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table, restore_delegate = make_list_view(
+            self.model, 3, "Restore", "btnRestore"
+        )
+        restore_delegate.clicked.connect(self.restore_row)
+        set_fixed_columns(self.table, {1: 200, 2: 180, 3: 140}, 0)
         layout.addWidget(self.table)
         self.load_deleted_products()
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
+        self._show_fs()
 
     def load_deleted_products(self):
         """
         Refresh the list of items currently in the recycle bin.
         """
-        products = self.db.get_deleted_products()
-        self.table.setRowCount(0)
-        for row, p in enumerate(products):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(str(p[1])))
-            self.table.setItem(row, 1, QTableWidgetItem(str(p[2])))
-            self.table.setItem(
-                row, 2, QTableWidgetItem(p[7].strftime("%d-%m-%Y %H:%M"))
-            )
-            res_btn = QPushButton("Restore")
-            res_btn.setObjectName("btnRestore")
-            res_btn.clicked.connect(lambda _, pid=p[0]: self.restore_item(pid))
-            self.table.setCellWidget(row, 3, res_btn)
+        run_db_async(self.db, self.model.set_rows, self.db.get_deleted_products)
+
+    def restore_row(self, row):
+        self.restore_item(self.model.row_data(row)[0])
 
     def restore_item(self, pid):
         """
@@ -225,7 +838,7 @@ class RecycleBinDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class SchemeEntryDialog(QDialog):
+class SchemeEntryDialog(_FSDialogMixin, QDialog):
     """
     Interface for creating and editing promotional schemes with an Excel-style grid.
     """
@@ -236,9 +849,7 @@ class SchemeEntryDialog(QDialog):
         title = "Modify Scheme" if scheme_id else "Add New Scheme"
         self.setWindowTitle(title)
         self.db, self.scheme_id = db_manager, scheme_id
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+        self._uom_names = ["<All UOMs>"]
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -302,6 +913,9 @@ class SchemeEntryDialog(QDialog):
         self.items_list.setItemDelegateForColumn(
             0, FuzzyCompleterDelegate(self.db, self.items_list)
         )
+        del_delegate = ActionButtonDelegate("Del", self.items_list, "btnDelete")
+        del_delegate.clicked.connect(self.items_list.removeRow)
+        self.items_list.setItemDelegateForColumn(8, del_delegate)
         self.items_list.installEventFilter(self)
         grid_container.addWidget(self.items_list)
 
@@ -324,6 +938,7 @@ class SchemeEntryDialog(QDialog):
         footer.addWidget(cancel_btn)
         main_layout.addLayout(footer)
 
+        run_db_async(self.db, self._on_uoms_loaded, self.db.get_uoms_cached)
         if self.scheme_id:
             self.load_scheme_data()
         else:
@@ -338,6 +953,7 @@ class SchemeEntryDialog(QDialog):
         s_esc.setShortcut("Esc")
         s_esc.triggered.connect(self.close)
         self.addAction(s_esc)
+        self._show_fs()
 
     def eventFilter(self, source, event):
         if source is self.items_list and event.type() == QEvent.KeyPress:
@@ -397,47 +1013,74 @@ class SchemeEntryDialog(QDialog):
             row, 4, QTableWidgetItem(f"{max_q:.3f}" if max_q > 0 else "∞")
         )
         uom_combo = QComboBox()
-        uoms = ["<All UOMs>"] + [u[1] for u in self.db.get_uoms()]
-        uom_combo.addItems(uoms)
+        uom_combo.addItems(self._uom_names)
         if isinstance(uom, str):
             idx = uom_combo.findText(uom)
-            if idx >= 0:
-                uom_combo.setCurrentIndex(idx)
+            if idx < 0:
+                uom_combo.addItem(uom)
+                idx = uom_combo.count() - 1
+            uom_combo.setCurrentIndex(idx)
         self.items_list.setCellWidget(row, 5, uom_combo)
         type_combo = QComboBox()
         type_combo.addItems(["Percent (%)", "Flat Amt (Rs)", "Fixed Rate"])
         type_combo.setCurrentIndex(b_idx)
         self.items_list.setCellWidget(row, 6, type_combo)
         self.items_list.setItem(row, 7, QTableWidgetItem(f"{val:.3f}"))
-        del_btn = QPushButton("Del")
-        del_btn.setObjectName("btnDelete")
-        del_btn.clicked.connect(
-            lambda: self.items_list.removeRow(self.items_list.currentRow())
-        )
-        self.items_list.setCellWidget(row, 8, del_btn)
+        self.items_list.setItem(row, 8, _ro_item(""))
 
-    def load_scheme_data(self):
+    def _on_uoms_loaded(self, uoms):
+        """
+        Fill the UOM dropdowns once the unit list arrives from the database.
+        """
+        self._uom_names = ["<All UOMs>"] + [u[1] for u in uoms]
+        for r in range(self.items_list.rowCount()):
+            combo = self.items_list.cellWidget(r, 5)
+            if not combo:
+                continue
+            current = combo.currentText()
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(self._uom_names)
+            idx = combo.findText(current)
+            if idx < 0:
+                combo.addItem(current)
+                idx = combo.count() - 1
+            combo.setCurrentIndex(idx)
+            combo.blockSignals(False)
+
+    def _fetch_scheme_data(self):
         header = next(
-            (s for s in self.db.get_schemes() if s[0] == self.scheme_id), None
+            (s for s in self.db.get_schemes_cached() if s[0] == self.scheme_id),
+            None,
         )
+        return header, self.db.get_scheme_rules(self.scheme_id)
+
+    def load_scheme_data(self):
+        run_db_async(self.db, self._on_scheme_data, self._fetch_scheme_data)
+
+    def _on_scheme_data(self, data):
+        header, rules = data
         if header:
             self.scheme_name.setText(header[1])
             if header[2]:
                 self.valid_from.setDate(header[2])
             if header[3]:
                 self.valid_to.setDate(header[3])
-        for r in self.db.get_scheme_rules(self.scheme_id):
-            b_idx = 0 if r[6] == "percent" else 1 if r[6] == "amount" else 2
-            self._add_row_to_table(
-                r[1],
-                r[0],
-                float(r[8]) if r[8] is not None else 0.0,
-                float(r[3]),
-                float(r[4]) if r[4] else 0,
-                r[5] or "<All UOMs>",
-                b_idx,
-                float(r[7]),
-            )
+        # Signals stay blocked so handle_item_change does not re-resolve
+        # each rule's product while its row is being built.
+        with suspended_table(self.items_list):
+            for r in rules:
+                b_idx = 0 if r[6] == "percent" else 1 if r[6] == "amount" else 2
+                self._add_row_to_table(
+                    r[1],
+                    r[0],
+                    float(r[8]) if r[8] is not None else 0.0,
+                    float(r[3]),
+                    float(r[4]) if r[4] else 0,
+                    r[5] or "<All UOMs>",
+                    b_idx,
+                    float(r[7]),
+                )
 
     def save_scheme(self):
         name = self.scheme_name.text()
@@ -504,7 +1147,7 @@ class SchemeEntryDialog(QDialog):
             self.accept()
 
 
-class SchemeListDialog(QDialog):
+class SchemeListDialog(_FSDialogMixin, QDialog):
     """
     List and manage existing promotional schemes.
     """
@@ -514,28 +1157,42 @@ class SchemeListDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle("Scheme List")
         self.db, self.mode = db_manager, mode
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            ["ID", "Scheme Name", "Date Range", "Included Items", "Action"]
+        self.model = ListTableModel(
+            ["ID", "Scheme Name", "Date Range", "Included Items", "Action"],
+            [
+                lambda s: str(s[0]),
+                lambda s: s[1],
+                lambda s: f"{s[2].strftime(_DATE)} to {s[3].strftime(_DATE)}",
+                lambda s: s[4],
+                None,
+            ],
+            parent=self,
         )
-        self.table.setColumnHidden(0, True)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        if self.mode == "modify":
+        if self.mode == "list":
+            self.table, action_delegate = make_list_view(
+                self.model, 4, "Del", "btnCancel"
+            )
+            action_delegate.clicked.connect(
+                lambda row: self.delete_scheme(self.model.row_data(row)[0])
+            )
+        else:
+            self.table, action_delegate = make_list_view(
+                self.model, 4, "Modify", "btnSave"
+            )
+            action_delegate.clicked.connect(
+                lambda row: self.open_modify(self.model.row_data(row)[0])
+            )
             self.table.doubleClicked.connect(self.modify_selected)
+        self.table.setColumnHidden(0, True)
+        set_fixed_columns(self.table, {1: 260, 2: 240, 4: 120}, 3)
         layout.addWidget(self.table)
         self.load_schemes()
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
         self.table.setFocus()
-        if self.table.rowCount() > 0:
-            self.table.selectRow(0)
+        self._show_fs()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
@@ -544,10 +1201,9 @@ class SchemeListDialog(QDialog):
             if self.mode == "modify":
                 self.modify_selected()
             else:
-                row = self.table.currentRow()
+                row = self.table.currentIndex().row()
                 if row >= 0:
-                    sid = int(self.table.item(row, 0).text())
-                    self.delete_scheme(sid)
+                    self.delete_scheme(self.model.row_data(row)[0])
         else:
             super().keyPressEvent(event)
 
@@ -555,25 +1211,12 @@ class SchemeListDialog(QDialog):
         """
         Refresh the list of promotional schemes from the database.
         """
-        self.table.setRowCount(0)
-        for row, s in enumerate(self.db.get_schemes()):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(str(s[0])))
-            self.table.setItem(row, 1, QTableWidgetItem(s[1]))
-            date_range = f"{s[2].strftime('%d-%m-%Y')} to {s[3].strftime('%d-%m-%Y')}"
-            self.table.setItem(row, 2, QTableWidgetItem(date_range))
-            self.table.setItem(row, 3, QTableWidgetItem(s[4]))
-            btn = QPushButton("&Del" if self.mode == "list" else "&Modify")
-            if self.mode == "list":
-                btn.setObjectName("btnCancel")
-            else:
-                btn.setObjectName("btnSave")
-            btn.clicked.connect(
-                lambda _, sid=s[0]: self.delete_scheme(sid)
-                if self.mode == "list"
-                else self.open_modify(sid)
-            )
-            self.table.setCellWidget(row, 4, btn)
+        run_db_async(self.db, self._on_schemes, self.db.get_schemes_cached)
+
+    def _on_schemes(self, schemes):
+        self.model.set_rows(schemes)
+        if schemes and self.table.currentIndex().row() < 0:
+            self.table.selectRow(0)
 
     def delete_scheme(self, sid):
         """
@@ -587,21 +1230,21 @@ class SchemeListDialog(QDialog):
         """
         Open the edit dialog for the currently selected scheme.
         """
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row >= 0:
-            self.open_modify(int(self.table.item(row, 0).text()))
+            self.open_modify(self.model.row_data(row)[0])
 
     def open_modify(self, sid):
         """
         Open SchemeEntryDialog for the given scheme ID.
         """
         res = SchemeEntryDialog(self.db, scheme_id=sid, parent=self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
         if res == QDialog.Accepted:
             self.load_schemes()
 
 
-class UOMMasterDialog(QDialog):
+class UOMMasterDialog(_FSDialogMixin, QDialog):
     """
     Management interface for Units of Measure.
     """
@@ -611,9 +1254,6 @@ class UOMMasterDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle("UOM Master")
         self.db = db_manager
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
         input_layout = QHBoxLayout()
         self.uom_input = QLineEdit()
@@ -629,15 +1269,22 @@ class UOMMasterDialog(QDialog):
         input_layout.addWidget(self.alias_input)
         input_layout.addWidget(add_btn)
         layout.addLayout(input_layout)
-        self.list_widget = QTableWidget()
-        self.list_widget.setColumnCount(3)
-        self.list_widget.setHorizontalHeaderLabels(["UOM Name", "Alias", "Action"])
-        self.list_widget.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.model = ListTableModel(
+            ["UOM Name", "Alias", "Action"],
+            [lambda u: u[1], lambda u: u[2] or "", None],
+            parent=self,
+        )
+        self.list_widget, del_delegate = make_list_view(self.model, 2, "Del")
+        del_delegate.clicked.connect(
+            lambda row: self.delete_uom(self.model.row_data(row)[1])
+        )
+        set_fixed_columns(self.list_widget, {1: 200, 2: 120}, 0)
         layout.addWidget(self.list_widget)
         self.load_uoms()
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
+        self._show_fs()
 
     def add_uom(self):
         """
@@ -655,14 +1302,7 @@ class UOMMasterDialog(QDialog):
         """
         Refresh the list of Units of Measure from the database.
         """
-        self.list_widget.setRowCount(0)
-        for row, u in enumerate(self.db.get_uoms()):
-            self.list_widget.insertRow(row)
-            self.list_widget.setItem(row, 0, QTableWidgetItem(u[1]))
-            self.list_widget.setItem(row, 1, QTableWidgetItem(u[2] or ""))
-            del_btn = QPushButton("&Del")
-            del_btn.clicked.connect(lambda _, name=u[1]: self.delete_uom(name))
-            self.list_widget.setCellWidget(row, 2, del_btn)
+        run_db_async(self.db, self.model.set_rows, self.db.get_uoms_cached)
 
     def delete_uom(self, name):
         """
@@ -682,7 +1322,7 @@ class UOMMasterDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class LanguageMasterDialog(QDialog):
+class LanguageMasterDialog(_FSDialogMixin, QDialog):
     """
     Management interface for supported languages.
     """
@@ -692,9 +1332,6 @@ class LanguageMasterDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle("Language Master")
         self.db = db_manager
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
         input_layout = QHBoxLayout()
         self.lang_input = QLineEdit()
@@ -709,15 +1346,24 @@ class LanguageMasterDialog(QDialog):
         input_layout.addWidget(self.code_input)
         input_layout.addWidget(add_btn)
         layout.addLayout(input_layout)
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Name", "Code", "Translations", "Action"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.model = ListTableModel(
+            ["Name", "Code", "Action"],
+            [lambda lang: lang[1], lambda lang: lang[2] or "", None],
+            parent=self,
+        )
+        self.table, del_delegate = make_list_view(
+            self.model, 2, "Delete", "btnDelete"
+        )
+        del_delegate.clicked.connect(
+            lambda row: self.delete_lang(self.model.row_data(row)[0])
+        )
+        set_fixed_columns(self.table, {1: 120, 2: 120}, 0)
         layout.addWidget(self.table)
         self.load_langs()
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
+        self._show_fs()
 
     def add_lang(self):
         """
@@ -735,22 +1381,14 @@ class LanguageMasterDialog(QDialog):
         """
         Refresh the list of supported languages from the database.
         """
-        self.table.setRowCount(0)
-        for row, lang in enumerate(self.db.get_languages()):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(lang[1]))
-            self.table.setItem(row, 1, QTableWidgetItem(lang[2]))
-            res_btn = QPushButton("Delete")
-            res_btn.setObjectName("btnDelete")
-            res_btn.clicked.connect(lambda _, lid=lang[0]: self.delete_language(lid))
-            self.table.setCellWidget(row, 2, res_btn)
+        self.model.set_rows(self.db.get_languages_cached())
 
     def open_translations(self, lid, lname):
         """
         Open the translation manager for the selected language.
         """
         TranslationManagerDialog(self.db, lid, lname, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def delete_lang(self, lid):
         """
@@ -1106,7 +1744,7 @@ class CreateCompanyDialog(QDialog):
             )
 
 
-class CompanySelectionDialog(QDialog):
+class CompanySelectionDialog(_FSDialogMixin, QDialog):
     """
     Dialog to select company and financial year (Database).
     """
@@ -1118,17 +1756,14 @@ class CompanySelectionDialog(QDialog):
         self.selected_db = None
 
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
-        self.showFullScreen()
 
         layout = QVBoxLayout(self)
 
         self.splash_label = QLabel()
         theme = QApplication.instance().property("theme_name") or "mocha"
-        pixmap = QPixmap(resource_path(f"svg/logo_{theme}.svg"))
+        pixmap = _cached_logo(theme, 200)
         if not pixmap.isNull():
-            self.splash_label.setPixmap(
-                pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self.splash_label.setPixmap(pixmap)
             self.splash_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(self.splash_label)
 
@@ -1162,6 +1797,7 @@ class CompanySelectionDialog(QDialog):
         layout.addLayout(btn_layout)
 
         self.load_databases()
+        self._show_fs()
 
     def load_databases(self):
         self.list_widget.clear()
@@ -1234,11 +1870,9 @@ class LoginDialog(QDialog):
         layout = QVBoxLayout(self)
         self.splash_label = QLabel()
         theme = QApplication.instance().property("theme_name") or "mocha"
-        pixmap = QPixmap(resource_path(f"svg/logo_{theme}.svg"))
+        pixmap = _cached_logo(theme, 350)
         if not pixmap.isNull():
-            self.splash_label.setPixmap(
-                pixmap.scaled(350, 350, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self.splash_label.setPixmap(pixmap)
             self.splash_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(self.splash_label)
         title = QLabel("System Login")
@@ -1294,11 +1928,9 @@ class SuperUserCreationDialog(QDialog):
         layout = QVBoxLayout(self)
         self.splash_label = QLabel()
         theme = QApplication.instance().property("theme_name") or "mocha"
-        pixmap = QPixmap(resource_path(f"svg/logo_{theme}.svg"))
+        pixmap = _cached_logo(theme, 350)
         if not pixmap.isNull():
-            self.splash_label.setPixmap(
-                pixmap.scaled(350, 350, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            self.splash_label.setPixmap(pixmap)
             self.splash_label.setAlignment(Qt.AlignCenter)
             layout.addWidget(self.splash_label)
         title = QLabel("Create Admin Account")
@@ -1349,7 +1981,7 @@ class SuperUserCreationDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class UserMasterDialog(QDialog):
+class UserMasterDialog(_FSDialogMixin, QDialog):
     """
     Management interface for user accounts with granular permissions.
     """
@@ -1359,9 +1991,6 @@ class UserMasterDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle("User Master")
         self.db = db_manager
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
 
         layout = QVBoxLayout(self)
 
@@ -1418,7 +2047,7 @@ class UserMasterDialog(QDialog):
         form_layout.addWidget(self.perm_grp)
 
         btn_layout = QHBoxLayout()
-        save_btn = QPushButton("Save User (F2)")
+        self.save_btn = save_btn = QPushButton("Save User (F2)")
         save_btn.clicked.connect(self.save_user)
         save_btn.setObjectName("btnSave")
         clear_btn = QPushButton("Clear/New")
@@ -1429,21 +2058,27 @@ class UserMasterDialog(QDialog):
         form_layout.addLayout(btn_layout)
         layout.addWidget(form_widget)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(
-            ["Username", "Full Name", "Role", "Action"]
+        self.model = ListTableModel(
+            ["Username", "Full Name", "Role"],
+            [lambda u: u[1], lambda u: u[2] or "", lambda u: u[3]],
+            parent=self,
         )
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.itemClicked.connect(self.load_selected_user)
+        self.table, _ = make_list_view(self.model)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.clicked.connect(self.load_selected_user)
         layout.addWidget(self.table)
 
+        del_btn = QPushButton("&Delete Selected (Del)")
+        del_btn.setObjectName("btnDelete")
+        del_btn.clicked.connect(self.delete_selected_users)
+        layout.addWidget(del_btn)
+
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
 
         self.load_users()
+        self._show_fs()
 
     def on_role_change(self, role):
         defaults = {
@@ -1481,21 +2116,32 @@ class UserMasterDialog(QDialog):
             QMessageBox.information(self, "Info", "Password not changed.")
             return
 
-        if self.db.add_user(username, pwd, self.full_name.text(), role, perms):
+        self.save_btn.setEnabled(False)
+        run_db_async(
+            self.db,
+            self._on_user_saved,
+            self.db.add_user,
+            username,
+            pwd,
+            self.full_name.text(),
+            role,
+            perms,
+            on_error=lambda _exc: self.save_btn.setEnabled(True),
+        )
+
+    def _on_user_saved(self, success):
+        self.save_btn.setEnabled(True)
+        if success:
             self.clear_form()
             self.load_users()
             QMessageBox.information(self, "Success", "User saved.")
 
     def is_editing_mode(self):
         current = self.username.text()
-        for r in range(self.table.rowCount()):
-            if self.table.item(r, 0).text() == current:
-                return True
-        return False
+        return any(u[1] == current for u in self.model.rows)
 
-    def load_selected_user(self, item):
-        row = item.row()
-        user_data = self.table.item(row, 0).data(Qt.UserRole)
+    def load_selected_user(self, index):
+        user_data = self.model.row_data(index.row())
 
         self.username.setText(user_data[1])
         self.full_name.setText(user_data[2] or "")
@@ -1522,30 +2168,31 @@ class UserMasterDialog(QDialog):
         self.on_role_change("cashier")  # Reset perms
 
     def load_users(self):
-        self.table.setRowCount(0)
-        for row, u in enumerate(self.db.get_users()):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(u[1]))
-            self.table.item(row, 0).setData(Qt.UserRole, u)  # Store full object
-            self.table.setItem(row, 1, QTableWidgetItem(u[2] or ""))
-            self.table.setItem(row, 2, QTableWidgetItem(u[3]))
-            del_btn = QPushButton("Del")
-            del_btn.clicked.connect(lambda _, uid=u[0]: self.delete_user(uid))
-            self.table.setCellWidget(row, 3, del_btn)
-
-    def delete_user(self, uid):
-        if QMessageBox.question(self, "Confirm", "Delete User?") == QMessageBox.Yes:
-            self.db.delete_user(uid)
+        self.model.set_rows(self.db.get_users())
+
+    def delete_selected_users(self):
+        """
+        Delete every selected user after a single confirmation.
+        """
+        rows = sorted({idx.row() for idx in self.table.selectionModel().selectedRows()})
+        if not rows:
+            return
+        ids = [self.model.row_data(r)[0] for r in rows]
+        msg = "Delete User?" if len(ids) == 1 else f"Delete {len(ids)} users?"
+        if QMessageBox.question(self, "Confirm", msg) == QMessageBox.Yes:
+            self.db.delete_users(ids)
             self.load_users()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
             self.close()
+        elif event.key() == Qt.Key_Delete and self.table.hasFocus():
+            self.delete_selected_users()
         else:
             super().keyPressEvent(event)
 
 
-class CustomerMasterDialog(QDialog):
+class CustomerMasterDialog(_FSDialogMixin, QDialog):
     """
     Management interface for the customer database.
     """
@@ -1555,9 +2202,6 @@ class CustomerMasterDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle("Customer Master")
         self.db = db_manager
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
         form = QFormLayout()
         self.name = QLineEdit()
@@ -1568,30 +2212,44 @@ class CustomerMasterDialog(QDialog):
         form.addRow("Mobile Number:", self.mobile)
         form.addRow("Address:", self.address)
         form.addRow("Email:", self.email)
-        add_btn = QPushButton("Add &Customer")
-        add_btn.clicked.connect(self.add_customer)
-        form.addRow(add_btn)
+        self.add_btn = QPushButton("Add &Customer")
+        self.add_btn.clicked.connect(self.add_customer)
+        form.addRow(self.add_btn)
         layout.addLayout(form)
         search_layout = QHBoxLayout()
         self.master_search_input = QLineEdit()
         self.master_search_input.setPlaceholderText(
             "Search Customer by Name or Mobile..."
         )
-        self.master_search_input.textChanged.connect(self.load_customers)
+        self.pager = PageBar(parent=self)
+        self.pager.page_changed.connect(self.load_customers)
+        self._load_seq = 0
+        self._search_debounce = Debouncer(self.load_customers, 250, self)
+        self.master_search_input.textChanged.connect(self.pager.reset)
+        self.master_search_input.textChanged.connect(self._search_debounce.trigger)
         search_layout.addWidget(QLabel("Search:"))
         search_layout.addWidget(self.master_search_input)
         layout.addLayout(search_layout)
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            ["Name", "Mobile", "Address", "Email", "Action"]
+        self.model = ListTableModel(
+            ["Name", "Mobile", "Address", "Email", "Action"],
+            [
+                lambda c: c[1],
+                lambda c: c[2],
+                lambda c: c[3] or "",
+                lambda c: c[4] or "",
+                None,
+            ],
+            parent=self,
         )
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table, del_delegate = make_list_view(self.model, 4, "Del")
+        del_delegate.clicked.connect(self.delete_customer_row)
         layout.addWidget(self.table)
+        layout.addWidget(self.pager)
         self.load_customers()
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
+        self._show_fs()
 
     def add_customer(self):
         """
@@ -1600,9 +2258,21 @@ class CustomerMasterDialog(QDialog):
         if not self.name.text() or not self.mobile.text():
             QMessageBox.warning(self, "Error", "Name and Mobile are required.")
             return
-        if self.db.add_customer(
-            self.name.text(), self.mobile.text(), self.address.text(), self.email.text()
-        ):
+        self.add_btn.setEnabled(False)
+        run_db_async(
+            self.db,
+            self._on_customer_added,
+            self.db.add_customer,
+            self.name.text(),
+            self.mobile.text(),
+            self.address.text(),
+            self.email.text(),
+            on_error=lambda _exc: self.add_btn.setEnabled(True),
+        )
+
+    def _on_customer_added(self, cid):
+        self.add_btn.setEnabled(True)
+        if cid:
             self.name.clear()
             self.mobile.clear()
             self.address.clear()
@@ -1614,27 +2284,29 @@ class CustomerMasterDialog(QDialog):
         """
         Fetch customers from database based on search query and update table.
         """
-        self.table.setRowCount(0)
         query_text = ""
         if hasattr(self, "master_search_input"):
             query_text = self.master_search_input.text().strip()
-        customers = (
-            self.db.search_customers(query_text)
+        limit, offset = self.pager.limit, self.pager.offset
+        fetch = (
+            (self.db.search_customers, query_text, limit, offset)
             if query_text
-            else self.db.get_customers()
+            else (self.db.get_customers, limit, offset)
         )
-        for row, c in enumerate(customers):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(c[1]))
-            self.table.setItem(row, 1, QTableWidgetItem(c[2]))
-            self.table.setItem(row, 2, QTableWidgetItem(c[3] or ""))
-            self.table.setItem(row, 3, QTableWidgetItem(c[4] or ""))
-            del_btn = QPushButton("Del")
-            del_btn.clicked.connect(
-                lambda _, cid=c[0]: self.db.delete_customer(cid)
-                or self.load_customers()
-            )
-            self.table.setCellWidget(row, 4, del_btn)
+        self._load_seq += 1
+        seq = self._load_seq
+        run_db_async(self.db, lambda rows: self._on_customers(seq, rows), *fetch)
+
+    def _on_customers(self, seq, customers):
+        if seq == self._load_seq:
+            self.model.set_rows(self.pager.take(customers))
+
+    def delete_customer_row(self, row):
+        """
+        Delete the customer shown at the given table row.
+        """
+        self.db.delete_customer(self.model.row_data(row)[0])
+        self.load_customers()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
@@ -1643,7 +2315,7 @@ class CustomerMasterDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class CustomerSearchDialog(QDialog):
+class CustomerSearchDialog(_FSDialogMixin, QDialog):
     """
     Interface for searching and selecting customers.
     """
@@ -1654,19 +2326,28 @@ class CustomerSearchDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.db = db_manager
         self.selected_customer = None
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+        self._last_query = None
+        self._load_seq = 0
+        self._loading = False
         layout = QVBoxLayout(self)
+        search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Type Name or Mobile to Search...")
-        self.search_input.textChanged.connect(self.load_customers)
-        layout.addWidget(self.search_input)
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Name", "Mobile", "Address"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._search_debounce = Debouncer(self.load_customers, 250, self)
+        self.search_input.textChanged.connect(self._search_debounce.trigger)
+        self.search_input.returnPressed.connect(self.search_now)
+        self.search_input.editingFinished.connect(self.search_now)
+        search_btn = QPushButton("&Search")
+        search_btn.clicked.connect(self.search_now)
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(search_btn)
+        layout.addLayout(search_layout)
+        self.model = ListTableModel(
+            ["Name", "Mobile", "Address"],
+            [lambda c: c[1], lambda c: c[2], lambda c: c[3] or ""],
+            parent=self,
+        )
+        self.table, _ = make_list_view(self.model)
         self.table.doubleClicked.connect(self.select_customer)
         layout.addWidget(self.table)
         self.load_customers()
@@ -1674,42 +2355,61 @@ class CustomerSearchDialog(QDialog):
         close_btn.clicked.connect(self.reject)
         layout.addWidget(close_btn)
         self.search_input.setFocus()
+        self._show_fs()
 
-    def load_customers(self):
+    def load_customers(self, force=False):
         """
-        Refresh the list of customers based on search input.
+        Refresh the list of customers based on search input. Debounced calls
+        skip a query that is already shown; `force` re-reads it, e.g. to pick
+        up customers added or edited since.
         """
         query = self.search_input.text()
-        customers = (
-            self.db.search_customers(query) if query else self.db.get_customers()
-        )
-        self.table.setRowCount(0)
-        for row, c in enumerate(customers):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(c[1]))
-            self.table.setItem(row, 1, QTableWidgetItem(c[2]))
-            self.table.setItem(row, 2, QTableWidgetItem(c[3] or ""))
-            self.table.item(row, 0).setData(Qt.UserRole, c)
+        if query == self._last_query and (self._loading or not force):
+            return
+        self._last_query = query
+        fetch = (self.db.search_customers, query) if query else (self.db.get_customers,)
+        self._load_seq += 1
+        seq = self._load_seq
+        self._loading = True
+        run_db_async(self.db, lambda rows: self._on_customers(seq, rows), *fetch)
+
+    def _on_customers(self, seq, customers):
+        if seq == self._load_seq:
+            self._loading = False
+            self.model.set_rows(customers)
+
+    def search_now(self):
+        """
+        Search immediately (Enter, focus-out or the Search button) instead of
+        waiting for the typing debounce.
+        """
+        self._search_debounce.cancel()
+        self.load_customers(force=True)
 
     def select_customer(self):
         """
         Set selected customer and accept the dialog.
         """
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row >= 0:
-            self.selected_customer = self.table.item(row, 0).data(Qt.UserRole)
+            self.selected_customer = self.model.row_data(row)
             self.accept()
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
             self.reject()
         elif event.key() in (Qt.Key_Return, Qt.Key_Enter):
-            self.select_customer()
+            # The selection only belongs to the typed query once its rows
+            # have arrived; until then Enter just runs the search.
+            current = not self._loading and self.search_input.text() == self._last_query
+            self.search_now()
+            if current:
+                self.select_customer()
         else:
             super().keyPressEvent(event)
 
 
-class PurchaseRegisterDialog(QDialog):
+class PurchaseRegisterDialog(_FSDialogMixin, QDialog):
     """
     View purchase history for a specific item.
     """
@@ -1722,40 +2422,48 @@ class PurchaseRegisterDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle(f"Purchase Register: {product_name}")
         self.db = db_manager
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel(f"Purchase Register for {product_name}"))
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels(
-            ["Date", "Supplier", "Inv No", "Qty", "Rate", "UOM", "MRP"]
+        self.model = ListTableModel(
+            ["Date", "Supplier", "Inv No", "Qty", "Rate", "UOM", "MRP"],
+            parent=self,
+        )
+        self.table, _ = make_list_view(self.model)
+        set_fixed_columns(
+            self.table, {0: 110, 2: 120, 3: 100, 4: 100, 5: 80, 6: 100}, 1
         )
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         layout.addWidget(self.table)
         self.load_register(product_id)
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
+        self._show_fs()
 
     def load_register(self, product_id):
         """
         Refresh the purchase history table for the given product.
         """
-        rows = self.db.get_item_purchase_register(product_id)
-        self.table.setRowCount(0)
-        for row, r in enumerate(rows):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(r[0].strftime("%d-%m-%Y")))
-            self.table.setItem(row, 1, QTableWidgetItem(str(r[1] or "")))
-            self.table.setItem(row, 2, QTableWidgetItem(str(r[2] or "")))
-            self.table.setItem(row, 3, QTableWidgetItem(f"{float(r[3]):.3f}"))
-            self.table.setItem(row, 4, QTableWidgetItem(f"{float(r[4]):.2f}"))
-            self.table.setItem(row, 5, QTableWidgetItem(str(r[5] or "")))
-            self.table.setItem(
-                row, 6, QTableWidgetItem(f"{float(r[6]):.2f}" if r[6] else "0.00")
+        run_db_async(
+            self.db, self.model.set_rows, self._fetch_register_rows, product_id
+        )
+
+    def _fetch_register_rows(self, product_id):
+        """
+        Fetch and format the register off the GUI thread so the model only
+        serves ready-made strings.
+        """
+        return [
+            (
+                r[0].strftime(_DATE),
+                str(r[1] or ""),
+                str(r[2] or ""),
+                _FMT3(float(r[3])),
+                _FMT2(float(r[4])),
+                str(r[5] or ""),
+                _FMT2(float(r[6])) if r[6] else "0.00",
             )
+            for r in self.db.get_item_purchase_register(product_id)
+        ]
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
@@ -1764,7 +2472,7 @@ class PurchaseRegisterDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class PurchaseEntryDialog(QDialog):
+class PurchaseEntryDialog(_FSDialogMixin, QDialog):
     """
     Interface for entering new purchase records.
     """
@@ -1778,9 +2486,9 @@ class PurchaseEntryDialog(QDialog):
         self.setWindowTitle("Purchase Master")
         self.db = db_manager
         self.updating_cell = False
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+        self._prod_cache = {}
+        self._qty, self._rate = [], []
+        self._search_seq = 0
         main_layout = QVBoxLayout(self)
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -1791,22 +2499,30 @@ class PurchaseEntryDialog(QDialog):
         s_layout = QHBoxLayout(search_grp)
         self.item_search = QLineEdit()
         self.item_search.setPlaceholderText("Enter Item Name to find its purchases...")
-        self.item_search.textChanged.connect(self.load_search_results)
+        self._search_debounce = Debouncer(self.load_search_results, 250, self)
+        self.item_search.textChanged.connect(self._search_debounce.trigger)
         s_layout.addWidget(QLabel("Item:"))
         s_layout.addWidget(self.item_search)
         layout.addWidget(search_grp)
-        self.search_table = QTableWidget()
-        self.search_table.setColumnCount(5)
-        self.search_table.setHorizontalHeaderLabels(
-            ["ID", "Date", "Supplier", "Invoice", "Total"]
+        self.search_model = ListTableModel(
+            ["ID", "Date", "Supplier", "Invoice", "Total"],
+            [
+                lambda r: str(r[0]),
+                lambda r: r[1].strftime(_DATE),
+                lambda r: str(r[2] or ""),
+                lambda r: str(r[3] or ""),
+                lambda r: _FMT2(r[4]),
+            ],
+            parent=self,
         )
-        self.search_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.search_table, _ = make_list_view(self.search_model)
+        set_fixed_columns(self.search_table, {0: 70, 1: 110, 3: 150, 4: 120}, 2)
         self.search_table.setFixedHeight(150)
         layout.addWidget(self.search_table)
         header = QHBoxLayout()
         self.supplier_input = QComboBox()
         self.supplier_input.setEditable(True)
-        self.supplier_input.addItems(self.db.get_suppliers())
+        self.supplier_input.addItems(self.db.get_suppliers_cached())
         self.supplier_input.setPlaceholderText("Supplier Name (Select or Type)")
         self.invoice_input = QLineEdit()
         self.invoice_input.setPlaceholderText("Invoice No")
@@ -1832,7 +2548,7 @@ class PurchaseEntryDialog(QDialog):
         footer = QHBoxLayout()
         self.lbl_total = QLabel("Total: 0.00")
         self.lbl_total.setObjectName("total-label")
-        save_btn = QPushButton("&Save Purchase (F2)")
+        self.save_btn = save_btn = QPushButton("&Save Purchase (F2)")
         save_btn.clicked.connect(self.save_purchase)
         save_btn.setObjectName("btnSave")
         close_btn = QPushButton("&Close (Esc)")
@@ -1846,26 +2562,28 @@ class PurchaseEntryDialog(QDialog):
         main_layout.addLayout(footer)
         self.table.setFocus()
         self.table.setCurrentCell(0, 0)
+        self._show_fs()
 
     def load_search_results(self):
         """
         Refresh the purchase search table based on item name.
         """
         query = self.item_search.text().strip()
+        self._search_seq += 1
+        seq = self._search_seq
         if not query:
-            self.search_table.setRowCount(0)
+            self.search_model.set_rows([])
             return
-        results = self.db.search_purchases_by_item(query)
-        self.search_table.setRowCount(0)
-        for row, r in enumerate(results):
-            self.search_table.insertRow(row)
-            self.search_table.setItem(row, 0, QTableWidgetItem(str(r[0])))
-            self.search_table.setItem(
-                row, 1, QTableWidgetItem(r[1].strftime("%d-%m-%Y"))
-            )
-            self.search_table.setItem(row, 2, QTableWidgetItem(str(r[2] or "")))
-            self.search_table.setItem(row, 3, QTableWidgetItem(str(r[3] or "")))
-            self.search_table.setItem(row, 4, QTableWidgetItem(f"{r[4]:.2f}"))
+        run_db_async(
+            self.db,
+            lambda rows: self._on_search_results(seq, rows),
+            self.db.search_purchases_by_item,
+            query,
+        )
+
+    def _on_search_results(self, seq, rows):
+        if seq == self._search_seq:
+            self.search_model.set_rows(rows)
 
     def handle_table_change(self, item):
         """
@@ -1880,45 +2598,72 @@ class PurchaseEntryDialog(QDialog):
             if col == 0:
                 barcode = item.text().strip()
                 if barcode:
-                    product = self.db.find_product_smart(barcode)
+                    product = self._find_product(barcode)
                     if product:
-                        self.table.item(row, 0).setText(product[2])
-                        self.table.setItem(row, 1, QTableWidgetItem(product[1]))
-                        self.table.item(row, 1).setData(Qt.UserRole, product)
-                        self.table.setItem(row, 3, QTableWidgetItem(product[6]))
-                        self.table.setItem(
-                            row, 4, QTableWidgetItem(f"{product[4]:.2f}")
-                        )
-                        self.table.setItem(
-                            row, 5, QTableWidgetItem(f"{product[3]:.2f}")
-                        )
-                        if row == self.table.rowCount() - 1:
-                            self.table.setRowCount(row + 2)
+                        with QSignalBlocker(self.table):
+                            if item.text() != product[2]:
+                                item.setText(product[2])
+                            name_item = QTableWidgetItem(product[1])
+                            name_item.setData(Qt.UserRole, product)
+                            self.table.setItem(row, 1, name_item)
+                            self.table.setItem(row, 3, QTableWidgetItem(product[6]))
+                            self.table.setItem(
+                                row, 4, QTableWidgetItem(_FMT2(product[4]))
+                            )
+                            self.table.setItem(
+                                row, 5, QTableWidgetItem(_FMT2(product[3]))
+                            )
+                            if row == self.table.rowCount() - 1:
+                                self.table.setRowCount(row + 2)
                         QTimer.singleShot(0, lambda: self.table.setCurrentCell(row, 2))
+            if col in (0, 2, 4):
+                self._update_row_values(row)
             self.recalc_total()
         finally:
             self.updating_cell = False
 
+    def _update_row_values(self, row):
+        """
+        Parse qty/rate for one row into the running arrays used by
+        recalc_total, so a cell edit never re-reads the whole grid.
+        """
+        if row >= len(self._qty):
+            pad = row + 1 - len(self._qty)
+            self._qty.extend([0.0] * pad)
+            self._rate.extend([0.0] * pad)
+        qty_item = self.table.item(row, 2)
+        rate_item = self.table.item(row, 4)
+        try:
+            qty = float(qty_item.text()) if qty_item else 0.0
+            rate = float(rate_item.text()) if rate_item else 0.0
+        except ValueError:
+            qty = rate = 0.0
+        self._qty[row], self._rate[row] = qty, rate
+
+    def _find_product(self, query):
+        """
+        Resolve a barcode/name to a product, memoized for this purchase entry.
+        """
+        product = self._prod_cache.get(query)
+        if product is None:
+            product = self.db.find_product_smart(query)
+            if product:
+                self._prod_cache[query] = product
+        return product
+
     def recalc_total(self):
         """
-        Update the total amount label based on all rows in the table.
+        Update the total amount label from the per-row qty/rate arrays.
         """
-        total = 0.0
-        for r in range(self.table.rowCount()):
-            qty_item = self.table.item(r, 2)
-            rate_item = self.table.item(r, 4)
-            try:
-                qty = float(qty_item.text()) if qty_item else 0.0
-                rate = float(rate_item.text()) if rate_item else 0.0
-                total += qty * rate
-            except Exception:
-                pass
+        total = sum(q * r for q, r in zip(self._qty, self._rate))
         self.lbl_total.setText(f"Total: {total:.2f}")
 
     def save_purchase(self):
         """
         Validate and record the entire purchase to the database.
         """
+        if not self.save_btn.isEnabled():
+            return
         items = []
         total = 0.0
         for r in range(self.table.rowCount()):
@@ -1946,9 +2691,21 @@ class PurchaseEntryDialog(QDialog):
                 continue
         if not items:
             return
-        if self.db.record_purchase(
-            self.supplier_input.currentText(), self.invoice_input.text(), items, total
-        ):
+        self.save_btn.setEnabled(False)
+        run_db_async(
+            self.db,
+            self._on_purchase_saved,
+            self.db.record_purchase,
+            self.supplier_input.currentText(),
+            self.invoice_input.text(),
+            items,
+            total,
+            on_error=lambda _exc: self.save_btn.setEnabled(True),
+        )
+
+    def _on_purchase_saved(self, purchase_id):
+        self.save_btn.setEnabled(True)
+        if purchase_id:
             QMessageBox.information(self, "Success", "Purchase recorded successfully.")
             self.accept()
 
@@ -1980,10 +2737,10 @@ class PurchaseEntryDialog(QDialog):
                 row += 1
                 self.table.setCurrentCell(row, 0)
             self.table.setItem(row, 0, QTableWidgetItem(dlg.selected_product[2]))
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
 
-class HeldSalesDialog(QDialog):
+class HeldSalesDialog(_FSDialogMixin, QDialog):
     """
     View and recall bills that were placed on hold.
     """
@@ -1997,16 +2754,21 @@ class HeldSalesDialog(QDialog):
         self.setWindowTitle("Recall Held Bills")
         self.db = db_manager
         self.selected_held_id = None
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("Held Bills (Select to Restore)"))
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Time", "Amount", "User", "Action"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.model = ListTableModel(
+            ["ID", "Time", "Amount", "User", "Action"],
+            [
+                lambda s: str(s[0]),
+                lambda s: s[1].strftime("%H:%M:%S"),
+                lambda s: _FMT2(s[2]),
+                lambda s: s[3] or "",
+                None,
+            ],
+            parent=self,
+        )
+        self.table, del_delegate = make_list_view(self.model, 4, "Del")
+        del_delegate.clicked.connect(self.delete_held_row)
         self.table.doubleClicked.connect(self.select_bill)
         layout.addWidget(self.table)
         self.load_held_sales()
@@ -2018,33 +2780,28 @@ class HeldSalesDialog(QDialog):
         btn_layout.addWidget(restore_btn)
         btn_layout.addWidget(close_btn)
         layout.addLayout(btn_layout)
+        self._show_fs()
 
     def load_held_sales(self):
         """
         Refresh the list of bills currently on hold from the database.
         """
-        sales = self.db.get_held_sales()
-        self.table.setRowCount(0)
-        for row, s in enumerate(sales):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(str(s[0])))
-            self.table.setItem(row, 1, QTableWidgetItem(s[1].strftime("%H:%M:%S")))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{s[2]:.2f}"))
-            self.table.setItem(row, 3, QTableWidgetItem(s[3] or ""))
-            del_btn = QPushButton("Del")
-            del_btn.clicked.connect(
-                lambda _, hid=s[0]: self.db.delete_held_sale(hid)
-                or self.load_held_sales()
-            )
-            self.table.setCellWidget(row, 4, del_btn)
+        self.model.set_rows(self.db.get_held_sales())
+
+    def delete_held_row(self, row):
+        """
+        Discard the held bill shown at the given table row.
+        """
+        self.db.delete_held_sale(self.model.row_data(row)[0])
+        self.load_held_sales()
 
     def select_bill(self):
         """
         Set selected held bill ID and accept the dialog.
         """
-        row = self.table.currentRow()
+        row = self.table.currentIndex().row()
         if row >= 0:
-            self.selected_held_id = int(self.table.item(row, 0).text())
+            self.selected_held_id = int(self.model.row_data(row)[0])
             self.accept()
 
     def keyPressEvent(self, event):
@@ -2133,7 +2890,7 @@ class ConfigDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class TranslationManagerDialog(QDialog):
+class TranslationManagerDialog(_FSDialogMixin, QDialog):
     """
     Manage item name translations for a specific language.
     """
@@ -2146,55 +2903,69 @@ class TranslationManagerDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle(f"Manage {lang_name} Translations")
         self.db, self.lang_id = db_manager, lang_id
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+        self._load_seq = 0
         layout = QVBoxLayout(self)
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search items to translate...")
-        self.search_input.textChanged.connect(self.load_items)
+        self.pager = PageBar(parent=self)
+        self.pager.page_changed.connect(self.load_items)
+        self._search_debounce = Debouncer(self.load_items, 250, self)
+        self.search_input.textChanged.connect(self.pager.reset)
+        self.search_input.textChanged.connect(self._search_debounce.trigger)
         layout.addWidget(self.search_input)
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Item Name", "Translated Name", "Action"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.model = ListTableModel(
+            ["Item Name", "Translated Name", "Action"],
+            [lambda r: r[1], lambda r: r[2], None],
+            editable={1: 2},
+            parent=self,
+        )
+        self.table, save_delegate = make_list_view(self.model, 2, "Save")
+        self.table.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        set_fixed_columns(self.table, {1: 420, 2: 100}, 0)
+        save_delegate.clicked.connect(self.save_trans)
         layout.addWidget(self.table)
+        layout.addWidget(self.pager)
         self.load_items()
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
+        self._show_fs()
 
     def load_items(self):
         """
         Fetch products and their current translations from the database.
         """
-        query = self.search_input.text()
+        self._load_seq += 1
+        seq = self._load_seq
+        run_db_async(
+            self.db,
+            lambda res: self._on_items(seq, *res),
+            self._fetch_items,
+            self.search_input.text(),
+            self.pager.limit,
+            self.pager.offset,
+        )
+
+    def _fetch_items(self, query, limit, offset):
         products = (
-            self.db.search_products(query) if query else self.db.get_all_products()
+            self.db.search_products(query)
+            if query
+            else self.db.get_all_products(limit, offset)
         )
-        self.table.setRowCount(0)
-        for row, p in enumerate(products):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(p[1]))
-            trans_name = ""
-            for t in self.db.get_translations(p[0]):
-                if t[0] == self.lang_id:
-                    trans_name = t[2]
-                    break
-            trans_edit = QLineEdit(trans_name)
-            self.table.setCellWidget(row, 1, trans_edit)
-            save_btn = QPushButton("Save")
-            save_btn.clicked.connect(
-                lambda _, pid=p[0], edit=trans_edit: self.save_trans(pid, edit)
-            )
-            self.table.setCellWidget(row, 2, save_btn)
+        return products, self.db.get_translations_for_language(self.lang_id)
+
+    def _on_items(self, seq, products, trans_map):
+        if seq != self._load_seq:
+            return
+        products = self.pager.take(products)
+        self.model.set_rows([(p[0], p[1], trans_map.get(p[0], "")) for p in products])
 
-    def save_trans(self, pid, edit):
+    def save_trans(self, row):
         """
-        Save the translated item name to the database.
+        Save the translated item name at the given row to the database.
         """
-        self.db.add_translation(pid, self.lang_id, edit.text())
+        pid, _, trans_name = self.model.row_data(row)
+        self.db.add_translation(pid, self.lang_id, trans_name)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
@@ -2203,7 +2974,7 @@ class TranslationManagerDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class LanguageSelectionDialog(QDialog):
+class LanguageSelectionDialog(_FSDialogMixin, QDialog):
     """
     Select target language for receipt printing.
     """
@@ -2217,20 +2988,11 @@ class LanguageSelectionDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.db = db_manager
         self.selected_lang_id = None
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("Choose Printing Language:"))
         self.list_widget = QListWidget()
-        item = QListWidgetItem("Original (English)")
-        item.setData(Qt.UserRole, None)
-        self.list_widget.addItem(item)
-        for lang in self.db.get_languages():
-            item = QListWidgetItem(lang[1])
-            item.setData(Qt.UserRole, lang[0])
-            self.list_widget.addItem(item)
-        self.list_widget.setCurrentRow(0)
+        self._langs = None
+        self._load_languages()
         layout.addWidget(self.list_widget)
         btn_layout = QHBoxLayout()
         print_btn = QPushButton("&Print (Enter)")
@@ -2240,6 +3002,34 @@ class LanguageSelectionDialog(QDialog):
         btn_layout.addWidget(print_btn)
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
+        self._show_fs()
+
+    def _load_languages(self):
+        """
+        Rebuild the list only when the cached language rows have changed,
+        and start every selection from the original language.
+        """
+        langs = self.db.get_languages_cached()
+        if langs != self._langs:
+            self._langs = langs
+            self.list_widget.clear()
+            item = QListWidgetItem("Original (English)")
+            item.setData(Qt.UserRole, None)
+            self.list_widget.addItem(item)
+            for lang in langs:
+                item = QListWidgetItem(lang[1])
+                item.setData(Qt.UserRole, lang[0])
+                self.list_widget.addItem(item)
+        self.list_widget.setCurrentRow(0)
+        self.selected_lang_id = None
+
+    def reuse(self):
+        """
+        Prepare a previously shown instance to be exec()'d again.
+        """
+        self._load_languages()
+        self._show_fs()
+        return self
 
     def accept(self):
         """
@@ -2262,7 +3052,7 @@ class LanguageSelectionDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class MaintenanceDashboardDialog(QDialog):
+class MaintenanceDashboardDialog(_FSDialogMixin, QDialog):
     """
     Administrative interface for database maintenance tasks.
     """
@@ -2275,9 +3065,6 @@ class MaintenanceDashboardDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle("Maintenance Dashboard")
         self.db = db_manager
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
         layout = QVBoxLayout(self)
         title = QLabel("Database Maintenance Dashboard")
         title.setObjectName("title")
@@ -2294,10 +3081,16 @@ class MaintenanceDashboardDialog(QDialog):
         self.restore_btn.setFixedHeight(60)
         self.restore_btn.clicked.connect(self.restore_db)
         layout.addWidget(self.restore_btn)
-        layout.addStretch()
+        self.status_lbl = QLabel("")
+        layout.addWidget(self.status_lbl)
+        self.log = QTextEdit()
+        self.log.setReadOnly(True)
+        layout.addWidget(self.log)
+        self._busy = False
         close_btn = QPushButton("&Close (Esc)")
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
+        self._show_fs()
 
     def reindex_db(self):
         """
@@ -2307,87 +3100,177 @@ class MaintenanceDashboardDialog(QDialog):
             QMessageBox.question(
                 self,
                 "Confirm",
-                "Reindex entire database? Application might hang for a moment.",
+                "Reindex entire database? Billing can continue while it runs.",
             )
             == QMessageBox.Yes
         ):
-            if self.db.reindex_database():
-                QMessageBox.information(
-                    self, "Success", "Database reindexed successfully."
-                )
-                self.accept()
-            else:
-                QMessageBox.warning(self, "Error", "Failed to reindex database.")
+            self._set_busy(True)
+            run_db_async(
+                self.db,
+                self._on_reindexed,
+                self.db.reindex_database,
+                on_error=lambda _exc: self._on_reindexed(False),
+            )
+
+    def _on_reindexed(self, ok):
+        self._set_busy(False)
+        if ok:
+            QMessageBox.information(self, "Success", "Database reindexed successfully.")
+            self.accept()
+        else:
+            QMessageBox.warning(self, "Error", "Failed to reindex database.")
+
+    def _pg_conn_args(self):
+        """
+        Connection arguments and environment shared by pg_dump/pg_restore/psql.
+        """
+        params = self.db.conn_params
+        env = os.environ.copy()
+        env["PGPASSWORD"] = params["password"]
+        args = ["-h", params["host"], "-p", params["port"], "-U", params["user"]]
+        return args, env
+
+    def _set_busy(self, busy):
+        """
+        Lock the action buttons (and closing) while a maintenance job runs.
+        """
+        self._busy = busy
+        for btn in (self.reindex_btn, self.backup_btn, self.restore_btn):
+            btn.setEnabled(not busy)
+        self.status_lbl.setText("Working... please wait." if busy else "")
+
+    def _start_process(self, program, args, env, on_done):
+        """
+        Launch `program` through QProcess so the event loop keeps running.
+        stderr is streamed into the log; `on_done(ok, stderr)` fires on exit.
+        """
+        qenv = QProcessEnvironment()
+        for key, value in env.items():
+            qenv.insert(key, value)
+        proc = QProcess(self)
+        proc.setProcessEnvironment(qenv)
+        proc.setProgram(program)
+        proc.setArguments(args)
+        stderr = []
+
+        def read_stderr():
+            text = bytes(proc.readAllStandardError()).decode(errors="replace")
+            if text:
+                stderr.append(text)
+                self.log.append(text.rstrip())
+
+        def finished(code, status):
+            read_stderr()
+            proc.deleteLater()
+            self._set_busy(False)
+            on_done(code == 0 and status == QProcess.NormalExit, "".join(stderr))
+
+        def failed(error):
+            if error == QProcess.FailedToStart:
+                proc.deleteLater()
+                self._set_busy(False)
+                on_done(False, f"Could not start {program}.")
+
+        proc.readyReadStandardError.connect(read_stderr)
+        proc.finished.connect(finished)
+        proc.errorOccurred.connect(failed)
+        self._set_busy(True)
+        self.log.append(f"$ {program} {' '.join(args)}")
+        proc.start()
 
     def backup_db(self):
         """
-        Export the current database state to a SQL file.
+        Export the current database to a compressed custom-format archive.
         """
         path, _ = QFileDialog.getSaveFileName(
-            self, "Save Database Backup", "elytpos_backup.sql", "SQL Files (*.sql)"
+            self,
+            "Save Database Backup",
+            "elytpos_backup.dump",
+            "PostgreSQL Backup (*.dump)",
         )
         if not path:
             return
-        params = self.db.conn_params
-        env = os.environ.copy()
-        env["PGPASSWORD"] = params["password"]
-        cmd = [
-            "pg_dump",
-            "-h",
-            params["host"],
-            "-p",
-            params["port"],
-            "-U",
-            params["user"],
-            "-f",
-            path,
-            params["dbname"],
-        ]
-        try:
-            subprocess.run(cmd, env=env, check=True)
-            QMessageBox.information(self, "Success", f"Database backed up to {path}")
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Backup failed: {e}")
+        self._run_backup(path, pg_dump_compression())
+
+    def _run_backup(self, path, compress):
+        """
+        Start pg_dump for `path`, retrying with gzip if zstd is unsupported.
+        """
+        args, env = self._pg_conn_args()
+        dbname = self.db.conn_params["dbname"]
+
+        def done(ok, stderr):
+            if not ok and compress != "6" and "zstd" in stderr:
+                # pg_dump built without zstd support: fall back to gzip.
+                pg_dump_zstd_unsupported()
+                self._run_backup(path, "6")
+            elif ok:
+                QMessageBox.information(
+                    self, "Success", f"Database backed up to {path}"
+                )
+                self.accept()
+            else:
+                QMessageBox.critical(
+                    self, "Error", f"Backup failed: {stderr.strip() or 'unknown error'}"
+                )
+
+        self._start_process(
+            "pg_dump", args + ["-Fc", "-Z", compress, "-f", path, dbname], env, done
+        )
 
     def restore_db(self):
         """
-        Import a database state from a SQL file, overwriting current data.
+        Import a database backup, overwriting current data. Archives are
+        restored with parallel pg_restore; legacy plain .sql dumps go
+        through psql.
         """
         msg = "Restoring will OVERWRITE existing data. Are you sure?"
         if QMessageBox.question(self, "Confirm Restore", msg) != QMessageBox.Yes:
             return
         path, _ = QFileDialog.getOpenFileName(
-            self, "Open Database Backup", "", "SQL Files (*.sql)"
+            self,
+            "Open Database Backup",
+            "",
+            "Database Backups (*.dump *.sql);;All Files (*)",
         )
         if not path:
             return
-        params = self.db.conn_params
-        env = os.environ.copy()
-        env["PGPASSWORD"] = params["password"]
-        cmd = [
-            "psql",
-            "-h",
-            params["host"],
-            "-p",
-            params["port"],
-            "-U",
-            params["user"],
-            "-d",
-            params["dbname"],
-            "-f",
-            path,
-        ]
-        try:
-            subprocess.run(cmd, env=env, check=True)
-            QMessageBox.information(
-                self,
-                "Success",
-                "Database restored successfully. Please restart the application.",
-            )
-            self.accept()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Restore failed: {e}")
+        if path.lower().endswith(".sql"):
+            self._run_restore("psql", path)
+        else:
+            self._run_restore("pg_restore", path)
+
+    def _run_restore(self, program, path):
+        """
+        Start the restore, falling back to psql if pg_restore reports that
+        the file is a plain-text dump.
+        """
+        args, env = self._pg_conn_args()
+        dbname = self.db.conn_params["dbname"]
+        if program == "pg_restore":
+            args += ["-d", dbname, "-j", str(os.cpu_count() or 4)]
+            args += ["--clean", "--if-exists", path]
+        else:
+            args += ["-d", dbname, "-f", path]
+
+        def done(ok, stderr):
+            if not ok and program == "pg_restore" and "text format" in stderr:
+                self._run_restore("psql", path)
+            elif ok:
+                QMessageBox.information(
+                    self,
+                    "Success",
+                    "Database restored successfully. Please restart the application.",
+                )
+                self.accept()
+            else:
+                QMessageBox.critical(
+                    self,
+                    "Error",
+                    f"Restore failed: {stderr.strip() or 'unknown error'}",
+                )
+
+        self._start_process(program, args, env, done)
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
@@ -2395,8 +3278,17 @@ class MaintenanceDashboardDialog(QDialog):
         else:
             super().keyPressEvent(event)
 
+    def closeEvent(self, event):
+        if self._busy:
+            QMessageBox.warning(
+                self, "Busy", "Please wait for the current operation to finish."
+            )
+            event.ignore()
+            return
+        super().closeEvent(event)
+
 
-class ItemTranslationDialog(QDialog):
+class ItemTranslationDialog(_FSDialogMixin, QDialog):
     """
     Interface for managing product name translations in multiple languages.
     """
@@ -2406,7 +3298,6 @@ class ItemTranslationDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle(f"Translations: {product_name}")
         self.db, self.product_id = db, product_id
-        self.showFullScreen()
 
         layout = QVBoxLayout(self)
         title = QLabel(f"Manage Translations: {product_name}")
@@ -2419,7 +3310,7 @@ class ItemTranslationDialog(QDialog):
         self.form = QFormLayout(content)
         self.inputs = {}
 
-        langs = self.db.get_languages()
+        langs = self.db.get_languages_cached()
         cur_trans = self.db.get_translations(product_id)
         trans_map = {t[0]: t[2] for t in cur_trans}
 
@@ -2452,6 +3343,7 @@ class ItemTranslationDialog(QDialog):
         esc_act.setShortcut("Esc")
         esc_act.triggered.connect(self.reject)
         self.addAction(esc_act)
+        self._show_fs()
 
     def save(self):
         for lid, le in self.inputs.items():
@@ -2460,7 +3352,7 @@ class ItemTranslationDialog(QDialog):
         self.accept()
 
 
-class InventoryDialog(QDialog):
+class InventoryDialog(_FSDialogMixin, QDialog):
     """
     Structured Item Master workflow:
     1. Search/Create Item (Name + Translations)
@@ -2473,9 +3365,6 @@ class InventoryDialog(QDialog):
         self.setWindowTitle("Item Master")
         self.db = db_manager
         self.current_item_id = None
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -2573,6 +3462,7 @@ class InventoryDialog(QDialog):
         s_esc.setShortcut("Esc")
         s_esc.triggered.connect(self.close)
         self.addAction(s_esc)
+        self._show_fs()
 
     def _get_text(self, row, col):
         it = self.grid.item(row, col)
@@ -2586,24 +3476,26 @@ class InventoryDialog(QDialog):
             self.name_input.setText(prod[1])
             self.trans_btn.setEnabled(True)
             self.load_variants()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def load_variants(self):
-        self.grid.setRowCount(0)
-        p = self.db.get_product_by_id(self.current_item_id)
-        if p:
-            self.add_variant_to_grid(p, is_base=True)
-        aliases = self.db.get_aliases(self.current_item_id)
-        for a in aliases:
-            self.add_variant_to_grid(a, is_base=False)
-        self.add_empty_variant_row()
+        p, aliases = self.db.get_product_bundle(self.current_item_id)
+        rows = [(p, True)] if p else []
+        rows += [(a, False) for a in aliases]
+        with batch_table_fill(self.grid, len(rows) + 1):
+            for row, (data, is_base) in enumerate(rows):
+                self.add_variant_to_grid(data, is_base=is_base, row=row)
+            self.add_empty_variant_row(row=len(rows))
         self.status_lbl.setText(f"Loaded item: {p[1]}")
 
-    def add_variant_to_grid(self, data, is_base=True):
-        row = self.grid.rowCount()
-        self.grid.insertRow(row)
+    def add_variant_to_grid(self, data, is_base=True, row=None):
+        if row is None:
+            row = self.grid.rowCount()
+            self.grid.insertRow(row)
         self.grid.setItem(row, 0, QTableWidgetItem(str(data[0])))
-        self.grid.setItem(row, 1, QTableWidgetItem(str(data[2])))  # barcode
+        self.grid.setItem(
+            row, 1, QTableWidgetItem(str(data[2 if is_base else 1]))
+        )  # barcode
         self.grid.setItem(
             row, 2, QTableWidgetItem(str(data[7 if is_base else 7] or ""))
         )  # aliases
@@ -2631,9 +3523,10 @@ class InventoryDialog(QDialog):
         d_btn.clicked.connect(self.handle_delete_variant)
         self.grid.setCellWidget(row, 10, d_btn)
 
-    def add_empty_variant_row(self):
-        row = self.grid.rowCount()
-        self.grid.insertRow(row)
+    def add_empty_variant_row(self, row=None):
+        if row is None:
+            row = self.grid.rowCount()
+            self.grid.insertRow(row)
         for c in range(10):
             self.grid.setItem(row, c, QTableWidgetItem(""))
         self.grid.item(row, 4).setText("0.00")
@@ -2653,7 +3546,7 @@ class InventoryDialog(QDialog):
             ItemTranslationDialog(
                 self.db, self.current_item_id, self.name_input.text(), self
             ).exec()
-            self.showFullScreen()
+            self._ensure_fullscreen()
 
     def save_everything(self):
         item_name = self.name_input.text().strip()
@@ -2718,14 +3611,7 @@ class InventoryDialog(QDialog):
                 )
                 self.trans_btn.setEnabled(True)
 
-            conn = self.db.get_connection()
-            cur = conn.cursor()
-            cur.execute(
-                "DELETE FROM product_aliases WHERE product_id = %s",
-                (self.current_item_id,),
-            )
-            conn.commit()
-
+            variants = []
             for r in range(1, self.grid.rowCount()):
                 v_bar = self._get_text(r, 1)
                 if not v_bar:
@@ -2764,18 +3650,22 @@ class InventoryDialog(QDialog):
                 v_pur = float(self._get_text(r, 6) or 0)
                 v_fact = float(self._get_text(r, 7) or 1.0)
                 v_stock = float(self._get_text(r, 8) or 0)
-                self.db.add_alias(
-                    self.current_item_id,
-                    v_bar,
-                    v_uom,
-                    v_mrp,
-                    v_rate,
-                    v_fact,
-                    1.0,
-                    v_aliases_str,
-                    v_pur,
-                    v_stock,
+                variants.append(
+                    (
+                        v_bar,
+                        v_uom,
+                        v_mrp,
+                        v_rate,
+                        v_fact,
+                        1.0,
+                        v_aliases_str,
+                        v_pur,
+                        v_stock,
+                    )
                 )
+            if not self.db.replace_aliases(self.current_item_id, variants):
+                QMessageBox.critical(self, "Error", "Failed to save variants.")
+                return
 
             QMessageBox.information(
                 self, "Success", f"Item '{item_name}' and variants saved."
@@ -2798,7 +3688,7 @@ class InventoryDialog(QDialog):
         return super().eventFilter(source, event)
 
 
-class SalesHistoryDialog(QDialog):
+class SalesHistoryDialog(_FSDialogMixin, QDialog):
     """
     View and manage historical sales transactions.
     """
@@ -2811,34 +3701,45 @@ class SalesHistoryDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.FramelessWindowHint)
         self.setWindowTitle("Sales History / Day Book")
         self.db, self.printer, self.parent_window = db_manager, printer, parent
-        self.showFullScreen()
-        self.raise_()
-        self.activateWindow()
+        self._lang_dlg = None
         layout = QVBoxLayout(self)
         top_layout = QHBoxLayout()
         self.date_filter = QDateEdit()
         self.date_filter.setDisplayFormat("dd-MM-yyyy")
         self.date_filter.setDate(QDate.currentDate())
         self.date_filter.setCalendarPopup(True)
-        self.date_filter.dateChanged.connect(self.load_history)
+        self._reload_debounce = Debouncer(self.load_history, 200, self)
+        self.date_filter.dateChanged.connect(self._reload_debounce.trigger)
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by Bill No, Name or Mobile...")
-        self.search_input.textChanged.connect(self.load_history)
+        self.search_input.textChanged.connect(self._reload_debounce.trigger)
         refresh_btn = QPushButton("&Refresh")
-        refresh_btn.clicked.connect(self.load_history)
+        refresh_btn.clicked.connect(self._refresh_now)
         top_layout.addWidget(QLabel("Date:"))
         top_layout.addWidget(self.date_filter)
         top_layout.addWidget(QLabel("Search:"))
         top_layout.addWidget(self.search_input, 1)
         top_layout.addWidget(refresh_btn)
         layout.addLayout(top_layout)
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels(
-            ["Bill No", "Time", "Customer", "Mobile", "Amount", "Print", "Edit"]
+        self.model = FetchMoreTableModel(
+            ["Bill No", "Time", "Customer", "Mobile", "Amount", "Print", "Edit"],
+            self._fetch_history,
+            [
+                lambda s: str(s[0]),
+                lambda s: s[1].strftime("%H:%M:%S"),
+                lambda s: s[4] or "Cash",
+                lambda s: s[5] or "-",
+                lambda s: _FMT2(s[2]),
+                None,
+                None,
+            ],
+            parent=self,
         )
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table, print_delegate = make_list_view(self.model, 5, "Print")
+        print_delegate.clicked.connect(self._print_row)
+        modify_delegate = ActionButtonDelegate("Modify", self.table, "btnSave")
+        modify_delegate.clicked.connect(self._modify_row)
+        self.table.setItemDelegateForColumn(6, modify_delegate)
         self.table.verticalHeader().setDefaultSectionSize(40)  # Increased row height
         layout.addWidget(self.table)
         self.load_history()
@@ -2846,8 +3747,9 @@ class SalesHistoryDialog(QDialog):
         close_btn.clicked.connect(self.close)
         layout.addWidget(close_btn)
         self.table.setFocus()
-        if self.table.rowCount() > 0:
+        if self.model.rowCount() > 0:
             self.table.selectRow(0)
+        self._show_fs()
 
     def keyPressEvent(self, event):
         """
@@ -2856,37 +3758,49 @@ class SalesHistoryDialog(QDialog):
         if event.key() == Qt.Key_Escape:
             self.close()
         elif event.key() in (Qt.Key_Return, Qt.Key_Enter) and self.table.hasFocus():
-            row = self.table.currentRow()
+            row = self.table.currentIndex().row()
             if row >= 0:
-                sid = self.table.item(row, 0).text()
-                self.modify_bill(sid)
+                self._modify_row(row)
         else:
             super().keyPressEvent(event)
 
+    def _refresh_now(self):
+        self._reload_debounce.cancel()
+        self.load_history()
+
+    def _fetch_history(self, after):
+        date, query = self._history_filter
+        return self.db.iter_sales_history(
+            date, query, after=(after[1], after[0]) if after else None
+        )
+
+    def closeEvent(self, event):
+        self.model.close()
+        super().closeEvent(event)
+
     def load_history(self):
         """
-        Fetch filtered sales records from the database and populate the table.
+        Reload the first batch of filtered sales; further rows are streamed
+        from the server-side cursor as the table is scrolled.
         """
-        self.table.setRowCount(0)
-        query = self.search_input.text().strip()
-        for row, sale in enumerate(
-            self.db.get_sales_history(self.date_filter.date().toPython(), query)
-        ):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(str(sale[0])))
-            self.table.setItem(row, 1, QTableWidgetItem(sale[1].strftime("%H:%M:%S")))
-            self.table.setItem(row, 2, QTableWidgetItem(sale[4] or "Cash"))
-            self.table.setItem(row, 3, QTableWidgetItem(sale[5] or "-"))
-            self.table.setItem(row, 4, QTableWidgetItem(f"{sale[2]:.2f}"))
-            p_btn = QPushButton("Print")
-            p_btn.clicked.connect(
-                lambda _, sid=sale[0], amt=sale[2]: self.reprint_bill(sid, amt)
-            )
-            m_btn = QPushButton("Modify")
-            m_btn.setObjectName("btnSave")
-            m_btn.clicked.connect(lambda _, sid=sale[0]: self.modify_bill(sid))
-            self.table.setCellWidget(row, 5, p_btn)
-            self.table.setCellWidget(row, 6, m_btn)
+        self._history_filter = (
+            self.date_filter.date().toPython(),
+            self.search_input.text().strip(),
+        )
+        self.model.reload()
+
+    def _print_row(self, row):
+        sale = self.model.row_data(row)
+        self.reprint_bill(sale[0], sale[2])
+
+    def _modify_row(self, row):
+        self.modify_bill(self.model.row_data(row)[0])
+
+    def _language_dialog(self):
+        if self._lang_dlg is None:
+            self._lang_dlg = LanguageSelectionDialog(self.db, self)
+            return self._lang_dlg
+        return self._lang_dlg.reuse()
 
     def reprint_bill(self, sid, total):
         """
@@ -2894,20 +3808,21 @@ class SalesHistoryDialog(QDialog):
         """
         items = self.db.get_sale_items(sid)
         if items:
-            langs = self.db.get_languages()
+            langs = self.db.get_languages_cached()
             selected_lang_id = None
             should_print = True
             if langs:
-                lang_dlg = LanguageSelectionDialog(self.db, self)
+                lang_dlg = self._language_dialog()
                 if lang_dlg.exec() == QDialog.Accepted:
                     selected_lang_id = lang_dlg.selected_lang_id
                 else:
                     should_print = False
 
             if should_print:
-                print_items = self.db.get_translated_items(items, selected_lang_id)
-                sales = self.db.get_sales_history(query=str(sid))
-                sale_header = next((s for s in sales if str(s[0]) == str(sid)), None)
+                print_items = self.db.get_translated_sale_items(
+                    sid, items, selected_lang_id
+                )
+                sale_header = self.db.get_sale_header(sid)
                 cust_info = None
                 if sale_header and sale_header[5]:
                     customer = self.db.get_customer_by_mobile(sale_header[5])
@@ -2957,9 +3872,28 @@ class ExcelTable(QTableWidget):
         for i in [2, 3, 4, 5, 6, 7]:
             self.setColumnWidth(i, 80)
 
-        self.verticalHeader().setDefaultSectionSize(35)  # Taller rows
+        # Fixed, single-line rows: Qt never has to measure cell text to lay
+        # out the grid, however many items a bill fills in.
+        v_header = self.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
+        v_header.setDefaultSectionSize(35)  # Taller rows
+        self.setWordWrap(False)
         self.setRowCount(20)
         self.nav_order = [0, 2, 3, 5]
+        # Enter moves along nav_order; past its last column (or from the
+        # discount/amount columns) it wraps to the next row.
+        self._nav_next = dict(zip(self.nav_order, self.nav_order[1:]))
+        self._row_end_cols = {self.nav_order[-1], 6, 7}
+        self._key_handlers = {
+            Qt.Key_F2: self._key_f2,
+            Qt.Key_Insert: self._key_insert,
+            Qt.Key_Left: self._key_left,
+            Qt.Key_Right: self._key_right,
+            Qt.Key_Down: self._key_down,
+            Qt.Key_Delete: self._key_delete,
+            Qt.Key_Return: self._key_enter,
+            Qt.Key_Enter: self._key_enter,
+        }
         self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.currentCellChanged.connect(self.scroll_to_center)
         QTimer.singleShot(0, lambda: self.setCurrentCell(0, 0))
@@ -2969,16 +3903,21 @@ class ExcelTable(QTableWidget):
         Scroll the table so that the specified row is centered in the view.
         """
         if row >= 0:
-            if self.rowCount() - row < 15:
-                self.setRowCount(row + 20)
-            QTimer.singleShot(
-                0,
-                lambda: self.scrollTo(
-                    self.model().index(row, 0),
-                    QAbstractItemView.ScrollHint.PositionAtCenter,
-                ),
+            self._ensure_rows(row + 15)
+            self.scrollTo(
+                self.model().index(row, 0),
+                QAbstractItemView.ScrollHint.PositionAtCenter,
             )
 
+    def _ensure_rows(self, needed):
+        """
+        Make sure at least `needed` rows exist, growing geometrically so a
+        long bill does not resize the grid on every new line.
+        """
+        cur = self.rowCount()
+        if needed > cur:
+            self.setRowCount(max(cur * 2, needed + 20))
+
     def is_row_valid(self, row):
         """
         Check if the specified row contains a valid product selection.
@@ -2993,103 +3932,82 @@ class ExcelTable(QTableWidget):
         if self.state() == QAbstractItemView.EditingState:
             super().keyPressEvent(event)
             return
+        handler = self._key_handlers.get(event.key())
+        if handler is None:
+            super().keyPressEvent(event)
+        else:
+            handler(event, self.currentRow(), self.currentColumn())
 
-        if event.key() == Qt.Key_F2:
-            event.ignore()
+    def _next_row(self, row):
+        """
+        Move to the first column of the following row, if this one is complete.
+        """
+        if not self.is_row_valid(row):
             return
-        row, col = self.currentRow(), self.currentColumn()
-        if event.key() == Qt.Key_Insert:
-            self.insertRow(row)
-            self.setCurrentCell(row, 0)
+        self._ensure_rows(row + 2)
+        self.setCurrentCell(row + 1, 0)
+
+    def _key_f2(self, event, _row, _col):
+        event.ignore()
+
+    def _key_insert(self, _event, row, _col):
+        self.insertRow(row)
+        self.setCurrentCell(row, 0)
+
+    def _key_left(self, event, row, col):
+        if col == 0:
+            if row > 0:
+                self.setCurrentCell(row - 1, self.columnCount() - 1)
+        else:
+            super().keyPressEvent(event)
+
+    def _key_right(self, event, row, col):
+        if col == 0 and not self.is_row_valid(row):
             return
-        if event.key() == Qt.Key_Left:
-            if col == 0:
-                if row > 0:
-                    self.setCurrentCell(row - 1, self.columnCount() - 1)
-            else:
-                super().keyPressEvent(event)
+        if col == self.columnCount() - 1:
+            self._next_row(row)
+        else:
+            super().keyPressEvent(event)
+
+    def _key_down(self, event, row, _col):
+        if row == self.rowCount() - 1 or not self.is_row_valid(row):
             return
-        if event.key() == Qt.Key_Right:
+        super().keyPressEvent(event)
+
+    def _key_delete(self, _event, _row, col):
+        rows = sorted({i.row() for i in self.selectedItems()}, reverse=True)
+        if rows:
+            target_row = min(rows)
+            for r in rows:
+                self.removeRow(r)
+            if self.rowCount() < 20:
+                self.setRowCount(20)
+            target_row = min(target_row, self.rowCount() - 1)
+            self.setCurrentCell(target_row, col)
+
+    def _key_enter(self, event, row, col):
+        nxt = self._nav_next.get(col)
+        if nxt is not None:
             if col == 0 and not self.is_row_valid(row):
                 return
-            if col == self.columnCount() - 1:
-                if not self.is_row_valid(row):
-                    return
-                if row == self.rowCount() - 1:
-                    self.setRowCount(row + 2)
-                self.setCurrentCell(row + 1, 0)
-            else:
-                super().keyPressEvent(event)
-            return
-        if event.key() == Qt.Key_Up:
-            super().keyPressEvent(event)
-            return
-        if event.key() == Qt.Key_Down:
-            if row == self.rowCount() - 1 or not self.is_row_valid(row):
-                return
-            super().keyPressEvent(event)
-            return
-        if event.key() == Qt.Key_Delete:
-            rows = sorted(
-                list(set(i.row() for i in self.selectedItems())), reverse=True
-            )
-            if rows:
-                target_row = min(rows)
-                for r in rows:
-                    self.removeRow(r)
-                if self.rowCount() < 20:
-                    self.setRowCount(20)
-                target_row = min(target_row, self.rowCount() - 1)
-                self.setCurrentCell(target_row, col)
-            return
-        if event.key() in (Qt.Key_Return, Qt.Key_Enter):
-            if col in self.nav_order:
-                idx = self.nav_order.index(col)
-                if idx < len(self.nav_order) - 1:
-                    if col == 0 and not self.is_row_valid(row):
-                        return
-                    self.setCurrentCell(row, self.nav_order[idx + 1])
-                else:
-                    if not self.is_row_valid(row):
-                        return
-                    if row == self.rowCount() - 1:
-                        self.setRowCount(row + 2)
-                    self.setCurrentCell(row + 1, 0)
-            elif col in (6, 7):
-                if not self.is_row_valid(row):
-                    return
-                if row == self.rowCount() - 1:
-                    self.setRowCount(row + 2)
-                self.setCurrentCell(row + 1, 0)
-            elif col == 1:
-                self.setCurrentCell(row, 2)
-            else:
-                super().keyPressEvent(event)
+            self.setCurrentCell(row, nxt)
+        elif col in self._row_end_cols:
+            self._next_row(row)
+        elif col == 1:
+            self.setCurrentCell(row, 2)
         else:
             super().keyPressEvent(event)
 
 
-class FuzzySearchLineEdit(QLineEdit):
-    """
-    Custom QLineEdit with an integrated search result dropdown.
-    """
+_POPUP_QSS_CACHE = {}
 
-    def __init__(self, db, parent=None):
-        super().__init__(parent)
-        self.db = db
-        self.column_idx = 0
-        self.selected_product = None
-        self.popup = QListWidget()
-        self.popup.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
-        self.popup.setFocusPolicy(Qt.NoFocus)
-        self.popup.setAttribute(Qt.WA_ShowWithoutActivating)
-
-        current_theme = QApplication.instance().property("theme_name") or "mocha"
-        c = get_theme_colors(current_theme)
 
-        self.popup.setStyleSheet(
-            get_style(current_theme)
-            + f"""
+def _build_popup_qss(theme_name):
+    """
+    Render the fuzzy search popup stylesheet for a theme.
+    """
+    c = get_theme_colors(theme_name)
+    return get_style(theme_name) + f"""
             QListWidget {{
                 background-color: {c["bg"]};
                 border: 2px solid {c["accent"]};
@@ -3107,37 +4025,134 @@ class FuzzySearchLineEdit(QLineEdit):
                 color: {c["bg"]};
             }}
             """
-        )
+
+
+class FuzzySearchLineEdit(QLineEdit):
+    """
+    Custom QLineEdit with an integrated search result dropdown.
+    """
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.column_idx = 0
+        self.selected_product = None
+        self.popup = QListWidget()
+        self.popup.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
+        self.popup.setFocusPolicy(Qt.NoFocus)
+        self.popup.setAttribute(Qt.WA_ShowWithoutActivating)
+        self.popup.setUniformItemSizes(True)
+
+        self._apply_popup_style()
         self.popup.itemClicked.connect(self.on_item_clicked)
+        self._search_seq = 0
+        self._search_loading = False
+        self._select_first_on_load = False
+        self._search_debounce = Debouncer(self._do_search, 180, self)
         self.textChanged.connect(self.on_text_changed)
 
+    def _apply_popup_style(self):
+        current_theme = QApplication.instance().property("theme_name") or "mocha"
+        qss = _POPUP_QSS_CACHE.get(current_theme)
+        if qss is None:
+            qss = _POPUP_QSS_CACHE.setdefault(
+                current_theme, _build_popup_qss(current_theme)
+            )
+        if self.popup.styleSheet() != qss:
+            self.popup.setStyleSheet(qss)
+
+    def reset(self):
+        """
+        Clear search state so a pooled editor can be handed out again.
+        """
+        self._cancel_search()
+        self.popup.hide()
+        self.selected_product = None
+        with QSignalBlocker(self):
+            self.clear()
+        self._apply_popup_style()
+
     def set_column_context(self, col):
         self.column_idx = col
 
     def on_text_changed(self, text):
         """
-        Handle text changes in the search input and update the popup list.
+        Handle text changes in the search input: show cached results for
+        the exact text straight away, otherwise hide the popup and restart
+        the debounce. Either way any search still in flight is invalidated.
         """
+        self._search_seq += 1
+        # Any search still in flight is for earlier text.
+        self._search_loading = False
         if len(text) < 1:
+            self._search_debounce.cancel()
             self.popup.hide()
             return
+        # Only a hit for exactly this text may refresh the popup straight
+        # away; on a miss the listed rows belong to earlier text (e.g. a
+        # cached scan prefix), so hide them rather than leave them pickable.
+        products = self.db.peek_search_cache(text)
+        if products is not None:
+            self._search_debounce.cancel()
+            self._on_search_results(self._search_seq, products)
+            return
+        self.popup.setCurrentRow(-1)
+        self.popup.hide()
+        self._search_debounce.trigger()
+
+    def _cancel_search(self):
+        self._search_seq += 1
+        self._search_debounce.cancel()
+        self._search_loading = False
+        self._select_first_on_load = False
+
+    def _do_search(self):
+        """
+        Run the fuzzy search for the current text on the DB executor.
+        """
+        seq = self._search_seq
+        self._search_loading = True
+        run_db_async(
+            self.db,
+            lambda products: self._on_search_results(seq, products),
+            self.db.search_products_cached,
+            self.text(),
+        )
+
+    def _on_search_results(self, seq, products):
+        """
+        Update the popup list, ignoring results for text that has changed.
+        """
+        if seq != self._search_seq:
+            return
+        self._search_loading = False
+        select_first, self._select_first_on_load = self._select_first_on_load, False
         try:
-            products = self.db.search_products(text)
-            self.popup.clear()
             if not products:
+                self.popup.clear()
                 self.popup.hide()
+                if select_first:
+                    self.returnPressed.emit()
                 return
-            for p in products[:10]:
-                label = f"{p[1]} | {p[6]} | Qty: {p[7]:.2f} | MRP: {p[3]:.2f}"
-                item = QListWidgetItem(label)
-                item.setData(Qt.UserRole, p)
-                self.popup.addItem(item)
+            self.popup.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(self.popup):
+                    self.popup.clear()
+                    for p in products[:10]:
+                        label = f"{p[1]} | {p[6]} | Qty: {p[7]:.2f} | MRP: {p[3]:.2f}"
+                        item = QListWidgetItem(label)
+                        item.setData(Qt.UserRole, p)
+                        self.popup.addItem(item)
+            finally:
+                self.popup.setUpdatesEnabled(True)
             self.popup.setCurrentRow(0)
             self.popup.setFixedWidth(max(self.width() + 50, 450))
             self.popup.setFixedHeight(min(self.popup.count() * 38 + 5, 350))
             pos = self.mapToGlobal(self.rect().bottomLeft())
             self.popup.move(pos)
             self.popup.show()
+            if select_first:
+                self.on_item_clicked(self.popup.item(0))
         except Exception as e:
             print(f"Fuzzy search error: {e}")
             pass
@@ -3167,6 +4182,7 @@ class FuzzySearchLineEdit(QLineEdit):
         else:
             self.setText(p[2])
 
+        self._cancel_search()
         self.popup.hide()
         self.returnPressed.emit()
 
@@ -3175,9 +4191,16 @@ class FuzzySearchLineEdit(QLineEdit):
         Override key events to handle navigation within the search popup.
         """
         if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+            if self._search_debounce.is_pending() or self._search_loading:
+                # Results for the typed text are not in yet: pick the first
+                # one when they arrive, as ProductSearchDialog does.
+                self._select_first_on_load = True
+                self._search_debounce.flush()
+                return
             if self.popup.isVisible() and self.popup.currentRow() >= 0:
                 self.on_item_clicked(self.popup.currentItem())
                 return
+            self._cancel_search()
 
             if self.text().strip() == "":
                 try:
@@ -3213,12 +4236,14 @@ class FuzzySearchLineEdit(QLineEdit):
                 super().keyPressEvent(event)
                 return
             if event.key() == Qt.Key_Escape:
+                self._cancel_search()
                 self.popup.hide()
                 return
 
         super().keyPressEvent(event)
 
     def hideEvent(self, event):
+        self._cancel_search()
         self.popup.hide()
         super().hideEvent(event)
 
@@ -3231,21 +4256,74 @@ class FuzzyCompleterDelegate(QStyledItemDelegate):
     def __init__(self, db, parent=None):
         super().__init__(parent)
         self.db = db
+        self._editor = None
+        self._editor_in_use = False
 
     def createEditor(self, parent, option, index):
         if index.column() == 0:
-            editor = FuzzySearchLineEdit(self.db, parent)
-            editor.set_column_context(index.column())
-            return editor
+            if self._editor_in_use:
+                editor = FuzzySearchLineEdit(self.db, parent)
+                editor.set_column_context(index.column())
+                return editor
+            if self._editor is None:
+                self._editor = FuzzySearchLineEdit(self.db, parent)
+            elif self._editor.parent() is not parent:
+                self._editor.setParent(parent)
+            self._editor.reset()
+            self._editor.set_column_context(index.column())
+            self._editor_in_use = True
+            return self._editor
         return super().createEditor(parent, option, index)
 
+    def destroyEditor(self, editor, index):
+        if editor is self._editor:
+            editor.reset()
+            editor.hide()
+            self._editor_in_use = False
+            return
+        super().destroyEditor(editor, index)
+
     def setModelData(self, editor, model, index):
         if isinstance(editor, FuzzySearchLineEdit) and editor.selected_product:
             model.setData(index, editor.selected_product, Qt.UserRole)
         super().setModelData(editor, model, index)
 
 
-class MainWindow(QMainWindow):
+class MrpDelegate(QStyledItemDelegate):
+    """
+    Delegate for the billing grid's MRP column. The cell is a plain item
+    holding the MRP text, with the available MRPs in Qt.UserRole; a combo
+    box is only built while the cell is edited and there is a choice.
+    """
+
+    def createEditor(self, parent, option, index):
+        mrps = index.data(Qt.UserRole) or []
+        if len(mrps) < 2:
+            return None
+        combo = QComboBox(parent)
+        combo.setObjectName("grid-combo")
+        for item in mrps:
+            combo.addItem(f"{item['mrp']:.2f}", item)
+        combo.activated.connect(lambda _: self._commit_and_close(combo))
+        QTimer.singleShot(0, combo.showPopup)
+        return combo
+
+    def _commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+    def setEditorData(self, editor, index):
+        idx = editor.findText(index.data(Qt.DisplayRole) or "")
+        if idx >= 0:
+            editor.setCurrentIndex(idx)
+
+    def setModelData(self, editor, model, index):
+        text = editor.currentText()
+        if text and text != index.data(Qt.DisplayRole):
+            model.setData(index, text, Qt.EditRole)
+
+
+class MainWindow(_FSDialogMixin, QMainWindow):
     """
     Main application window for elytPOS.
     """
@@ -3257,18 +4335,77 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle(f"elytPOS v{__version__} - {user[2]}")
         self.showFullScreen()
+        from printer import ReceiptPrinter
+
         self.db = db_manager
         self.printer = ReceiptPrinter(db_manager)
         self.current_user = user
         self.updating_cell = False
         self.current_sale_id = None
         self.calc_dlg = None
+        self._lang_dlg = None
         self.theme_name = self.db.get_setting("theme", "mocha")
         self.currency_symbol = self.db.get_setting("currency_symbol", "₹")
+        self._pending_theme = self.theme_name
+        self._theme_debounce = Debouncer(self._apply_pending_theme, 50, self)
+        self._totals_debounce = Debouncer(self._refresh_total_label, 30, self)
         self.init_ui()
-        self.apply_theme(self.theme_name)
+        self.apply_theme_now(self.theme_name)
+        self._change_notifier = None
+        self._listen_backoff = _LISTEN_RETRY_MIN_MS
+        self._start_change_listener()
+
+    def _start_change_listener(self, resync=False):
+        """
+        LISTEN for product and scheme writes from other terminals, retrying
+        with a growing delay while the connection can't be opened. After a
+        reconnect the local caches are dropped, since notifications sent
+        while disconnected were missed.
+        """
+        fd = self.db.listen_changes()
+        if fd is None:
+            QTimer.singleShot(
+                self._listen_backoff, lambda: self._start_change_listener(True)
+            )
+            self._listen_backoff = min(self._listen_backoff * 2, _LISTEN_RETRY_MAX_MS)
+            return
+        self._listen_backoff = _LISTEN_RETRY_MIN_MS
+        self._change_notifier = QSocketNotifier(fd, QSocketNotifier.Read, self)
+        self._change_notifier.activated.connect(self._on_changes_notified)
+        if resync:
+            self.db.invalidate_product_index()
+            self.db.invalidate_schemes()
+
+    def _on_changes_notified(self, *_args):
+        """
+        Another terminal (or this one) changed products or schemes: drop the
+        matching local caches so the next lookup reloads them.
+        """
+        changed = self.db.poll_changes()
+        if changed is None:
+            # The listen connection dropped; stop watching its dead socket.
+            self._change_notifier.setEnabled(False)
+            self._change_notifier.deleteLater()
+            self._change_notifier = None
+            self._start_change_listener(True)
+            return
+        if "products_changed" in changed:
+            self.db.invalidate_product_index()
+        if "schemes_changed" in changed:
+            self.db.invalidate_schemes()
 
     def apply_theme(self, theme_name):
+        """
+        Switch the visual theme. Picks made in quick succession are coalesced
+        so only the last one restyles the application.
+        """
+        self._pending_theme = theme_name
+        self._theme_debounce.trigger()
+
+    def _apply_pending_theme(self):
+        self.apply_theme_now(self._pending_theme)
+
+    def apply_theme_now(self, theme_name):
         """
         Switch the application's visual theme and update all UI components.
         """
@@ -3276,14 +4413,23 @@ class MainWindow(QMainWindow):
 
         style = get_style(theme_name)
         app = QApplication.instance()
-        app.setProperty("theme_name", theme_name)
-        app.setWindowIcon(QIcon(resource_path(f"svg/logo_{theme_name}.svg")))
-        app.setStyleSheet(style)
+        if app.property("theme_name") != theme_name:
+            # main() already applied the startup theme's icon.
+            app.setProperty("theme_name", theme_name)
+            app.setWindowIcon(_theme_icon(theme_name))
+        self.setUpdatesEnabled(False)
+        try:
+            if app.styleSheet() != style:
+                app.setStyleSheet(style)
 
-        for widget in app.topLevelWidgets():
-            widget.setStyleSheet(style)
-            widget.style().unpolish(widget)
-            widget.style().polish(widget)
+            for widget in app.topLevelWidgets():
+                if widget.styleSheet() == style:
+                    continue
+                widget.setStyleSheet(style)
+                widget.style().unpolish(widget)
+                widget.style().polish(widget)
+        finally:
+            self.setUpdatesEnabled(True)
 
         self.db.set_setting("theme", theme_name)
         self.update_total_label_style()
@@ -3348,6 +4494,8 @@ class MainWindow(QMainWindow):
     def backup_on_exit(self):
         """
         Automatically perform a database backup when the application closes.
+        The dump is a compressed custom-format archive written by a QProcess
+        behind a progress dialog, so the window keeps painting meanwhile.
         """
         backup_dir = os.path.join(get_app_path(), "backups")
         if not os.path.exists(backup_dir):
@@ -3355,27 +4503,52 @@ class MainWindow(QMainWindow):
         from datetime import datetime
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = os.path.join(backup_dir, f"auto_backup_{timestamp}.sql")
+        path = os.path.join(backup_dir, f"auto_backup_{timestamp}.dump")
         params = self.db.conn_params
-        env = os.environ.copy()
-        env["PGPASSWORD"] = params["password"]
-        cmd = [
-            "pg_dump",
-            "-h",
-            params["host"],
-            "-p",
-            params["port"],
-            "-U",
-            params["user"],
-            "-f",
-            path,
-            params["dbname"],
-        ]
+        env = QProcessEnvironment.systemEnvironment()
+        env.insert("PGPASSWORD", params["password"])
+        conn_args = ["-h", params["host"], "-p", params["port"], "-U", params["user"]]
+
+        progress = QProgressDialog("Backing up database...", None, 0, 0, self)
+        progress.setWindowTitle("Backup")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+        ok, stderr = False, ""
         try:
-            subprocess.run(cmd, env=env, check=True, capture_output=True)
+            for compress in dict.fromkeys((pg_dump_compression(), "6")):
+                args = ["-Fc", "-Z", compress, "-f", path, params["dbname"]]
+                ok, stderr = self._wait_for_process("pg_dump", conn_args + args, env)
+                if ok or "zstd" not in stderr:
+                    break
+                pg_dump_zstd_unsupported()
+        finally:
+            progress.close()
+        if ok:
             print(f"Auto-backup successful: {path}")
-        except Exception as e:
-            print(f"Auto-backup failed: {e}")
+        else:
+            print(f"Auto-backup failed: {stderr.strip() or 'unknown error'}")
+
+    def _wait_for_process(self, program, args, env):
+        """
+        Run `program` in a QProcess and spin a local event loop until it
+        exits. Returns (ok, stderr).
+        """
+        proc = QProcess(self)
+        proc.setProcessEnvironment(env)
+        loop = QEventLoop()
+        proc.finished.connect(loop.quit)
+        proc.start(program, args)
+        try:
+            if not proc.waitForStarted():
+                return False, f"Could not start {program}."
+            if proc.state() != QProcess.NotRunning:
+                loop.exec()
+            stderr = bytes(proc.readAllStandardError()).decode(errors="replace")
+            ok = proc.exitStatus() == QProcess.NormalExit and proc.exitCode() == 0
+            return ok, stderr
+        finally:
+            proc.deleteLater()
 
     def init_ui(self):
         company_name = self.db.get_setting("company_name", "elytPOS System")
@@ -3547,10 +4720,24 @@ class MainWindow(QMainWindow):
 
         self.grid = ExcelTable()
         self.grid.itemChanged.connect(self.handle_grid_change)
+        # Per-row amounts mirrored from column 7, so recalc_totals() never
+        # has to re-parse every row's text on each keystroke; likewise the
+        # product tuple behind column 1 and the parsed qty/rate/discount,
+        # so checkout skips empty rows and never re-parses cell text.
+        self._row_amounts = []
+        self._row_products = []
+        self._row_nums = []
+        grid_model = self.grid.model()
+        grid_model.dataChanged.connect(self._on_grid_data_changed)
+        grid_model.rowsInserted.connect(self._on_grid_rows_inserted)
+        grid_model.rowsRemoved.connect(self._on_grid_rows_removed)
+        grid_model.modelReset.connect(self._reload_row_amounts)
+        self._reload_row_amounts()
         layout.addWidget(self.grid)
         self.grid.setItemDelegateForColumn(
             0, FuzzyCompleterDelegate(self.db, self.grid)
         )
+        self.grid.setItemDelegateForColumn(4, MrpDelegate(self.grid))
         footer = QHBoxLayout()
         btn_layout = QHBoxLayout()
         btn_f2 = QPushButton("&Save (F2)")
@@ -3567,14 +4754,17 @@ class MainWindow(QMainWindow):
 
         act_history = QAction("&History (F5)", self)
         act_history.triggered.connect(self.view_history)
+        act_history.setShortcut("F5")
         more_menu.addAction(act_history)
 
         act_hold = QAction("&Hold (F6)", self)
         act_hold.triggered.connect(self.hold_current_bill)
+        act_hold.setShortcut("F6")
         more_menu.addAction(act_hold)
 
         act_recall = QAction("&Recall (F7)", self)
         act_recall.triggered.connect(self.recall_held_bill)
+        act_recall.setShortcut("F7")
         more_menu.addAction(act_recall)
 
         act_calc = QAction("Ca&lc (F8)", self)
@@ -3601,38 +4791,20 @@ class MainWindow(QMainWindow):
         layout.addLayout(footer)
         self.grid.setFocus()
         self.grid.setCurrentCell(0, 0)
-        c_shortcut = QAction(self)
-        c_shortcut.setShortcut("F3")
-        c_shortcut.triggered.connect(self.open_customer_search)
-        self.addAction(c_shortcut)
-        s_shortcut = QAction(self)
-        s_shortcut.setShortcut("F10")
-        s_shortcut.triggered.connect(self.open_search_dialog)
-        self.addAction(s_shortcut)
-        h_shortcut = QAction(self)
-        h_shortcut.setShortcut("F5")
-        h_shortcut.triggered.connect(self.view_history)
-        self.addAction(h_shortcut)
-        hold_shortcut = QAction(self)
-        hold_shortcut.setShortcut("F6")
-        hold_shortcut.triggered.connect(self.hold_current_bill)
-        self.addAction(hold_shortcut)
-        recall_shortcut = QAction(self)
-        recall_shortcut.setShortcut("F7")
-        recall_shortcut.triggered.connect(self.recall_held_bill)
-        self.addAction(recall_shortcut)
-        save_shortcut = QAction(self)
-        save_shortcut.setShortcut("F2")
-        save_shortcut.triggered.connect(self.process_checkout)
-        self.addAction(save_shortcut)
-        clear_shortcut = QAction(self)
-        clear_shortcut.setShortcut("F4")
-        clear_shortcut.triggered.connect(self.reset_grid)
-        self.addAction(clear_shortcut)
-        quit_shortcut = QAction(self)
-        quit_shortcut.setShortcut("Esc")
-        quit_shortcut.triggered.connect(self.close)
-        self.addAction(quit_shortcut)
+        # History/Hold/Recall shortcuts live on the "More" menu actions; the
+        # window only needs to own them so they fire while the menu is closed.
+        self.addActions([act_history, act_hold, act_recall])
+        for key, slot in (
+            ("F2", self.process_checkout),
+            ("F3", self.open_customer_search),
+            ("F4", self.reset_grid),
+            ("F10", self.open_search_dialog),
+            ("Esc", self.close),
+        ):
+            shortcut = QAction(self)
+            shortcut.setShortcut(key)
+            shortcut.triggered.connect(slot)
+            self.addAction(shortcut)
 
     def open_printer_config(self):
         if not self.check_permission("settings"):
@@ -3642,14 +4814,20 @@ class MainWindow(QMainWindow):
                 "You do not have permission to access Printer Settings.",
             )
             return
+        from printer_config_dialog import PrinterConfigDialog
+
         dialog = PrinterConfigDialog(self.printer, self)
         dialog.exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_help(self):
+        from help_system import HelpDialog
+
         HelpDialog(self).exec()
 
     def open_license(self):
+        from help_system import LicenseDialog
+
         LicenseDialog(self).exec()
 
     def open_scheme_entry(self, sid=None):
@@ -3668,7 +4846,7 @@ class MainWindow(QMainWindow):
             dlg.exec()
         else:
             SchemeEntryDialog(self.db, sid, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_scheme_list(self, mode):
         if not self.check_permission("manage_schemes"):
@@ -3677,7 +4855,7 @@ class MainWindow(QMainWindow):
             )
             return
         SchemeListDialog(self.db, mode, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_customer_master(self):
         if not self.check_permission("manage_customers"):
@@ -3686,7 +4864,7 @@ class MainWindow(QMainWindow):
             )
             return
         CustomerMasterDialog(self.db, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_customer_search(self):
         dlg = CustomerSearchDialog(self.db, self)
@@ -3696,7 +4874,7 @@ class MainWindow(QMainWindow):
             self.cust_name_label.setText(f"Name: {customer[1]}")
             self.cust_mobile_label.setText(f"Mob: {customer[2]}")
             self.cust_mobile_input.clear()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_purchase_master(self):
         if not self.check_permission("manage_purchases"):
@@ -3705,7 +4883,7 @@ class MainWindow(QMainWindow):
             )
             return
         PurchaseEntryDialog(self.db, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_inventory(self):
         if not self.check_permission("manage_inventory"):
@@ -3714,7 +4892,7 @@ class MainWindow(QMainWindow):
             )
             return
         InventoryDialog(self.db, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_uom_master(self):
         if not self.check_permission("manage_inventory"):
@@ -3723,7 +4901,7 @@ class MainWindow(QMainWindow):
             )
             return
         UOMMasterDialog(self.db, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_language_master(self):
         if not self.check_permission("manage_inventory"):
@@ -3732,7 +4910,7 @@ class MainWindow(QMainWindow):
             )
             return
         LanguageMasterDialog(self.db, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_create_company(self):
         if not self.check_permission("settings") and not self.check_permission(
@@ -3743,7 +4921,7 @@ class MainWindow(QMainWindow):
             )
             return
         CreateCompanyDialog(config_params=self.db.conn_params, parent=self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_modify_company(self):
         if not self.check_permission("settings"):
@@ -3755,7 +4933,7 @@ class MainWindow(QMainWindow):
             return
         CreateCompanyDialog(self.db.conn_params, db_manager=self.db, parent=self).exec()
         self.printer.load_from_db()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_user_master(self):
         if not self.check_permission("manage_users"):
@@ -3764,7 +4942,7 @@ class MainWindow(QMainWindow):
             )
             return
         UserMasterDialog(self.db, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_maintenance(self):
         if not self.check_permission("database_ops"):
@@ -3775,7 +4953,7 @@ class MainWindow(QMainWindow):
             )
             return
         MaintenanceDashboardDialog(self.db, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_recycle_bin(self):
         if not self.check_permission("database_ops") and not self.check_permission(
@@ -3788,10 +4966,12 @@ class MainWindow(QMainWindow):
             )
             return
         RecycleBinDialog(self.db, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_calculator(self):
         if not hasattr(self, "calc_dlg") or self.calc_dlg is None:
+            from calculator_gui import CalculatorDialog
+
             self.calc_dlg = CalculatorDialog(self)
         self.calc_dlg.show()
         self.calc_dlg.raise_()
@@ -3799,7 +4979,7 @@ class MainWindow(QMainWindow):
 
     def view_history(self):
         SalesHistoryDialog(self.db, self.printer, self).exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def handle_customer_lookup(self):
         query = self.cust_mobile_input.text().strip()
@@ -3812,43 +4992,57 @@ class MainWindow(QMainWindow):
             self.cust_name_label.setText(f"Name: {customer[1]}")
             self.cust_mobile_label.setText(f"Mob: {customer[2]}")
             self.cust_mobile_input.clear()
-        self.showFullScreen()
+        self._ensure_fullscreen()
+
+    def _bill_rows(self):
+        """
+        Snapshot each billed grid row as (product, qty, rate, disc, mrp, uom,
+        factor). Product and numbers come from the row caches; rows without a
+        product or with unparsable numbers are skipped.
+        """
+        item, cell_widget = self.grid.item, self.grid.cellWidget
+        for r, prod in enumerate(self._row_products):
+            if not prod:
+                continue
+            nums = self._row_numbers(r)
+            if nums is None:
+                continue
+            qty, rate, disc = nums
+            uom, factor = "", 1.0
+            uom_combo = cell_widget(r, 3)
+            if uom_combo:
+                uom = uom_combo.currentText()
+                uom_data = uom_combo.currentData()
+                if uom_data:
+                    try:
+                        factor = float(uom_data.get("factor", 1.0))
+                    except (TypeError, ValueError):
+                        factor = 1.0
+            else:
+                uom_it = item(r, 3)
+                uom = uom_it.text() if uom_it else ""
+            yield prod, qty, rate, disc, _cell_float(item(r, 4)), uom, factor
 
     def hold_current_bill(self):
         """
         Save the current unsaved bill to the database 'held_sales' table for later recall.
         """
         items, total = [], 0.0
-        for r in range(self.grid.rowCount()):
-            name_it = self.grid.item(r, 1)
-            if not name_it or not name_it.data(Qt.UserRole):
-                continue
-            try:
-                qty, rate, disc = (
-                    float(self.grid.item(r, 2).text()),
-                    float(self.grid.item(r, 5).text()),
-                    float(self.grid.item(r, 6).text()),
+        for prod, qty, rate, disc, mrp, uom, _factor in self._bill_rows():
+            eff_p = rate * (1 - disc / 100)
+            if qty > 0:
+                items.append(
+                    {
+                        "id": prod[0],
+                        "name": prod[1],
+                        "barcode": prod[2],
+                        "price": eff_p,
+                        "mrp": mrp,
+                        "quantity": qty,
+                        "uom": uom,
+                    }
                 )
-                mrp = 0.0
-                mrp_combo = self.grid.cellWidget(r, 4)
-                if mrp_combo:
-                    mrp = float(mrp_combo.currentText())
-                eff_p = rate * (1 - disc / 100)
-                if qty > 0:
-                    items.append(
-                        {
-                            "id": name_it.data(Qt.UserRole)[0],
-                            "name": name_it.data(Qt.UserRole)[1],
-                            "barcode": name_it.data(Qt.UserRole)[2],
-                            "price": eff_p,
-                            "mrp": mrp,
-                            "quantity": qty,
-                            "uom": self.grid.item(r, 3).text(),
-                        }
-                    )
-                    total += qty * eff_p
-            except Exception:
-                continue
+                total += qty * eff_p
         if not items:
             return
         if self.db.hold_sale(items, total, self.current_user[0]):
@@ -3864,28 +5058,29 @@ class MainWindow(QMainWindow):
             held_id = dlg.selected_held_id
             items = self.db.get_held_sale_items(held_id)
             self.reset_grid()
-            self.grid.setRowCount(len(items) + 1)
             self.updating_cell = True
-            for row, item in enumerate(items):
-                prod = self.db.find_product_by_barcode(item["barcode"])
-                if prod:
-                    self.grid.setItem(row, 0, QTableWidgetItem(item["barcode"]))
-                    self.grid.setItem(row, 1, QTableWidgetItem(item["name"]))
-                    self.grid.setItem(row, 2, QTableWidgetItem(str(item["quantity"])))
-                    self.update_uom_dropdown(row, prod[0], item["uom"])
-                    self.update_mrp_dropdown(row, prod[0], item["uom"], item["mrp"])
-                    self.grid.setItem(row, 5, QTableWidgetItem(f"{item['price']:.3f}"))
-                    self.grid.setItem(row, 6, QTableWidgetItem("0.0"))
-                    self.grid.setItem(
-                        row,
-                        7,
-                        QTableWidgetItem(f"{item['quantity'] * item['price']:.2f}"),
-                    )
-                    self.grid.item(row, 1).setData(Qt.UserRole, prod)
+            prods = self.db.find_products_by_barcodes([it["barcode"] for it in items])
+            set_item, user_role = self.grid.setItem, Qt.UserRole
+            with batch_table_fill(self.grid, len(items) + 1):
+                for row, item in enumerate(items):
+                    prod = prods.get(item["barcode"])
+                    if prod:
+                        name_it = _ro_item(item["name"])
+                        name_it.setData(user_role, prod)
+                        set_item(row, 0, QTableWidgetItem(item["barcode"]))
+                        set_item(row, 1, name_it)
+                        set_item(row, 2, QTableWidgetItem(str(item["quantity"])))
+                        self.update_uom_dropdown(row, prod[0], item["uom"])
+                        self.update_mrp_dropdown(row, prod[0], item["uom"], item["mrp"])
+                        set_item(row, 5, QTableWidgetItem(_FMT3(item["price"])))
+                        set_item(row, 6, QTableWidgetItem("0.0"))
+                        set_item(
+                            row, 7, _ro_item(_FMT2(item["quantity"] * item["price"]))
+                        )
             self.updating_cell = False
             self.db.delete_held_sale(held_id)
             self.recalc_totals()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def load_bill_for_modification(self, sid):
         """
@@ -3895,11 +5090,8 @@ class MainWindow(QMainWindow):
         self.reset_grid()
         self.current_sale_id = sid
         self.bill_no_label.setText(f"<b>{sid}</b> [EDIT MODE]")
-        self.bill_no_label.setObjectName("info")
-        self.bill_no_label.style().unpolish(self.bill_no_label)
-        self.bill_no_label.style().polish(self.bill_no_label)
-        sales = self.db.get_sales_history(query=str(sid))
-        sale_header = next((s for s in sales if str(s[0]) == str(sid)), None)
+        self._set_bill_label_name("info")
+        sale_header = self.db.get_sale_header(sid)
         if sale_header:
             if sale_header[1]:
                 self.date_edit.setDate(sale_header[1].date())
@@ -3911,35 +5103,43 @@ class MainWindow(QMainWindow):
                     self.cust_name_label.setText(f"Name: {customer[1]}")
                     self.cust_mobile_label.setText(f"Mob: {customer[2]}")
         items = self.db.get_sale_items(sid)
-        self.grid.setRowCount(len(items) + 1)
         self.updating_cell = True
-        for row, item in enumerate(items):
-            prod = self.db.find_product_by_barcode(item["barcode"])
-            if prod:
-                self.grid.setItem(row, 0, QTableWidgetItem(item["barcode"]))
-                self.grid.setItem(row, 1, QTableWidgetItem(item["name"]))
-                self.grid.setItem(row, 2, QTableWidgetItem(str(item["quantity"])))
-
-                self.update_uom_dropdown(row, prod[0], item["uom"])
-
-                mrp = item.get("mrp")
-                if not mrp:
-                    uom_data = self.db.get_product_uom_data(prod[0], item["uom"])
-                    mrp = uom_data["mrp"] if uom_data else prod[3]
-
-                self.update_mrp_dropdown(row, prod[0], item["uom"], mrp)
-                self.grid.setItem(row, 5, QTableWidgetItem(f"{item['price']:.3f}"))
-                self.grid.setItem(row, 6, QTableWidgetItem("0.0"))
-                calc_rate = item["price"]
-                if item["uom"] and item["uom"].lower() in ("g", "gram", "grams"):
-                    calc_rate /= 1000.0
-                self.grid.setItem(
-                    row, 7, QTableWidgetItem(f"{item['quantity'] * calc_rate:.2f}")
-                )
-                self.grid.item(row, 1).setData(Qt.UserRole, prod)
+        prods = self.db.find_products_by_barcodes([it["barcode"] for it in items])
+        uom_data_map = self.db.get_product_uom_data_bulk(
+            [
+                (prods[it["barcode"]][0], it["uom"])
+                for it in items
+                if not it.get("mrp") and it["barcode"] in prods
+            ]
+        )
+        set_item, user_role = self.grid.setItem, Qt.UserRole
+        with batch_table_fill(self.grid, len(items) + 1):
+            for row, item in enumerate(items):
+                prod = prods.get(item["barcode"])
+                if prod:
+                    name_it = _ro_item(item["name"])
+                    name_it.setData(user_role, prod)
+                    set_item(row, 0, QTableWidgetItem(item["barcode"]))
+                    set_item(row, 1, name_it)
+                    set_item(row, 2, QTableWidgetItem(str(item["quantity"])))
+
+                    self.update_uom_dropdown(row, prod[0], item["uom"])
+
+                    mrp = item.get("mrp")
+                    if not mrp:
+                        uom_data = uom_data_map.get((prod[0], item["uom"]))
+                        mrp = uom_data["mrp"] if uom_data else prod[3]
+
+                    self.update_mrp_dropdown(row, prod[0], item["uom"], mrp)
+                    set_item(row, 5, QTableWidgetItem(_FMT3(item["price"])))
+                    set_item(row, 6, QTableWidgetItem("0.0"))
+                    calc_rate = item["price"]
+                    if _is_gram(item["uom"]):
+                        calc_rate /= 1000.0
+                    set_item(row, 7, _ro_item(_FMT2(item["quantity"] * calc_rate)))
         self.updating_cell = False
         self.recalc_totals()
-        self.showFullScreen()
+        self._ensure_fullscreen()
 
     def open_search_dialog(self):
         """
@@ -3947,7 +5147,7 @@ class MainWindow(QMainWindow):
         """
         dlg = ProductSearchDialog(self.db, self)
         res = dlg.exec()
-        self.showFullScreen()
+        self._ensure_fullscreen()
         if res == QDialog.Accepted:
             row = max(0, self.grid.currentRow())
             if self.grid.item(row, 0) and self.grid.item(row, 0).text():
@@ -3996,16 +5196,19 @@ class MainWindow(QMainWindow):
                     if name_it:
                         prod = name_it.data(Qt.UserRole)
                         if prod:
-                            uom_data = self.db.get_product_uom_data(prod[0], uom_text)
+                            uom_data = self.db.get_product_uom_data_cached(
+                                prod[0], uom_text
+                            )
                             if uom_data:
-                                self.grid.setItem(
-                                    row, 5, QTableWidgetItem(f"{uom_data['price']:.3f}")
-                                )
+                                self._set_cell(row, 5, _FMT3(uom_data["price"]))
                                 self.update_mrp_dropdown(
                                     row, prod[0], uom_text, uom_data["mrp"]
                                 )
                 self.recalc_row(row)
-            elif col in (2, 4, 5, 6):
+            elif col == 4:
+                self.handle_mrp_change(row)
+                self.recalc_row(row)
+            elif col in (2, 5, 6):
                 self.recalc_row(row)
             self.recalc_totals()
         finally:
@@ -4027,13 +5230,13 @@ class MainWindow(QMainWindow):
             elif len(product) >= 10:
                 qty = float(product[9])
 
-            self.grid.setItem(row, 1, QTableWidgetItem(name))
-            self.grid.setItem(row, 2, QTableWidgetItem(f"{qty:.2f}"))
+            self.grid.setItem(row, 1, _ro_item(name))
+            self.grid.setItem(row, 2, QTableWidgetItem(_FMT2(qty)))
 
             self.update_uom_dropdown(row, product[0], uom)
 
             self.update_mrp_dropdown(row, product[0], uom, mrp)
-            self.grid.setItem(row, 5, QTableWidgetItem(f"{price:.3f}"))
+            self.grid.setItem(row, 5, QTableWidgetItem(_FMT3(price)))
             self.grid.setItem(row, 6, QTableWidgetItem("0.0"))
 
             self.grid.item(row, 1).setData(Qt.UserRole, product)
@@ -4044,7 +5247,7 @@ class MainWindow(QMainWindow):
     def update_uom_dropdown(self, row, product_id, current_uom):
         combo = QComboBox()
         combo.setObjectName("grid-combo")
-        units = self.db.get_product_units(product_id)
+        units = self.db.get_product_units_cached(product_id)
 
         if not units:
             units = [{"uom": current_uom, "price": 0.0, "mrp": 0.0}]
@@ -4067,192 +5270,226 @@ class MainWindow(QMainWindow):
         if data:
             self.updating_cell = True
             try:
-                self.grid.setItem(row, 5, QTableWidgetItem(f"{data['price']:.3f}"))
-
-                name_it = self.grid.item(row, 1)
-                if name_it:
-                    prod = name_it.data(Qt.UserRole)
+                with QSignalBlocker(self.grid):
+                    self._set_cell(row, 5, _FMT3(data["price"]))
+                    name_it = self.grid.item(row, 1)
+                    prod = name_it.data(Qt.UserRole) if name_it else None
                     if prod:
-                        self.update_mrp_dropdown(row, prod[0], data["uom"], data["mrp"])
+                        self.update_mrp_dropdown(
+                            row, prod[0], data["uom"], data["mrp"]
+                        )
             finally:
                 self.updating_cell = False
             self.recalc_row(row)
 
     def update_mrp_dropdown(self, row, product_id, uom, current_mrp):
         """
-        Populate the MRP column with a dropdown if multiple prices exist.
+        Fill the MRP cell and keep the available MRPs on it; MrpDelegate
+        offers them as a dropdown when there is more than one.
         """
-        combo = QComboBox()
-        combo.setObjectName("grid-combo")
-        mrps = self.db.get_available_mrps(product_id, uom)
+        mrps = self.db.get_available_mrps_cached(product_id, uom)
         if not mrps:
             mrps = [{"mrp": float(current_mrp), "price": 0.0, "uom_alias": None}]
-        for item in mrps:
-            combo.addItem(f"{item['mrp']:.2f}", item)
-            if abs(item["mrp"] - float(current_mrp)) < 0.001:
-                combo.setCurrentIndex(combo.count() - 1)
-        combo.currentIndexChanged.connect(lambda: self.handle_mrp_change(row))
-        self.grid.setCellWidget(row, 4, combo)
+        current = next(
+            (m for m in mrps if abs(m["mrp"] - float(current_mrp)) < 0.001), mrps[0]
+        )
+        item = QTableWidgetItem(_FMT2(current["mrp"]))
+        item.setData(Qt.UserRole, mrps)
+        with QSignalBlocker(self.grid):
+            self.grid.setItem(row, 4, item)
+
+    def row_mrp(self, row):
+        """
+        MRP shown in the given grid row, or 0.0 if there is none.
+        """
+        return _cell_float(self.grid.item(row, 4))
 
     def handle_mrp_change(self, row):
-        if self.updating_cell:
-            return
-        combo = self.grid.cellWidget(row, 4)
-        if not combo:
+        """
+        Apply the selling price of the MRP picked in the given row.
+        """
+        it = self.grid.item(row, 4)
+        if not it:
             return
-        data = combo.currentData()
+        data = next(
+            (m for m in it.data(Qt.UserRole) or [] if _FMT2(m["mrp"]) == it.text()),
+            None,
+        )
         if data:
-            self.updating_cell = True
-            try:
-                if data.get("price") and data["price"] > 0:
-                    self.grid.setItem(row, 5, QTableWidgetItem(f"{data['price']:.3f}"))
-            finally:
-                self.updating_cell = False
-            self.recalc_row(row)
+            price = data.get("price")
+            if price and price > 0:
+                with QSignalBlocker(self.grid):
+                    self._set_cell(row, 5, _FMT3(price))
 
     def recalc_row(self, row):
         """
         Update the amount and discount columns for a specific row based on quantity and unit.
         """
+        item = self.grid.item
+        name_item = item(row, 1)
+        prod = name_item.data(Qt.UserRole) if name_item else None
+        if not prod:
+            return
+        qty_item, rate_item = item(row, 2), item(row, 5)
         try:
-            qty_item, rate_item, _disc_item = (
-                self.grid.item(row, 2),
-                self.grid.item(row, 5),
-                self.grid.item(row, 6),
-            )
+            qty = float(qty_item.text()) if qty_item else 0.0
+            rate = float(rate_item.text()) if rate_item else 0.0
+        except ValueError:
+            # Half-typed number; the row is recalculated once it parses.
+            return
 
-            uom = ""
-            uom_combo = self.grid.cellWidget(row, 3)
-            if uom_combo:
-                uom = uom_combo.currentText()
-            else:
-                uom_item = self.grid.item(row, 3)
-                if uom_item:
-                    uom = uom_item.text()
+        uom = ""
+        uom_combo = self.grid.cellWidget(row, 3)
+        if uom_combo:
+            uom = uom_combo.currentText()
+        else:
+            uom_item = item(row, 3)
+            if uom_item:
+                uom = uom_item.text()
+
+        mrp = self.row_mrp(row)
+        p_data = list(prod)
+
+        if mrp == 0 and len(p_data) > 3:
+            mrp = float(p_data[3])
+
+        if uom and uom != p_data[6]:
+            uom_data = self.db.get_product_uom_data_cached(p_data[0], uom)
+            if uom_data:
+                rate = uom_data["price"]
+                mrp = uom_data["mrp"]
+                p_data[6], p_data[7], p_data[4], p_data[3] = (
+                    uom_data["uom"],
+                    uom_data["factor"],
+                    uom_data["price"],
+                    uom_data["mrp"],
+                )
+                self.updating_cell = True
+                try:
+                    with QSignalBlocker(self.grid):
+                        self.update_mrp_dropdown(row, p_data[0], uom, mrp)
+                        self._set_cell(row, 5, _FMT3(rate))
+                finally:
+                    self.updating_cell = False
+                name_item.setData(Qt.UserRole, tuple(p_data))
+        if rate == 0 and len(p_data) > 10:
+            rate = float(p_data[10]) * float(p_data[7])
+            self._set_cell(row, 5, _FMT3(rate))
+        is_gram = _is_gram(uom)
+        s_type, s_val = None, 0.0
+        scheme = self.db.get_active_scheme_cached(p_data[0], qty, uom, mrp)
+        if scheme:
+            s_val, s_type, s_uom = float(scheme[1]), scheme[2], scheme[3]
+            if s_uom and uom != s_uom:
+                uom = s_uom
+                self._set_cell(row, 3, uom)
+                uom_data = self.db.get_product_uom_data_cached(p_data[0], uom)
+                if uom_data:
+                    p_data[6], p_data[7], p_data[4], p_data[3] = (
+                        uom_data["uom"],
+                        uom_data["factor"],
+                        uom_data["price"],
+                        uom_data["mrp"],
+                    )
+                    name_item.setData(Qt.UserRole, tuple(p_data))
+        scheme_rate, disc_pct, net = _price_row(qty, rate, is_gram, s_type, s_val)
+        if scheme_rate is not None:
+            rate = scheme_rate
+            self._set_cell(row, 5, _FMT3(rate))
+        self._set_cell(row, 6, "0.0" if disc_pct is None else _FMT3(disc_pct))
+        self._set_cell(row, 7, _FMT2(net))
+        # Set after the cell writes above, whose dataChanged clears the entry.
+        self._row_nums[row] = (qty, rate, disc_pct or 0.0)
 
-            qty, rate = (
-                float(qty_item.text()) if qty_item else 0.0,
-                float(rate_item.text()) if rate_item else 0.0,
+    def _set_cell(self, row, col, text):
+        """
+        Show `text` in a grid cell, reusing its item and skipping the write
+        altogether when the text is unchanged.
+        """
+        it = self.grid.item(row, col)
+        if it is None:
+            self.grid.setItem(
+                row, col, _ro_item(text) if col in _RO_COLS else QTableWidgetItem(text)
             )
-
-            mrp = 0.0
-            mrp_combo = self.grid.cellWidget(row, 4)
-            if mrp_combo:
-                try:
-                    mrp = float(mrp_combo.currentText())
-                except ValueError:
-                    mrp = 0.0
-
-            name_item = self.grid.item(row, 1)
-            if name_item and name_item.data(Qt.UserRole):
-                p_data = list(name_item.data(Qt.UserRole))
-
-                if mrp == 0 and len(p_data) > 3:
-                    mrp = float(p_data[3])
-
-                if uom and uom != p_data[6]:
-                    uom_data = self.db.get_product_uom_data(p_data[0], uom)
-                    if uom_data:
-                        rate = uom_data["price"]
-                        mrp = uom_data["mrp"]
-                        p_data[6], p_data[7], p_data[4], p_data[3] = (
-                            uom_data["uom"],
-                            uom_data["factor"],
-                            uom_data["price"],
-                            uom_data["mrp"],
-                        )
-                        self.updating_cell = True
-                        try:
-                            self.update_mrp_dropdown(row, p_data[0], uom, mrp)
-                            self.grid.setItem(row, 5, QTableWidgetItem(f"{rate:.3f}"))
-                        finally:
-                            self.updating_cell = False
-                        name_item.setData(Qt.UserRole, tuple(p_data))
-                if rate == 0 and len(p_data) > 10:
-                    rate = float(p_data[10]) * float(p_data[7])
-                    self.grid.setItem(row, 5, QTableWidgetItem(f"{rate:.3f}"))
-                is_gram = uom and uom.lower() in ("g", "gram", "grams")
-                effective_rate = rate
-                if is_gram:
-                    effective_rate /= 1000.0
-                gross, disc_amt = (
-                    qty * effective_rate,
-                    0.0,
-                )
-                scheme = self.db.get_active_scheme_for_product(p_data[0], qty, uom, mrp)
-                if scheme:
-                    s_val, s_type, s_uom = float(scheme[1]), scheme[2], scheme[3]
-                    if s_uom and uom != s_uom:
-                        uom = s_uom
-                        self.grid.setItem(row, 3, QTableWidgetItem(uom))
-                        uom_data = self.db.get_product_uom_data(p_data[0], uom)
-                        if uom_data:
-                            p_data[6], p_data[7], p_data[4], p_data[3] = (
-                                uom_data["uom"],
-                                uom_data["factor"],
-                                uom_data["price"],
-                                uom_data["mrp"],
-                            )
-                            name_item.setData(Qt.UserRole, tuple(p_data))
-                    if s_type == "absolute_rate":
-                        abs_rate = s_val
-                        if is_gram:
-                            abs_rate /= 1000.0
-                        gross = qty * abs_rate
-                        self.grid.setItem(row, 5, QTableWidgetItem(f"{abs_rate:.3f}"))
-                        disc_amt = 0.0
-                        self.grid.setItem(row, 6, QTableWidgetItem("0.0"))
-                    elif s_type == "percent":
-                        disc_amt = (gross * s_val) / 100
-                        self.grid.setItem(row, 6, QTableWidgetItem(f"{s_val:.3f}"))
-                    elif s_type == "amount":
-                        benefit = s_val
-                        if is_gram:
-                            benefit /= 1000.0
-                        disc_amt = qty * benefit
-                        self.grid.setItem(
-                            row,
-                            6,
-                            QTableWidgetItem(
-                                f"{(disc_amt / gross) * 100 if gross > 0 else 0:.3f}"
-                            ),
-                        )
-                else:
-                    disc_amt = 0.0
-                    self.grid.setItem(row, 6, QTableWidgetItem("0.0"))
-                self.grid.setItem(row, 7, QTableWidgetItem(f"{gross - disc_amt:.2f}"))
-            for c in [1, 4, 7]:
-                it = self.grid.item(row, c)
-                if it:
-                    it.setFlags(it.flags() & ~Qt.ItemIsEditable)
-        except Exception:
-            pass
+        elif it.text() != text:
+            it.setText(text)
 
     def _fmt(self, val):
         """
         Format a numeric value for UI display, stripping unnecessary decimals.
         """
-        if float(val) == int(float(val)):
-            return str(int(float(val)))
-        return f"{float(val):.2f}"
+        f = float(val)
+        i = int(f)
+        return str(i) if f == i else _FMT2(f)
+
+    def _row_amount(self, row):
+        return _cell_float(self.grid.item(row, 7))
+
+    def _row_product(self, row):
+        it = self.grid.item(row, 1)
+        return it.data(Qt.UserRole) if it else None
+
+    def _row_numbers(self, row):
+        """
+        (qty, rate, disc) for a row: the values recalc_row last computed, or
+        parsed from the cells when the row was filled or edited since. None
+        while any is missing or not a number.
+        """
+        nums = self._row_nums[row]
+        if nums is not None:
+            return nums
+        item = self.grid.item
+        try:
+            return (
+                float(item(row, 2).text()),
+                float(item(row, 5).text()),
+                float(item(row, 6).text()),
+            )
+        except (AttributeError, ValueError):
+            return None
+
+    def _reload_row_amounts(self):
+        rows = range(self.grid.rowCount())
+        self._row_amounts = [self._row_amount(r) for r in rows]
+        self._row_products = [self._row_product(r) for r in rows]
+        self._row_nums = [None] * len(rows)
+
+    def _on_grid_data_changed(self, top_left, bottom_right, _roles=()):
+        first_col, last_col = top_left.column(), bottom_right.column()
+        rows = range(top_left.row(), bottom_right.row() + 1)
+        if first_col <= 7 <= last_col:
+            for r in rows:
+                self._row_amounts[r] = self._row_amount(r)
+        if first_col <= 1 <= last_col:
+            for r in rows:
+                self._row_products[r] = self._row_product(r)
+        if first_col <= 6 and last_col >= 2:
+            # Only mark the numbers stale; they are parsed again on demand.
+            for r in rows:
+                self._row_nums[r] = None
+
+    def _on_grid_rows_inserted(self, _parent, first, last):
+        self._row_amounts[first:first] = [0.0] * (last - first + 1)
+        self._row_products[first:first] = [None] * (last - first + 1)
+        self._row_nums[first:first] = [None] * (last - first + 1)
+
+    def _on_grid_rows_removed(self, _parent, first, last):
+        del self._row_amounts[first : last + 1]
+        del self._row_products[first : last + 1]
+        del self._row_nums[first : last + 1]
 
     def recalc_totals(self):
         """
-        Recalculate and update the total quantity and total amount labels.
+        Schedule a total-label refresh; a burst of edits or scans collapses
+        into a single update once input goes quiet.
         """
-        t_qty = 0.0
-        t_amt = 0.0
-        for r in range(self.grid.rowCount()):
-            q, a = self.grid.item(r, 2), self.grid.item(r, 7)
-            try:
-                t_qty += float(q.text())
-            except Exception:
-                pass
-            try:
-                t_amt += float(a.text())
-            except Exception:
-                pass
-        rounded_total = round(t_amt)
+        self._totals_debounce.trigger()
+
+    def _refresh_total_label(self):
+        """
+        Update the total amount label from the cached per-row amounts.
+        """
+        rounded_total = round(math.fsum(self._row_amounts))
         self.lbl_total_amt.setText(
             f"Total: {self.currency_symbol} {self._fmt(rounded_total)}"
         )
@@ -4263,9 +5500,7 @@ class MainWindow(QMainWindow):
         """
         self.current_sale_id = None
         self.bill_no_label.setText("Bill No: <New>")
-        self.bill_no_label.setObjectName("")
-        self.bill_no_label.style().unpolish(self.bill_no_label)
-        self.bill_no_label.style().polish(self.bill_no_label)
+        self._set_bill_label_name("")
         self.selected_customer_data = None
         self.cust_name_label.setText("Name: <Cash>")
         self.cust_mobile_label.setText("Mob: -")
@@ -4275,58 +5510,74 @@ class MainWindow(QMainWindow):
         self.grid.setFocus()
         self.grid.setCurrentCell(0, 0)
 
+    def _print_translated(self, items, lang_id, total, sale_id, cust_info):
+        """
+        Translate receipt lines on the DB executor and print once they
+        arrive, so the cashier can start the next bill meanwhile. A failed
+        lookup prints the untranslated names.
+        """
+
+        def _print(print_items):
+            self.printer.print_receipt(
+                print_items, total, sale_id, customer_info=cust_info
+            )
+
+        if not lang_id:
+            _print(items)
+            return
+        run_db_async(
+            self.db,
+            _print,
+            self.db.get_translated_items,
+            items,
+            lang_id,
+            on_error=lambda _exc: _print(items),
+        )
+
+    def _set_bill_label_name(self, name):
+        """
+        Switch the bill-number label's style selector, re-polishing only when
+        it actually changes between new-bill and edit mode.
+        """
+        label = self.bill_no_label
+        if label.objectName() != name:
+            label.setObjectName(name)
+            label.style().unpolish(label)
+            label.style().polish(label)
+
+    def _language_dialog(self):
+        if self._lang_dlg is None:
+            self._lang_dlg = LanguageSelectionDialog(self.db, self)
+            return self._lang_dlg
+        return self._lang_dlg.reuse()
+
     def process_checkout(self):
         """
         Validate all items in the grid, calculate final total, and save the sale.
         """
-        items, total = [], 0.0
-        for r in range(self.grid.rowCount()):
-            name_it = self.grid.item(r, 1)
-            if not name_it or not name_it.data(Qt.UserRole):
-                continue
-            try:
-                qty, rate, disc = (
-                    float(self.grid.item(r, 2).text()),
-                    float(self.grid.item(r, 5).text()),
-                    float(self.grid.item(r, 6).text()),
+        items, amounts = [], []
+        for prod, qty, rate, disc, mrp, uom, factor in self._bill_rows():
+            eff_p = rate * (1 - disc / 100)
+            calc_rate = eff_p
+            if _is_gram(uom):
+                calc_rate /= 1000.0
+            if qty > 0:
+                items.append(
+                    {
+                        "id": prod[0],
+                        "name": prod[1],
+                        "barcode": prod[2],
+                        "price": eff_p,
+                        "mrp": mrp,
+                        "quantity": qty,
+                        "uom": uom,
+                        "factor": factor,
+                    }
                 )
-                mrp = 0.0
-                mrp_combo = self.grid.cellWidget(r, 4)
-                if mrp_combo:
-                    mrp = float(mrp_combo.currentText())
-
-                uom = ""
-                factor = 1.0
-                uom_combo = self.grid.cellWidget(r, 3)
-                if uom_combo:
-                    uom = uom_combo.currentText()
-                    uom_data = uom_combo.currentData()
-                    if uom_data:
-                        factor = float(uom_data.get("factor", 1.0))
-
-                eff_p = rate * (1 - disc / 100)
-                calc_rate = eff_p
-                if uom and uom.lower() in ("g", "gram", "grams"):
-                    calc_rate /= 1000.0
-                if qty > 0:
-                    items.append(
-                        {
-                            "id": name_it.data(Qt.UserRole)[0],
-                            "name": name_it.data(Qt.UserRole)[1],
-                            "barcode": name_it.data(Qt.UserRole)[2],
-                            "price": eff_p,
-                            "mrp": mrp,
-                            "quantity": qty,
-                            "uom": uom,
-                            "factor": factor,
-                        }
-                    )
-                    total += qty * calc_rate
-            except Exception:
-                continue
+                amounts.append(qty * calc_rate)
         if not items:
             return
-        total = float(round(total))
+        total = float(round(math.fsum(amounts)))
         cid = self.selected_customer_data[0] if self.selected_customer_data else None
         msg = f"{'Update' if self.current_sale_id else 'Save'} Bill Rs. {self._fmt(total)}?"
         if (
@@ -4350,20 +5601,17 @@ class MainWindow(QMainWindow):
                     )
                     == QMessageBox.Yes
                 ):
-                    langs = self.db.get_languages()
+                    langs = self.db.get_languages_cached()
                     selected_lang_id = None
                     should_print = True
                     if langs:
-                        lang_dlg = LanguageSelectionDialog(self.db, self)
+                        lang_dlg = self._language_dialog()
                         if lang_dlg.exec() == QDialog.Accepted:
                             selected_lang_id = lang_dlg.selected_lang_id
                         else:
                             should_print = False
 
                     if should_print:
-                        print_items = self.db.get_translated_items(
-                            items, selected_lang_id
-                        )
                         cust_info = None
                         if self.selected_customer_data:
                             cust_info = {
@@ -4371,25 +5619,28 @@ class MainWindow(QMainWindow):
                                 "mobile": self.selected_customer_data[2],
                                 "address": self.selected_customer_data[3],
                             }
-                        if not os.path.exists(self.printer.config_path):
+                        if not self.printer.configured:
+                            from printer_config_dialog import PrinterConfigDialog
+
                             if (
                                 PrinterConfigDialog(self.printer, self).exec()
                                 != QDialog.Accepted
                             ):
                                 should_print = False
                         if should_print:
-                            self.printer.print_receipt(
-                                print_items,
+                            self._print_translated(
+                                items,
+                                selected_lang_id,
                                 total,
                                 self.current_sale_id or res,
-                                customer_info=cust_info,
+                                cust_info,
                             )
                 bill_no = self.current_sale_id or res
                 self.reset_grid()
                 QMessageBox.information(
                     self, "Success", f"Voucher #{bill_no} Saved Successfully."
                 )
-        self.showFullScreen()
+        self._ensure_fullscreen()
         self.grid.setFocus()
 
 
@@ -4399,6 +5650,9 @@ def main():
     """
     app = QApplication(sys.argv)
     app.setFont(QFont("FiraCode Nerd Font", 10))
+    # The theme is only known once the company database is open, so render
+    # every stylesheet while the config/company dialogs are up.
+    threading.Thread(target=styles.prerender_styles, daemon=True).start()
     config_path = os.path.join(get_app_path(), "db.config")
     enc_path = config_path + ".enc"
 
@@ -4457,7 +5711,7 @@ def main():
 
     theme_name = db_manager.get_setting("theme", "mocha")
     app.setProperty("theme_name", theme_name)
-    app.setWindowIcon(QIcon(resource_path(f"svg/logo_{theme_name}.svg")))
+    app.setWindowIcon(_theme_icon(theme_name))
     style = get_style(theme_name)
     app.setStyleSheet(style)
 
@@ -4469,8 +5723,12 @@ def main():
     app.aboutToQuit.connect(db_manager.close)
     login_dlg = LoginDialog(db_manager)
     if login_dlg.exec() == QDialog.Accepted:
+        from printer import ReceiptPrinter
+
         printer = ReceiptPrinter()
-        if not os.path.exists(printer.config_path):
+        if not printer.configured:
+            from printer_config_dialog import PrinterConfigDialog
+
             PrinterConfigDialog(printer, hide_cancel=True).exec()
         window = MainWindow(db_manager, login_dlg.user)
         window.setWindowTitle(f"elytPOS - {selected_db_name} - {login_dlg.user[2]}")
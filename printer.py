@@ -120,7 +120,10 @@ class ReceiptPrinter:
         return os.path.join(application_path, "printer_config.json")
 
     def load_config(self):
-        if os.path.exists(self.config_path):
+        # Remembered so checkout can skip a stat() per print; saving a
+        # config flips it on.
+        self.configured = os.path.exists(self.config_path)
+        if self.configured:
             try:
                 with open(self.config_path, "r") as f:
                     saved_data = json.load(f)
@@ -154,6 +157,7 @@ class ReceiptPrinter:
         try:
             with open(self.config_path, "w") as f:
                 json.dump(full_data, f, indent=4)
+            self.configured = True
             self.full_config = full_data
             self.config = self.get_active_config()
             return True
@@ -250,9 +254,9 @@ class ReceiptPrinter:
         return list(self.printers.keys())
 
     def _fmt(self, val):
-        if float(val) == int(float(val)):
-            return str(int(float(val)))
-        return f"{float(val):.2f}"
+        f = float(val)
+        i = int(f)
+        return str(i) if f == i else f"{f:.2f}"
 
     def print_receipt(
         self,
@@ -291,7 +291,29 @@ THEMES = {
 }
 
 
+_STYLE_CACHE = {}
+
+
 def get_style(theme_name="mocha"):
+    """
+    Return the QSS stylesheet for the given theme, rendered once per theme.
+    """
+    style = _STYLE_CACHE.get(theme_name)
+    if style is None:
+        style = _STYLE_CACHE.setdefault(theme_name, _build_style(theme_name))
+    return style
+
+
+def prerender_styles():
+    """
+    Render every theme's stylesheet into the cache. Safe to run on a worker
+    thread: it only builds strings.
+    """
+    for theme_name in THEMES:
+        get_style(theme_name)
+
+
+def _build_style(theme_name):
     """
     Generate QSS stylesheet for the given theme.
     """